@@ -0,0 +1,96 @@
+"""Benchmark executor backends on a CPU-bound component.
+
+Usage:
+    python benchmarks/bench_executor_backends.py [--requests N] [--work N] [--workers N]
+
+Runs the same batch of concurrent requests on the thread and process backends
+and reports requests per second. Thread throughput is bounded by the GIL; process
+throughput should grow roughly linearly with the number of workers (up to the
+number of cores).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx import Component, Data, IntInput, Output  # noqa: E402
+
+MODULE = Path(__file__).stem
+
+
+class BusyLoopComponent(Component):
+    """Component that spends its time in pure-Python arithmetic."""
+
+    name: str = "BusyLoop"
+    inputs: list = [IntInput(name="work", display_name="Work", value=200_000)]
+    outputs: list = [Output(display_name="Sum", name="total", type_=Data, method="total")]
+
+    def total(self) -> Data:
+        """Sum of squares below ``work``."""
+        return Data(data={"total": sum(i * i for i in range(int(self.work)))})
+
+
+def busy_request(work: int):
+    """Build an execution request for BusyLoopComponent."""
+    from math_executor.api import ExecutionRequest
+
+    return ExecutionRequest(
+        component_state={
+            "component_class": "BusyLoopComponent",
+            "component_module": MODULE,
+            "parameters": {"work": work},
+        },
+        method_name="total",
+    )
+
+
+async def measure(backend: str, requests: int, work: int) -> None:
+    """Run ``requests`` concurrent requests on ``backend`` and print requests per second."""
+    from math_executor import api
+
+    api.component_backends[MODULE] = backend
+    start = time.perf_counter()
+    # The executor logs every request to stdout - keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = await asyncio.gather(
+            *(api.run_execution(busy_request(work), BusyLoopComponent) for _ in range(requests))
+        )
+    elapsed = time.perf_counter() - start
+    assert all(response.success for response, _ in results)
+    print(f"{backend:<10} {requests / elapsed:>10,.1f} requests/s")
+
+
+async def run(args: argparse.Namespace) -> None:
+    from math_executor import api
+    from math_executor.backends import ProcessPoolBackend
+
+    api.process_backend = ProcessPoolBackend(max_workers=args.workers, modules=[MODULE])
+    api.process_backend.start()
+    print(f"{api.process_backend.max_workers} workers, {os.cpu_count()} cores")
+    try:
+        await measure("thread", args.requests, args.work)
+        await measure("process", args.requests, args.work)
+    finally:
+        api.process_backend.stop()
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--work", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=None)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
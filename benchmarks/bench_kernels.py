@@ -0,0 +1,82 @@
+"""Benchmark the throughput of the dfx.math element-wise kernels.
+
+Usage:
+    python benchmarks/bench_kernels.py [--sizes 1,1000,1000000] [--ops add,divide] [--pure-python]
+
+For each kernel and array size, reports the elements processed per second
+(array operand combined with an array of the same size, or with a scalar for
+unary kernels and clip bounds), plus the calls per second of the scalar fast
+path. ``--pure-python`` measures the fallback used when NumPy is not installed.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math import kernels  # noqa: E402
+
+# Kernel name -> number of operands
+OPS = {
+    "add": 2,
+    "subtract": 2,
+    "multiply": 2,
+    "divide": 2,
+    "power": 2,
+    "mod": 2,
+    "minimum": 2,
+    "maximum": 2,
+    "absolute": 1,
+    "clip": 3,
+}
+
+
+def operands(op: str, size: int) -> tuple:
+    """Return operands of ``size`` elements (kept positive so power stays real)."""
+    values = kernels.as_array([random.uniform(0.5, 2.0) for _ in range(size)])
+    others = kernels.as_array([random.uniform(0.5, 2.0) for _ in range(size)])
+    if op == "clip":
+        return (values, 0.75, 1.5)
+    return (values, others)[: OPS[op]]
+
+
+def measure(label: str, func, args: tuple, elements: int, min_time: float) -> None:
+    """Call ``func(*args)`` repeatedly for at least ``min_time`` seconds and print throughput."""
+    func(*args)
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func(*args)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    rate = calls / elapsed
+    print(f"{label:<24} {rate:>14,.0f} calls/s {rate * elements:>16,.0f} elements/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,1000,100000,1000000")
+    parser.add_argument("--ops", default=",".join(OPS))
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per measurement")
+    parser.add_argument("--pure-python", action="store_true", help="Disable NumPy")
+    args = parser.parse_args()
+
+    if args.pure_python:
+        kernels.np = None
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"NumPy: {'no' if kernels.np is None else kernels.np.__version__}")
+
+    for op in args.ops.split(","):
+        func = getattr(kernels, op)
+        measure(f"{op} scalar", func, (1.5, 0.75, 1.25)[: OPS[op]], 1, args.min_time)
+        for size in sizes:
+            measure(f"{op} n={size:,}", func, operands(op, size), size, args.min_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark the GFLOP/s of the dfx.math linear-algebra kernels.
+
+Usage:
+    python benchmarks/bench_linalg.py [--sizes 64,256,1024] [--batch 10000] [--threads N]
+                                      [--pure-python]
+
+Reports GFLOP/s of matmul (2n^3 flops), matvec (2n^2) and solve (2n^3/3 + 2n^2)
+for square matrices of each size, and of matmul and solve over a stack of
+``--batch`` small matrices in one call. ``--threads`` is passed to
+``linalg.set_num_threads``; ``--pure-python`` measures the fallback used when
+NumPy is not installed (use small sizes).
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math import linalg  # noqa: E402
+
+
+def matrix(rows: int, columns: int, stack: int | None = None):
+    """Return a random, well-conditioned matrix (or stack of matrices) as lists."""
+    if stack is not None:
+        return [matrix(rows, columns) for _ in range(stack)]
+    return [
+        [random.random() + (rows if i == j else 0.0) for j in range(columns)]
+        for i in range(rows)
+    ]
+
+
+def operand(value):
+    """Convert operands to the kernel's native type up front, outside the timings."""
+    return value if linalg.np is None else linalg.np.asarray(value, dtype=float)
+
+
+def measure(label: str, func, args: tuple, flops: float, min_time: float) -> None:
+    """Call ``func(*args)`` repeatedly for at least ``min_time`` seconds and print GFLOP/s."""
+    func(*args)
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func(*args)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    seconds = elapsed / calls
+    print(f"{label:<28} {seconds * 1e3:>12.3f} ms {flops / seconds / 1e9:>10.2f} GFLOP/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="64,128,256,512,1024")
+    parser.add_argument("--batch", type=int, default=10_000, help="Matrices in a stack")
+    parser.add_argument("--small", default="4,8", help="Sizes of the stacked matrices")
+    parser.add_argument("--threads", type=int, default=linalg.get_num_threads())
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per measurement")
+    parser.add_argument("--pure-python", action="store_true", help="Disable NumPy")
+    args = parser.parse_args()
+
+    if args.pure_python:
+        linalg.np = None
+    linalg.set_num_threads(args.threads)
+    numpy_version = "no" if linalg.np is None else linalg.np.__version__
+    print(f"NumPy: {numpy_version}, threads: {args.threads}")
+
+    for n in (int(size) for size in args.sizes.split(",")):
+        a, b = operand(matrix(n, n)), operand(matrix(n, n))
+        x = operand([random.random() for _ in range(n)])
+        measure(f"matmul {n}x{n}", linalg.matmul, (a, b), 2.0 * n**3, args.min_time)
+        measure(f"matvec {n}x{n}", linalg.matvec, (a, x), 2.0 * n**2, args.min_time)
+        solve_flops = 2.0 * n**3 / 3 + 2.0 * n**2
+        measure(f"solve {n}x{n}", linalg.solve, (a, x), solve_flops, args.min_time)
+
+    for n in (int(size) for size in args.small.split(",")):
+        a, b = operand(matrix(n, n, args.batch)), operand(matrix(n, n, args.batch))
+        label = f"{args.batch} x {n}x{n}"
+        flops = args.batch * 2.0 * n**3
+        measure(f"matmul {label}", linalg.matmul, (a, b), flops, args.min_time)
+        solve_flops = args.batch * (2.0 * n**3 / 3 + 2.0 * n**3)
+        measure(f"solve {label}", linalg.solve, (a, b), solve_flops, args.min_time)
+
+
+if __name__ == "__main__":
+    main()
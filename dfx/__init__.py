@@ -1,9 +1,22 @@
 """Droqflow Executor (dfx) - Standalone framework for non-Langflow components."""
 
-from dfx.component import Component
+from dfx.chunked import ChunkedResult, iter_chunks, run_chunked
+from dfx.component import Component, ExecutionCancelledError
 from dfx.data import Data
-from dfx.inputs import FloatInput, IntInput, StrInput
+from dfx.inputs import DataInput, FloatInput, IntInput, StrInput
 from dfx.outputs import Output
 
-__all__ = ["Component", "Data", "FloatInput", "IntInput", "StrInput", "Output"]
+__all__ = [
+    "ChunkedResult",
+    "Component",
+    "Data",
+    "DataInput",
+    "ExecutionCancelledError",
+    "FloatInput",
+    "IntInput",
+    "StrInput",
+    "Output",
+    "iter_chunks",
+    "run_chunked",
+]
 
@@ -0,0 +1,254 @@
+"""Out-of-core execution of element-wise component methods in fixed-size chunks.
+
+Operands too large for memory (memory-mapped arrays, or iterators yielding
+array chunks) are fed through a component's chunk method one chunk at a time,
+and each result chunk is written to the output as soon as it is computed, so
+memory use depends on the chunk size and parallelism, not on the operand size.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Elements per chunk (8 MiB of float64)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class ChunkedResult:
+    """Summary of an out-of-core run.
+
+    Attributes:
+        elements: Number of result elements written
+        chunks: Number of chunks processed
+    """
+
+    elements: int
+    chunks: int
+
+
+def run_chunked(
+    component: Any,
+    method_name: str,
+    output: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int = 1,
+) -> ChunkedResult:
+    """Compute an element-wise output method chunk by chunk, writing results to ``output``.
+
+    Array inputs of the component (flat or of one common shape, processed in
+    C order) are sliced into chunks without copying; inputs that are iterators
+    are consumed chunk by chunk as they yield, and array inputs are sliced to
+    match. Scalars and one-element arrays are passed to every chunk as-is.
+
+    Args:
+        component: The component, with its inputs set
+        method_name: Output method listed in the component's ``chunk_methods``
+        output: Where result chunks go: a file path (raw elements are appended),
+            a binary file-like object, a writable buffer holding every element
+            (e.g. a memory-mapped array), or a ``callable(start, chunk)``
+        chunk_size: Elements per chunk for array inputs
+        max_workers: Chunks computed in parallel (NumPy kernels release the GIL);
+            at most twice as many chunks are held in memory
+
+    Returns:
+        The number of elements and chunks written
+
+    Raises:
+        ValueError: If the method has no chunk method, the array inputs differ in
+            size, or the output buffer is too small for the result
+        ExecutionCancelledError: If the component was cancelled between chunks
+    """
+    chunk_method_name = getattr(component, "chunk_methods", {}).get(method_name)
+    if chunk_method_name is None:
+        raise ValueError(f"{type(component).__name__}.{method_name} has no chunk method")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    chunk_method = getattr(component, chunk_method_name)
+    operands = {
+        input_def.name: getattr(component, input_def.name, None) for input_def in component.inputs
+    }
+
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as f:
+            return _run(component, chunk_method, operands, _writer(f), chunk_size, max_workers)
+    return _run(component, chunk_method, operands, _writer(output), chunk_size, max_workers)
+
+
+def iter_chunks(value: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield an array input in flat chunks, or an iterator input's chunks as they come.
+
+    Arrays are flattened in C order and sliced without copying; a scalar is
+    yielded as a single chunk.
+
+    Raises:
+        ValueError: If ``chunk_size`` is not positive
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if _is_stream(value):
+        yield from value
+        return
+    if not _is_array(value):
+        yield [value]
+        return
+    flat = _flatten(value)
+    for start in range(0, len(flat), chunk_size):
+        yield flat[start : start + chunk_size]
+
+
+def _run(
+    component: Any,
+    chunk_method: Callable[..., Any],
+    operands: dict[str, Any],
+    write: Callable[[int, Any], None],
+    chunk_size: int,
+    max_workers: int,
+) -> ChunkedResult:
+    chunks = _chunk_operands(operands, chunk_size)
+    elements = 0
+    count = 0
+    if max_workers <= 1:
+        for start, chunk_operands in chunks:
+            component.raise_if_cancelled()
+            result = chunk_method(**chunk_operands)
+            write(start, result)
+            elements += len(result)
+            count += 1
+        return ChunkedResult(elements=elements, chunks=count)
+
+    # Keep a bounded window of chunks in flight; results are written in order
+    pending: deque[tuple[int, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chunk") as executor:
+        try:
+            for start, chunk_operands in chunks:
+                component.raise_if_cancelled()
+                pending.append((start, executor.submit(chunk_method, **chunk_operands)))
+                if len(pending) >= 2 * max_workers:
+                    elements += _write_next(pending, write)
+                    count += 1
+            while pending:
+                elements += _write_next(pending, write)
+                count += 1
+        finally:
+            for _, future in pending:
+                future.cancel()
+    return ChunkedResult(elements=elements, chunks=count)
+
+
+def _write_next(pending: deque, write: Callable[[int, Any], None]) -> int:
+    start, future = pending.popleft()
+    result = future.result()
+    write(start, result)
+    return len(result)
+
+
+def _chunk_operands(
+    operands: dict[str, Any], chunk_size: int
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (start offset, operands of the chunk) pairs."""
+    streams = {name: value for name, value in operands.items() if _is_stream(value)}
+    arrays = {}
+    size = None
+    for name, value in operands.items():
+        if name in streams or not _is_array(value):
+            continue
+        flat = _flatten(value)
+        if len(flat) == 1:
+            continue
+        if size is not None and len(flat) != size:
+            raise ValueError(
+                f"Array inputs must have the same size for chunked execution, "
+                f"got {size} and {len(flat)}"
+            )
+        arrays[name], size = flat, len(flat)
+    if not streams and size is None:
+        raise ValueError("Chunked execution needs at least one array or streamed input")
+    constants = {
+        name: value
+        for name, value in operands.items()
+        if name not in streams and name not in arrays
+    }
+
+    start = 0
+    if streams:
+        for stream_chunks in zip(*streams.values()):
+            chunk = dict(constants)
+            chunk.update(zip(streams, stream_chunks))
+            length = max(len(value) for value in stream_chunks)
+            for name, flat in arrays.items():
+                chunk[name] = flat[start : start + length]
+            yield start, chunk
+            start += length
+        return
+
+    while start < size:
+        stop = min(start + chunk_size, size)
+        chunk = dict(constants)
+        for name, flat in arrays.items():
+            chunk[name] = flat[start:stop]
+        yield start, chunk
+        start = stop
+
+
+def _writer(output: Any) -> Callable[[int, Any], None]:
+    """Return a ``write(start, chunk)`` function for an output target."""
+    if callable(output):
+        return output
+    if hasattr(output, "write"):
+        return lambda start, chunk: output.write(_as_buffer(chunk))
+
+    target = _flatten(output)
+
+    def write(start: int, chunk: Any) -> None:
+        stop = start + len(chunk)
+        if stop > len(target):
+            raise ValueError(
+                f"Output buffer holds {len(target)} elements, the result needs {stop}"
+            )
+        if isinstance(target, memoryview):
+            target[start:stop] = memoryview(array(target.format, _as_list(chunk)))
+        else:
+            target[start:stop] = chunk
+
+    return write
+
+
+def _is_stream(value: Any) -> bool:
+    return hasattr(value, "__next__")
+
+
+def _is_array(value: Any) -> bool:
+    if np is not None and isinstance(value, np.ndarray):
+        return True
+    return isinstance(value, (list, tuple, array, memoryview))
+
+
+def _flatten(value: Any) -> Any:
+    """Return a flat, sliceable view of an array (without copying contiguous buffers)."""
+    if np is not None and isinstance(value, np.ndarray):
+        return value.reshape(-1)
+    if isinstance(value, (array, memoryview, bytearray)):
+        view = memoryview(value)
+        return view.cast("B").cast(view.format) if view.ndim != 1 else view
+    return value
+
+
+def _as_buffer(chunk: Any) -> Any:
+    if np is not None and isinstance(chunk, np.ndarray):
+        return np.ascontiguousarray(chunk)
+    if isinstance(chunk, (list, tuple)):
+        return array("d", chunk)
+    return chunk
+
+
+def _as_list(chunk: Any) -> Any:
+    return chunk.tolist() if isinstance(chunk, memoryview) else chunk
@@ -1,9 +1,14 @@
 """Base Component class for dfx framework."""
 
+import copy
 import logging
-from typing import Any
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Mapping
 
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import PydanticUndefined
 
 from dfx.inputs import BaseInput
 from dfx.outputs import Output
@@ -11,6 +16,10 @@ from dfx.outputs import Output
 logger = logging.getLogger(__name__)
 
 
+class ExecutionCancelledError(Exception):
+    """Raised by ``Component.raise_if_cancelled`` once the executor cancelled the run."""
+
+
 class Component(BaseModel):
     """Base component class for dfx framework.
     
@@ -21,6 +30,26 @@ class Component(BaseModel):
     - name: Component class name
     - inputs: List of Input objects
     - outputs: List of Output objects
+
+    Components whose methods depend only on their inputs may set ``pure = True``
+    to let the executor reuse results for identical inputs.
+
+    ``incremental_methods`` maps an output method to a method that updates the
+    previous result instead of recomputing it. It is called with the previous
+    parameters, the previous result and the set of parameter names that changed.
+
+    Long-running methods should call ``raise_if_cancelled()`` (or check
+    ``cancelled``) periodically, so the executor can stop them once their
+    request timed out.
+
+    Components may also set ``batch_methods`` to map an output method to a
+    classmethod that takes a list of parameter dicts and returns one result per
+    dict, letting the executor coalesce concurrent calls into a single call.
+
+    ``chunk_methods`` maps an element-wise output method to a method computing
+    the same result for one chunk of the array inputs (passed as keyword
+    arguments), which lets ``dfx.run_chunked`` process operands larger than
+    memory in fixed-size chunks.
     """
 
     model_config = ConfigDict(extra="allow")  # Allow extra fields for dynamic input values
@@ -32,52 +61,63 @@ class Component(BaseModel):
     inputs: list[BaseInput] = []
     outputs: list[Output] = []
 
+    # Output method name -> classmethod computing that method for many parameter sets
+    batch_methods: ClassVar[dict[str, str]] = {}
+
+    # Output method name -> method updating the previous result from the changed inputs
+    incremental_methods: ClassVar[dict[str, str]] = {}
+
+    # Output method name -> method computing that method's result for one chunk of the inputs
+    chunk_methods: ClassVar[dict[str, str]] = {}
+
+    # Whether output methods depend only on the inputs (results may be memoized)
+    pure: ClassVar[bool] = False
+
     # Internal state
     _status: str = ""
     _logs: list[str] = []
+    _config: dict[str, Any] = {}
+    _cancelled: bool = False
 
     def __init__(self, **kwargs):
-        """Initialize component with parameters."""
+        """Initialize component with parameters.
+
+        Keyword arguments that are not declared fields (input values, and config
+        values whose keys start with ``_``) are stored as extra fields. Unless a
+        declared field is overridden, construction skips pydantic validation and
+        applies the class's precomputed construction plan instead.
+        """
         # Extract config values (keys starting with _)
         config = {k: v for k, v in kwargs.items() if k.startswith("_")}
 
-        # Get class-level inputs/outputs if not provided in kwargs
-        model_kwargs = {}
-        if "inputs" not in kwargs and hasattr(self.__class__, "inputs"):
-            model_kwargs["inputs"] = self.__class__.inputs
-        if "outputs" not in kwargs and hasattr(self.__class__, "outputs"):
-            model_kwargs["outputs"] = self.__class__.outputs
-        if "display_name" not in kwargs and hasattr(self.__class__, "display_name"):
-            model_kwargs["display_name"] = self.__class__.display_name
-        if "description" not in kwargs and hasattr(self.__class__, "description"):
-            model_kwargs["description"] = self.__class__.description
-        if "icon" not in kwargs and hasattr(self.__class__, "icon"):
-            model_kwargs["icon"] = self.__class__.icon
-        if "name" not in kwargs and hasattr(self.__class__, "name"):
-            model_kwargs["name"] = self.__class__.name or self.__class__.__name__
-
-        # Merge with kwargs (this includes input values like number1, number2)
-        # With extra="allow", Pydantic will accept these extra fields
-        model_kwargs.update(kwargs)
+        plan = type(self)._construction_plan()
+        if plan.fast and plan.field_names.isdisjoint(kwargs):
+            extra = dict(kwargs)
+            for input_name, default in plan.input_defaults.items():
+                if extra.get(input_name) is None:
+                    extra[input_name] = default
+
+            values = dict(plan.shared_defaults)
+            for field_name, make_default in plan.default_factories.items():
+                values[field_name] = make_default()
+
+            object.__setattr__(self, "__dict__", values)
+            object.__setattr__(self, "__pydantic_extra__", extra)
+            object.__setattr__(self, "__pydantic_fields_set__", set(extra))
+            object.__setattr__(
+                self,
+                "__pydantic_private__",
+                {"_status": "", "_logs": [], "_config": config, "_cancelled": False},
+            )
+            return
 
         # Initialize base model first (with all kwargs, including extra fields)
-        super().__init__(**model_kwargs)
+        super().__init__(**kwargs)
 
         # Set default input values if not provided
-        for input_def in self.inputs:
-            input_name = input_def.name
-            if not hasattr(self, input_name) or getattr(self, input_name, None) is None:
-                if hasattr(input_def, "value") and input_def.value is not None:
-                    setattr(self, input_name, input_def.value)
-                else:
-                    # Set default based on type
-                    if hasattr(input_def, "field_type"):
-                        if input_def.field_type == "float":
-                            setattr(self, input_name, 0.0)
-                        elif input_def.field_type == "int":
-                            setattr(self, input_name, 0)
-                        else:
-                            setattr(self, input_name, "")
+        for input_name, default in plan.input_defaults.items():
+            if getattr(self, input_name, None) is None:
+                setattr(self, input_name, default)
 
         # Store config
         self._config = config
@@ -86,6 +126,15 @@ class Component(BaseModel):
         self._status = ""
         self._logs = []
 
+    @classmethod
+    def _construction_plan(cls) -> "_ConstructionPlan":
+        """Return the class's construction plan, building it on first use."""
+        plan = cls.__dict__.get("__dfx_construction_plan__")
+        if plan is None:
+            plan = _ConstructionPlan.build(cls)
+            type.__setattr__(cls, "__dfx_construction_plan__", plan)
+        return plan
+
     @property
     def status(self) -> str:
         """Get component status."""
@@ -96,6 +145,24 @@ class Component(BaseModel):
         """Set component status."""
         self._status = str(value)
 
+    @property
+    def cancelled(self) -> bool:
+        """Whether the executor asked this run to stop."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Ask a running method to stop (called by the executor, e.g. on timeout)."""
+        self._cancelled = True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise ExecutionCancelledError if the executor asked this run to stop.
+
+        Raises:
+            ExecutionCancelledError: If ``cancel()`` was called
+        """
+        if self._cancelled:
+            raise ExecutionCancelledError(f"{self.__class__.__name__} execution was cancelled")
+
     def log(self, message: str) -> None:
         """Log a message."""
         log_msg = f"[{self.__class__.__name__}] {message}"
@@ -112,3 +179,83 @@ class Component(BaseModel):
             return getattr(self, self.outputs[0].method, None)
         return None
 
+
+def _input_default(input_def: BaseInput) -> Any:
+    """Value an input takes when it is not provided or provided as None."""
+    if input_def.value is not None:
+        return input_def.value
+    if input_def.field_type == "float":
+        return 0.0
+    if input_def.field_type == "int":
+        return 0
+    if input_def.field_type == "data":
+        return None
+    return ""
+
+
+@dataclass(frozen=True)
+class _ConstructionPlan:
+    """Everything ``Component.__init__`` needs that only depends on the class.
+
+    Attributes:
+        field_names: Declared model fields; overriding one takes the validated path
+        shared_defaults: Field defaults shared by all instances. ``inputs`` and
+            ``outputs`` are class metadata and are shared rather than copied.
+        default_factories: Fields whose default must be created per instance
+        input_defaults: Input name -> value used when the input is missing or None
+        fast: Whether unvalidated construction is equivalent to validation
+            (False when the class adds validators or its own ``model_post_init``)
+    """
+
+    field_names: frozenset[str]
+    shared_defaults: Mapping[str, Any]
+    default_factories: Mapping[str, Callable[[], Any]]
+    input_defaults: Mapping[str, Any]
+    fast: bool
+
+    @classmethod
+    def build(cls, component_class: type[Component]) -> "_ConstructionPlan":
+        """Compute the plan for ``component_class``."""
+        fields = component_class.model_fields
+        shared_defaults: dict[str, Any] = {}
+        default_factories: dict[str, Callable[[], Any]] = {}
+        fast = True
+        for field_name, field in fields.items():
+            if field.default_factory is not None:
+                default_factories[field_name] = field.default_factory
+            elif field.default is PydanticUndefined:
+                fast = False
+            elif field_name in ("inputs", "outputs") or isinstance(
+                field.default, (str, int, float, bool, type(None))
+            ):
+                shared_defaults[field_name] = field.default
+            else:
+                default_factories[field_name] = partial(copy.deepcopy, field.default)
+
+        input_defaults: dict[str, Any] = {}
+        for input_def in fields["inputs"].default or ():
+            if input_def.name in fields or hasattr(component_class, input_def.name):
+                # Collides with a field or attribute, leave it to the validated path
+                fast = False
+            input_defaults[input_def.name] = _input_default(input_def)
+
+        decorators = component_class.__pydantic_decorators__
+        if (
+            decorators.validators
+            or decorators.field_validators
+            or decorators.root_validators
+            or decorators.model_validators
+            or component_class.model_config.get("validate_default")
+            or component_class.model_post_init.__name__ != "init_private_attributes"
+            or set(component_class.__private_attributes__)
+            != {"_status", "_logs", "_config", "_cancelled"}
+        ):
+            fast = False
+
+        return cls(
+            field_names=frozenset(fields),
+            shared_defaults=MappingProxyType(shared_defaults),
+            default_factories=MappingProxyType(default_factories),
+            input_defaults=MappingProxyType(input_defaults),
+            fast=fast,
+        )
@@ -70,3 +70,9 @@ class StrInput(BaseInput):
             return ""
         return str(v)
 
+
+
+class DataInput(BaseInput):
+    """Structured input field (lists, dicts or arrays passed through unchanged)."""
+
+    field_type: str = "data"
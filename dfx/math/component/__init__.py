@@ -1,6 +1,39 @@
 """Math component implementations."""
 
+from .absolute import DFXAbsoluteComponent
+from .add import DFXAddComponent
+from .clip import DFXClipComponent
+from .divide import DFXDivideComponent
+from .histogram import DFXHistogramComponent
+from .matmul import DFXMatMulComponent
+from .matvec import DFXMatVecComponent
+from .maximum import DFXMaximumComponent
+from .minimum import DFXMinimumComponent
+from .modulo import DFXModuloComponent
 from .multiply import DFXMultiplyComponent
+from .power import DFXPowerComponent
+from .quantiles import DFXQuantilesComponent
+from .solve import DFXSolveComponent
+from .statistics import DFXStatisticsComponent
+from .subtract import DFXSubtractComponent
+from .transpose import DFXTransposeComponent
 
-__all__ = ["DFXMultiplyComponent"]
-
+__all__ = [
+    "DFXAbsoluteComponent",
+    "DFXAddComponent",
+    "DFXClipComponent",
+    "DFXDivideComponent",
+    "DFXHistogramComponent",
+    "DFXMatMulComponent",
+    "DFXMatVecComponent",
+    "DFXMaximumComponent",
+    "DFXMinimumComponent",
+    "DFXModuloComponent",
+    "DFXMultiplyComponent",
+    "DFXPowerComponent",
+    "DFXQuantilesComponent",
+    "DFXSolveComponent",
+    "DFXStatisticsComponent",
+    "DFXSubtractComponent",
+    "DFXTransposeComponent",
+]
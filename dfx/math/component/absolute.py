@@ -0,0 +1,31 @@
+"""Absolute component that returns the absolute value of a number."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXAbsoluteComponent(ElementwiseComponent):
+    """Component that returns the absolute value of a number.
+
+    Returns the absolute value. The number may also be a list or numeric buffer,
+    in which case the result is computed element-wise and returned as a compact
+    numeric array.
+    """
+
+    display_name: str = "DFX Absolute"
+    description: str = "Return the absolute value of a number."
+    name: str = "DFXAbsolute"
+
+    inputs: list = [
+        FloatInput(
+            name="number",
+            display_name="Number",
+            info="The number whose absolute value to return.",
+            value=0.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "absolute"
+    operation: ClassVar[str] = "absolute"
@@ -0,0 +1,37 @@
+"""Add component that adds two numbers."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXAddComponent(ElementwiseComponent):
+    """Component that adds two numbers.
+
+    Returns the sum. Either number may also be a list or numeric buffer, in
+    which case the result is computed element-wise with NumPy-style broadcasting
+    and returned as a compact numeric array.
+    """
+
+    display_name: str = "DFX Add"
+    description: str = "Add two numbers and return the sum."
+    name: str = "DFXAdd"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="First Number",
+            info="The first number to add.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Second Number",
+            info="The second number to add.",
+            value=0.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "add"
+    operation: ClassVar[str] = "add"
@@ -0,0 +1,44 @@
+"""Clip component that limits a number to a range."""
+
+from typing import ClassVar
+
+from dfx import DataInput, FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXClipComponent(ElementwiseComponent):
+    """Component that limits a number to a range.
+
+    Returns the clipped value (the upper bound wins if the bounds cross). A
+    bound left unset leaves that side unbounded and is not echoed in the
+    result. Any operand may also be a list or numeric buffer, in which case the
+    result is computed element-wise with NumPy-style broadcasting and returned
+    as a compact numeric array.
+    """
+
+    display_name: str = "DFX Clip"
+    description: str = "Limit a number to the range between a lower and an upper bound."
+    name: str = "DFXClip"
+
+    inputs: list = [
+        FloatInput(
+            name="number",
+            display_name="Number",
+            info="The number to clip.",
+            value=0.0,
+        ),
+        DataInput(
+            name="minimum",
+            display_name="Lower Bound",
+            info="The smallest value allowed (unbounded by default).",
+        ),
+        DataInput(
+            name="maximum",
+            display_name="Upper Bound",
+            info="The largest value allowed (unbounded by default).",
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "clip"
+    operation: ClassVar[str] = "clip"
+    unset_values: ClassVar[dict[str, float]] = {"minimum": float("-inf"), "maximum": float("inf")}
@@ -0,0 +1,38 @@
+"""Divide component that divides the first number by the second."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXDivideComponent(ElementwiseComponent):
+    """Component that divides the first number by the second.
+
+    Returns the quotient (division by zero gives infinity or NaN). Either number
+    may also be a list or numeric buffer, in which case the result is computed
+    element-wise with NumPy-style broadcasting and returned as a compact numeric
+    array.
+    """
+
+    display_name: str = "DFX Divide"
+    description: str = "Divide the first number by the second and return the quotient."
+    name: str = "DFXDivide"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="Dividend",
+            info="The number to divide.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Divisor",
+            info="The number to divide by.",
+            value=1.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "divide"
+    operation: ClassVar[str] = "divide"
@@ -0,0 +1,174 @@
+"""Base class of the element-wise math components."""
+
+import math
+from typing import Any, ClassVar
+
+from dfx import Component, Data, Output
+from dfx.math import kernels
+
+
+class ElementwiseComponent(Component):
+    """Component applying one element-wise kernel from ``dfx.math.kernels``.
+
+    Subclasses declare their operands as ``inputs`` (in the kernel's argument
+    order) and name the kernel in ``kernel_name``. Scalar operands take the
+    scalar fast path and return the operands with the result; if any operand
+    is a list or numeric buffer, the kernel runs once over all elements with
+    NumPy-style broadcasting and returns a compact numeric array with its
+    shape and element count. Requests of
+    scalar operands are batched and array operands can run out of core.
+    """
+
+    icon: str = "calculator"
+
+    outputs: list = [
+        Output(
+            display_name="Result",
+            name="result",
+            type_=Data,
+            method="compute",
+        ),
+    ]
+
+    batch_methods: ClassVar[dict[str, str]] = {"compute": "compute_batch"}
+    chunk_methods: ClassVar[dict[str, str]] = {"compute": "compute_chunk"}
+    pure: ClassVar[bool] = True
+
+    # Name of the kernel function in dfx.math.kernels
+    kernel_name: ClassVar[str] = ""
+    # Operation name reported in the result
+    operation: ClassVar[str] = ""
+    # Value standing in for an operand left unset (None); unset operands aren't echoed
+    unset_values: ClassVar[dict[str, float]] = {}
+
+    def compute(self) -> Data:
+        """Apply the kernel to the input values.
+
+        Returns:
+            Data: Contains the result, or an error message if an operand is invalid
+        """
+        operands = {
+            input_def.name: getattr(self, input_def.name, None) for input_def in self.inputs
+        }
+        if any(kernels.is_array(value) for value in operands.values()):
+            return self._compute_arrays(operands)
+
+        try:
+            values = {name: self._operand(name, value) for name, value in operands.items()}
+            result = self._kernel()(*values.values())
+        except (ValueError, TypeError) as e:
+            return self._error(f"Error computing {self.operation}: {e}", operands)
+
+        self.status = f"{self.operation}({', '.join(map(str, values.values()))}) = {result}"
+        echoed = {name: values[name] for name in values if not self._is_unset(name, operands[name])}
+        return Data(data={"result": result, **echoed, "operation": self.operation})
+
+    def _compute_arrays(self, operands: dict[str, Any]) -> Data:
+        """Apply the kernel element-wise when at least one operand is an array."""
+        try:
+            result = self._kernel()(
+                *(self._fill(name, value) for name, value in operands.items())
+            )
+        except (ValueError, TypeError) as e:
+            return self._error(f"Error computing {self.operation} of arrays: {e}")
+
+        result_shape = kernels.shape(result)
+        length = math.prod(result_shape)
+        self.status = f"Computed {self.operation} of {length} elements"
+        return Data(
+            data={
+                "result": result,
+                "length": length,
+                "shape": result_shape,
+                "operation": self.operation,
+            }
+        )
+
+    @classmethod
+    def compute_batch(cls, parameter_sets: list[dict[str, Any]]) -> list[Data]:
+        """Compute many scalar requests with one vectorized kernel call.
+
+        Args:
+            parameter_sets: Parameters of each coalesced request
+
+        Returns:
+            list[Data]: One result per parameter set, identical to calling compute()
+        """
+        names = cls._operand_names()
+        defaults = cls._construction_plan().input_defaults
+        raw = [
+            [_value_or(p.get(name), defaults.get(name)) for p in parameter_sets] for name in names
+        ]
+        try:
+            columns = [
+                [cls._operand(name, value) for value in values]
+                for name, values in zip(names, raw)
+            ]
+        except (ValueError, TypeError):
+            # At least one request is invalid - let each one report its own error
+            return [cls(**p).compute() for p in parameter_sets]
+
+        results = kernels.to_list(getattr(kernels, cls.kernel_name)(*columns))
+        return [
+            Data(
+                data={
+                    "result": result,
+                    **{
+                        name: value
+                        for name, value, raw_value in zip(names, values, raw_values)
+                        if not cls._is_unset(name, raw_value)
+                    },
+                    "operation": cls.operation,
+                }
+            )
+            for result, values, raw_values in zip(results, zip(*columns), zip(*raw))
+        ]
+
+    def compute_chunk(self, **operands: Any) -> Any:
+        """Apply the kernel to one chunk of the operands (for out-of-core execution).
+
+        Returns:
+            The chunk's results as a compact numeric array
+        """
+        return self._kernel()(
+            *(self._fill(input_def.name, operands.get(input_def.name)) for input_def in self.inputs)
+        )
+
+    def build(self):
+        """Return the main compute function."""
+        return self.compute
+
+    @classmethod
+    def _operand_names(cls) -> list[str]:
+        return [input_def.name for input_def in cls.model_fields["inputs"].default]
+
+    @classmethod
+    def _is_unset(cls, name: str, value: Any) -> bool:
+        return value is None and name in cls.unset_values
+
+    @classmethod
+    def _fill(cls, name: str, value: Any) -> Any:
+        """Return an array operand as-is, or the stand-in of a missing one."""
+        return cls.unset_values.get(name, 0.0) if value is None else value
+
+    @classmethod
+    def _operand(cls, name: str, value: Any) -> float:
+        return _as_float(cls._fill(name, value))
+
+    def _kernel(self):
+        return getattr(kernels, self.kernel_name)
+
+    def _error(self, error_message: str, operands: dict[str, Any] | None = None) -> Data:
+        self.status = error_message
+        self.log(error_message)
+        return Data(data={"error": error_message, **(operands or {})})
+
+
+def _value_or(value: Any, default: Any) -> Any:
+    """Return ``value``, or the input's default if it is missing (as on construction)."""
+    return default if value is None else value
+
+
+def _as_float(value: Any) -> float:
+    """Convert an input value to float."""
+    return float(value)
@@ -0,0 +1,58 @@
+"""Histogram component counting the values of a series in equal-width bins."""
+
+from typing import Any, ClassVar
+
+from dfx import FloatInput, IntInput
+from dfx.math import reductions
+from dfx.math.component.reduction import PARTIALS_INPUT, VALUES_INPUT, ReductionComponent
+
+
+class DFXHistogramComponent(ReductionComponent):
+    """Component that counts the values of a series in equal-width bins.
+
+    The bins cover a fixed range, so histograms of different parts of a
+    series can be merged; values outside the range are counted separately.
+    """
+
+    display_name: str = "DFX Histogram"
+    description: str = "Count the values of a series in equal-width bins."
+    name: str = "DFXHistogram"
+
+    inputs: list = [
+        VALUES_INPUT,
+        IntInput(
+            name="bins",
+            display_name="Bins",
+            info="The number of bins.",
+            value=10,
+        ),
+        FloatInput(
+            name="minimum",
+            display_name="Lower Edge",
+            info="The lower edge of the first bin.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="maximum",
+            display_name="Upper Edge",
+            info="The upper edge of the last bin (included in it).",
+            value=1.0,
+        ),
+        PARTIALS_INPUT,
+    ]
+
+    accumulator_type: ClassVar[type] = reductions.Histogram
+    operation: ClassVar[str] = "histogram"
+
+    def create_accumulator(self) -> reductions.Histogram:
+        """Return an empty histogram with the requested bins."""
+        return reductions.Histogram(float(self.minimum), float(self.maximum), int(self.bins))
+
+    def summarize(self, accumulator: reductions.Histogram) -> dict[str, Any]:
+        """Return the bin counts, the bin edges and the out-of-range counts."""
+        return {
+            "result": list(accumulator.counts),
+            "edges": accumulator.edges,
+            "underflow": accumulator.underflow,
+            "overflow": accumulator.overflow,
+        }
@@ -0,0 +1,35 @@
+"""Matrix multiply component computing matrix products."""
+
+from typing import ClassVar
+
+from dfx import DataInput
+from dfx.math.component.matrix import MatrixComponent
+
+
+class DFXMatMulComponent(MatrixComponent):
+    """Component that multiplies two matrices.
+
+    Follows NumPy's ``matmul``: the second operand may be a vector, and
+    either operand may be a stack of matrices, giving one product per matrix.
+    Uses BLAS when NumPy is installed.
+    """
+
+    display_name: str = "DFX Matrix Multiply"
+    description: str = "Multiply two matrices (or stacks of matrices)."
+    name: str = "DFXMatMul"
+
+    inputs: list = [
+        DataInput(
+            name="matrix_a",
+            display_name="Matrix A",
+            info="The left matrix, as a list of rows (or a stack of matrices).",
+        ),
+        DataInput(
+            name="matrix_b",
+            display_name="Matrix B",
+            info="The right matrix or vector (or a stack of matrices).",
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "matmul"
+    operation: ClassVar[str] = "matmul"
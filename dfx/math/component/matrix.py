@@ -0,0 +1,69 @@
+"""Base class of the matrix and linear-algebra components."""
+
+from typing import Any, ClassVar
+
+from dfx import Component, Data, Output
+from dfx.math import linalg
+
+
+class MatrixComponent(Component):
+    """Component applying one kernel from ``dfx.math.linalg`` to its matrix inputs.
+
+    Subclasses declare their operands as ``inputs`` (in the kernel's argument
+    order) and name the kernel in ``kernel_name``. Operands may be stacks of
+    small matrices, which are processed in a single call.
+    """
+
+    icon: str = "calculator"
+
+    outputs: list = [
+        Output(
+            display_name="Result",
+            name="result",
+            type_=Data,
+            method="compute",
+        ),
+    ]
+
+    pure: ClassVar[bool] = True
+
+    # Name of the kernel function in dfx.math.linalg
+    kernel_name: ClassVar[str] = ""
+    # Operation name reported in the result
+    operation: ClassVar[str] = ""
+
+    def compute(self) -> Data:
+        """Apply the kernel to the input matrices.
+
+        Returns:
+            Data: Contains the result and its shape, or an error message if the
+            operands are invalid
+        """
+        operands = [getattr(self, input_def.name, None) for input_def in self.inputs]
+        try:
+            if any(_is_blank(operand) for operand in operands):
+                raise ValueError("Every matrix operand must be provided")
+            result = getattr(linalg, self.kernel_name)(*operands)
+        except (ValueError, TypeError) as e:
+            error_message = f"Error computing {self.operation}: {e}"
+            self.status = error_message
+            self.log(error_message)
+            return Data(data={"error": error_message})
+
+        result_shape = list(linalg.shape(result))
+        self.status = f"Computed {self.operation} with shape {result_shape}"
+        return Data(
+            data={
+                "result": result,
+                "shape": result_shape,
+                "operation": self.operation,
+            }
+        )
+
+    def build(self):
+        """Return the main compute function."""
+        return self.compute
+
+
+def _is_blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value)
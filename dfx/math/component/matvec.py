@@ -0,0 +1,33 @@
+"""Matrix-vector component computing matrix-vector products."""
+
+from typing import ClassVar
+
+from dfx import DataInput
+from dfx.math.component.matrix import MatrixComponent
+
+
+class DFXMatVecComponent(MatrixComponent):
+    """Component that multiplies a matrix by a vector.
+
+    A stack of matrices takes a stack of vectors, one per matrix.
+    """
+
+    display_name: str = "DFX Matrix-Vector Product"
+    description: str = "Multiply a matrix by a vector."
+    name: str = "DFXMatVec"
+
+    inputs: list = [
+        DataInput(
+            name="matrix",
+            display_name="Matrix",
+            info="The matrix, as a list of rows (or a stack of matrices).",
+        ),
+        DataInput(
+            name="vector",
+            display_name="Vector",
+            info="The vector (or one vector per matrix of the stack).",
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "matvec"
+    operation: ClassVar[str] = "matvec"
@@ -0,0 +1,37 @@
+"""Minimum component that returns the smaller of two numbers."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXMinimumComponent(ElementwiseComponent):
+    """Component that returns the smaller of two numbers.
+
+    Returns the minimum (NaN if either number is NaN). Either number may also be
+    a list or numeric buffer, in which case the result is computed element-wise
+    with NumPy-style broadcasting and returned as a compact numeric array.
+    """
+
+    display_name: str = "DFX Minimum"
+    description: str = "Return the smaller of two numbers."
+    name: str = "DFXMinimum"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="First Number",
+            info="The first number to compare.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Second Number",
+            info="The second number to compare.",
+            value=0.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "minimum"
+    operation: ClassVar[str] = "minimum"
@@ -0,0 +1,38 @@
+"""Modulo component that returns the remainder of a division."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXModuloComponent(ElementwiseComponent):
+    """Component that returns the remainder of a division.
+
+    Returns the remainder, which has the sign of the divisor (modulo zero gives
+    NaN). Either number may also be a list or numeric buffer, in which case the
+    result is computed element-wise with NumPy-style broadcasting and returned
+    as a compact numeric array.
+    """
+
+    display_name: str = "DFX Modulo"
+    description: str = "Return the remainder of dividing the first number by the second."
+    name: str = "DFXModulo"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="Dividend",
+            info="The number to divide.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Divisor",
+            info="The number to divide by.",
+            value=1.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "mod"
+    operation: ClassVar[str] = "modulo"
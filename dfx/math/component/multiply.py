@@ -1,18 +1,22 @@
 """Simple multiply component that multiplies two numbers."""
 
-from dfx import Component, Data, FloatInput, Output
+from typing import ClassVar
 
+from dfx import Data, FloatInput, Output
+from dfx.math.component.elementwise import ElementwiseComponent
 
-class DFXMultiplyComponent(Component):
+
+class DFXMultiplyComponent(ElementwiseComponent):
     """Component that multiplies two numbers.
-    
+
     This is a simple component that takes two numbers as input
-    and returns their product.
+    and returns their product. Either number may also be a list or numeric
+    buffer, in which case the product is computed element-wise with
+    NumPy-style broadcasting and returned as a compact numeric array.
     """
 
     display_name: str = "DFX Multiply"
     description: str = "Multiply two numbers and return the product."
-    icon: str = "calculator"
     name: str = "DFXMultiply"
 
     inputs: list = [
@@ -39,49 +43,13 @@ class DFXMultiplyComponent(Component):
         ),
     ]
 
-    def multiply(self) -> Data:
-        """Multiply two numbers and return the result.
-        
-        Returns:
-            Data: Contains the product of the two numbers.
-        """
-        try:
-            # Get the input values
-            num1 = float(self.number1) if self.number1 is not None else 0.0
-            num2 = float(self.number2) if self.number2 is not None else 0.0
-
-            # Perform multiplication
-            result = num1 * num2
-
-            # Log the operation
-            self.log(f"Multiplying {num1} × {num2} = {result}")
+    # Existing flows call the output method by its original name
+    batch_methods: ClassVar[dict[str, str]] = {"multiply": "compute_batch"}
+    chunk_methods: ClassVar[dict[str, str]] = {"multiply": "compute_chunk"}
 
-            # Set status
-            self.status = f"{num1} × {num2} = {result}"
-
-            # Return result as Data
-            return Data(
-                data={
-                    "result": result,
-                    "number1": num1,
-                    "number2": num2,
-                    "operation": "multiply",
-                }
-            )
-
-        except (ValueError, TypeError) as e:
-            error_message = f"Error multiplying numbers: {e}"
-            self.status = error_message
-            self.log(error_message)
-            return Data(
-                data={
-                    "error": error_message,
-                    "number1": self.number1,
-                    "number2": self.number2,
-                }
-            )
-
-    def build(self):
-        """Return the main multiply function."""
-        return self.multiply
+    kernel_name: ClassVar[str] = "multiply"
+    operation: ClassVar[str] = "multiply"
 
+    def multiply(self) -> Data:
+        """Multiply the two numbers (see ``compute``)."""
+        return self.compute()
@@ -0,0 +1,38 @@
+"""Power component that raises a base to a power."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXPowerComponent(ElementwiseComponent):
+    """Component that raises a base to a power.
+
+    Returns the power (NaN where it is not a real number). Either number may
+    also be a list or numeric buffer, in which case the result is computed
+    element-wise with NumPy-style broadcasting and returned as a compact numeric
+    array.
+    """
+
+    display_name: str = "DFX Power"
+    description: str = "Raise the first number to the power of the second."
+    name: str = "DFXPower"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="Base",
+            info="The base.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Exponent",
+            info="The exponent.",
+            value=1.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "power"
+    operation: ClassVar[str] = "power"
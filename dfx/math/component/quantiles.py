@@ -0,0 +1,52 @@
+"""Quantiles component estimating quantiles of a series with a DDSketch."""
+
+from typing import Any, ClassVar
+
+from dfx import FloatInput
+from dfx.math import reductions
+from dfx.math.component.reduction import PARTIALS_INPUT, VALUES_INPUT, ReductionComponent
+
+
+class DFXQuantilesComponent(ReductionComponent):
+    """Component that estimates quantiles of a series in one pass.
+
+    Quantiles come from a DDSketch: each is within ``relative_accuracy`` of
+    the exact value (relative to its magnitude), in memory independent of the
+    length of the series. The minimum and maximum are exact.
+    """
+
+    display_name: str = "DFX Quantiles"
+    description: str = "Estimate quantiles (e.g. the median) of a series."
+    name: str = "DFXQuantiles"
+
+    inputs: list = [
+        VALUES_INPUT,
+        FloatInput(
+            name="quantiles",
+            display_name="Quantiles",
+            info="The quantile, or a list of quantiles, to estimate (between 0 and 1).",
+            value=0.5,
+        ),
+        FloatInput(
+            name="relative_accuracy",
+            display_name="Relative Accuracy",
+            info="Maximum relative error of the estimates (between 0 and 1).",
+            value=0.01,
+        ),
+        PARTIALS_INPUT,
+    ]
+
+    accumulator_type: ClassVar[type] = reductions.QuantileSketch
+    operation: ClassVar[str] = "quantiles"
+
+    def create_accumulator(self) -> reductions.QuantileSketch:
+        """Return an empty sketch with the requested accuracy."""
+        return reductions.QuantileSketch(float(self.relative_accuracy))
+
+    def summarize(self, accumulator: reductions.QuantileSketch) -> dict[str, Any]:
+        """Return the estimated quantiles, in the order they were requested."""
+        if isinstance(self.quantiles, (list, tuple)):
+            result: Any = [accumulator.quantile(float(q)) for q in self.quantiles]
+        else:
+            result = accumulator.quantile(float(self.quantiles))
+        return {"result": result, "quantiles": self.quantiles}
@@ -0,0 +1,104 @@
+"""Base class of the reduction and statistics components."""
+
+import math
+from abc import abstractmethod
+from typing import Any, ClassVar
+
+from dfx import Component, Data, DataInput, Output
+from dfx.math import reductions
+
+VALUES_INPUT = DataInput(
+    name="values",
+    display_name="Values",
+    info="The numbers to reduce: a list, numeric buffer or iterator of array chunks.",
+)
+
+PARTIALS_INPUT = DataInput(
+    name="partials",
+    display_name="Partial Aggregates",
+    info="'partial' results of earlier runs (e.g. on other chunks or nodes) to merge in.",
+)
+
+
+class ReductionComponent(Component):
+    """Component reducing its ``values`` in one pass with a mergeable accumulator.
+
+    Values are consumed chunk by chunk (arrays are sliced without copying,
+    iterators are read as they yield), with the chunks spread over threads, so
+    memory use doesn't grow with the input. Every result carries the
+    accumulator's ``partial`` aggregate; passing such partials from runs over
+    other parts of the data as ``partials`` gives the result over all of them.
+
+    Subclasses set ``accumulator_type`` (a class from ``dfx.math.reductions``)
+    and implement the abstract ``create_accumulator()`` and ``summarize()``; an
+    incomplete subclass cannot be instantiated.
+    """
+
+    icon: str = "calculator"
+
+    outputs: list = [
+        Output(
+            display_name="Result",
+            name="result",
+            type_=Data,
+            method="compute",
+        ),
+    ]
+
+    pure: ClassVar[bool] = True
+
+    # Accumulator class whose partial aggregates this component merges
+    accumulator_type: ClassVar[type] = reductions.Moments
+    # Operation name reported in the result
+    operation: ClassVar[str] = ""
+
+    def compute(self) -> Data:
+        """Reduce the values and merge the partial aggregates.
+
+        Returns:
+            Data: Contains the summary, the mergeable ``partial`` aggregate, or an
+            error message if the inputs are invalid
+        """
+        try:
+            if self.values is None or (isinstance(self.values, str) and not self.values):
+                accumulator = self.create_accumulator()
+            else:
+                accumulator = reductions.reduce(
+                    self.create_accumulator, self.values, check=self.raise_if_cancelled
+                )
+            partials = self.partials or []
+            for partial in [partials] if isinstance(partials, dict) else partials:
+                accumulator.merge(self.accumulator_type.from_dict(partial))
+            summary = self.summarize(accumulator)
+        except (ValueError, TypeError) as e:
+            error_message = f"Error computing {self.operation}: {e}"
+            self.status = error_message
+            self.log(error_message)
+            return Data(data={"error": error_message})
+
+        self.status = f"Computed {self.operation} of {accumulator.count} elements"
+        return Data(
+            data={
+                **summary,
+                "count": accumulator.count,
+                "partial": accumulator.to_dict(),
+                "operation": self.operation,
+            }
+        )
+
+    @abstractmethod
+    def create_accumulator(self) -> Any:
+        """Return an empty accumulator configured from the inputs."""
+
+    @abstractmethod
+    def summarize(self, accumulator: Any) -> dict[str, Any]:
+        """Return the result data (including ``result``) of a filled accumulator."""
+
+    def build(self):
+        """Return the main compute function."""
+        return self.compute
+
+
+def nan_if_empty(accumulator: Any, value: float) -> float:
+    """Return ``value``, or nan if the accumulator saw no elements."""
+    return value if accumulator.count else math.nan
@@ -0,0 +1,36 @@
+"""Solve component solving systems of linear equations."""
+
+from typing import ClassVar
+
+from dfx import DataInput
+from dfx.math.component.matrix import MatrixComponent
+
+
+class DFXSolveComponent(MatrixComponent):
+    """Component that solves ``matrix @ x = rhs`` for ``x``.
+
+    Uses LAPACK when NumPy is installed, Gaussian elimination with partial
+    pivoting otherwise. A stack of matrices is solved in one call, with one
+    right-hand side per matrix (a stack shaped like the matrices' columns) or
+    a shared one. Singular matrices are reported as errors.
+    """
+
+    display_name: str = "DFX Solve"
+    description: str = "Solve a system of linear equations."
+    name: str = "DFXSolve"
+
+    inputs: list = [
+        DataInput(
+            name="matrix",
+            display_name="Matrix",
+            info="The square coefficient matrix (or a stack of them).",
+        ),
+        DataInput(
+            name="rhs",
+            display_name="Right-Hand Side",
+            info="The right-hand side vector or matrix.",
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "solve"
+    operation: ClassVar[str] = "solve"
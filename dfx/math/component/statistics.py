@@ -0,0 +1,59 @@
+"""Statistics component computing summary statistics in one pass."""
+
+import math
+from typing import Any, ClassVar
+
+from dfx import IntInput
+from dfx.math import reductions
+from dfx.math.component.reduction import (
+    PARTIALS_INPUT,
+    VALUES_INPUT,
+    ReductionComponent,
+    nan_if_empty,
+)
+
+
+class DFXStatisticsComponent(ReductionComponent):
+    """Component that computes summary statistics of a series in one pass.
+
+    Returns the count, sum, mean, variance, standard deviation, minimum and
+    maximum. The mean and variance are computed with Welford's algorithm in the form of
+    Chan et al. and the sum with Neumaier compensation, so they stay accurate
+    for long series of large, nearly equal values.
+    """
+
+    display_name: str = "DFX Statistics"
+    description: str = "Compute sum, mean, variance, minimum and maximum of a series."
+    name: str = "DFXStatistics"
+
+    inputs: list = [
+        VALUES_INPUT,
+        IntInput(
+            name="ddof",
+            display_name="Delta Degrees of Freedom",
+            info="0 for the population variance, 1 for the sample variance.",
+            value=0,
+        ),
+        PARTIALS_INPUT,
+    ]
+
+    accumulator_type: ClassVar[type] = reductions.Moments
+    operation: ClassVar[str] = "statistics"
+
+    def create_accumulator(self) -> reductions.Moments:
+        """Return an empty moments accumulator."""
+        return reductions.Moments()
+
+    def summarize(self, accumulator: reductions.Moments) -> dict[str, Any]:
+        """Return the statistics of the accumulated series."""
+        variance = accumulator.variance(int(self.ddof))
+        return {
+            "result": {
+                "sum": accumulator.sum,
+                "mean": nan_if_empty(accumulator, accumulator.mean),
+                "variance": variance,
+                "std": math.sqrt(variance) if variance >= 0 else math.nan,
+                "min": nan_if_empty(accumulator, accumulator.min),
+                "max": nan_if_empty(accumulator, accumulator.max),
+            }
+        }
@@ -0,0 +1,37 @@
+"""Subtract component that subtracts the second number from the first."""
+
+from typing import ClassVar
+
+from dfx import FloatInput
+from dfx.math.component.elementwise import ElementwiseComponent
+
+
+class DFXSubtractComponent(ElementwiseComponent):
+    """Component that subtracts the second number from the first.
+
+    Returns the difference. Either number may also be a list or numeric buffer,
+    in which case the result is computed element-wise with NumPy-style
+    broadcasting and returned as a compact numeric array.
+    """
+
+    display_name: str = "DFX Subtract"
+    description: str = "Subtract the second number from the first and return the difference."
+    name: str = "DFXSubtract"
+
+    inputs: list = [
+        FloatInput(
+            name="number1",
+            display_name="First Number",
+            info="The number to subtract from.",
+            value=0.0,
+        ),
+        FloatInput(
+            name="number2",
+            display_name="Second Number",
+            info="The number to subtract.",
+            value=0.0,
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "subtract"
+    operation: ClassVar[str] = "subtract"
@@ -0,0 +1,25 @@
+"""Transpose component swapping the rows and columns of a matrix."""
+
+from typing import ClassVar
+
+from dfx import DataInput
+from dfx.math.component.matrix import MatrixComponent
+
+
+class DFXTransposeComponent(MatrixComponent):
+    """Component that transposes a matrix (or each matrix of a stack)."""
+
+    display_name: str = "DFX Transpose"
+    description: str = "Swap the rows and columns of a matrix."
+    name: str = "DFXTranspose"
+
+    inputs: list = [
+        DataInput(
+            name="matrix",
+            display_name="Matrix",
+            info="The matrix, as a list of rows (or a stack of matrices).",
+        ),
+    ]
+
+    kernel_name: ClassVar[str] = "transpose"
+    operation: ClassVar[str] = "transpose"
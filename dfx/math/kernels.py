@@ -0,0 +1,221 @@
+"""Element-wise numeric kernels shared by the math components.
+
+Operands may be scalars, lists/tuples, ``array.array`` buffers, memoryviews or,
+when NumPy is installed, ``numpy.ndarray``. Array results stay compact: a NumPy
+array when NumPy is available, otherwise an ``array.array("d")``.
+"""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import Any, Callable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+NUMERIC_ARRAY_TYPES: tuple[type, ...] = (array, memoryview)
+if np is not None:
+    NUMERIC_ARRAY_TYPES += (np.ndarray,)
+
+ARRAY_INPUT_TYPES: tuple[type, ...] = (list, tuple) + NUMERIC_ARRAY_TYPES
+
+
+def is_array(value: Any) -> bool:
+    """Return True if ``value`` should be treated as an array operand."""
+    return isinstance(value, ARRAY_INPUT_TYPES)
+
+
+def as_array(value: Any) -> Any:
+    """Convert an array operand to the kernel's native buffer type without copying when possible.
+
+    Raises:
+        ValueError: If the operand is not a flat numeric sequence
+    """
+    if np is not None:
+        try:
+            if isinstance(value, (list, tuple)):
+                return np.asarray(value, dtype=np.float64)
+            # Buffers (array.array, memoryview) are wrapped zero-copy via the buffer protocol
+            return np.asarray(value)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid numeric array: {e}") from e
+
+    if isinstance(value, (array, memoryview)):
+        if isinstance(value, memoryview) and value.ndim != 1:
+            raise ValueError("Only one-dimensional buffers are supported without NumPy")
+        return value
+    try:
+        return array("d", value)
+    except TypeError as e:
+        raise ValueError(f"Invalid numeric array (nested arrays require NumPy): {e}") from e
+
+
+def shape(value: Any) -> list[int]:
+    """Return the shape of an array result."""
+    if np is not None and isinstance(value, np.ndarray):
+        return list(value.shape)
+    return [len(value)]
+
+
+def to_list(value: Any) -> Any:
+    """Convert an array result to a (possibly nested) list of Python numbers."""
+    return value.tolist()
+
+
+def broadcast(op: Callable[..., Any], ufunc_name: str, *operands: Any) -> Any:
+    """Apply an element-wise operation with NumPy-style broadcasting and type promotion.
+
+    This is the single engine behind every kernel in this module. With NumPy,
+    list operands become float64 arrays, buffers keep their element type and
+    the result type follows NumPy's promotion rules (Python int and float
+    scalars don't widen an array's type). Without NumPy, one-dimensional operands of equal length
+    (or of length one) are combined and results are float64. Floating-point
+    exceptions (division by zero, overflow, invalid operations) produce inf or
+    nan on both paths instead of warnings or errors.
+
+    Args:
+        op: Python function applied per element on the fallback path and to scalars
+        ufunc_name: Name of the equivalent NumPy function
+        *operands: Scalar or array operands
+
+    Raises:
+        ValueError: If the operand shapes cannot be broadcast together or the
+            operation is not defined for the operands' element types
+    """
+    flags = [is_array(operand) for operand in operands]
+    if not any(flags):
+        return op(*map(float, operands))
+
+    if np is not None:
+        values = [
+            as_array(operand) if flag else _as_scalar(operand)
+            for operand, flag in zip(operands, flags)
+        ]
+        try:
+            with np.errstate(all="ignore"):
+                return getattr(np, ufunc_name)(*values)
+        except ValueError as e:
+            raise ValueError(f"Cannot apply {ufunc_name} to the operands: {e}") from e
+
+    arrays = [as_array(operand) if flag else None for operand, flag in zip(operands, flags)]
+    lengths = {len(values) for values in arrays if values is not None and len(values) != 1}
+    if len(lengths) > 1:
+        shapes = " ".join(f"({len(values)},)" for values in arrays if values is not None)
+        raise ValueError(f"Operands could not be broadcast together with shapes {shapes}")
+    size = lengths.pop() if lengths else 1
+    columns = [
+        repeat(float(operand), size)
+        if values is None
+        else repeat(values[0], size) if len(values) == 1 else values
+        for operand, values in zip(operands, arrays)
+    ]
+    return array("d", map(op, *columns))
+
+
+def _as_scalar(value: Any) -> Any:
+    """Keep int and float scalars as-is (for NumPy's promotion rules), convert others."""
+    return value if isinstance(value, (int, float)) else float(value)
+
+
+def _true_divide(a: float, b: float) -> float:
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0.0 or a != a:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def _mod(a: float, b: float) -> float:
+    try:
+        return a % b
+    except ZeroDivisionError:
+        return math.nan
+
+
+def _power(a: float, b: float) -> float:
+    try:
+        return math.pow(a, b)
+    except OverflowError:
+        return math.copysign(math.inf, a) if _is_odd_integer(b) else math.inf
+    except ValueError:
+        if a == 0.0 and b < 0.0:
+            return math.copysign(math.inf, a) if _is_odd_integer(b) else math.inf
+        return math.nan
+
+
+def _is_odd_integer(value: float) -> bool:
+    return value.is_integer() and value % 2 == 1
+
+
+def _minimum(a: float, b: float) -> float:
+    if a != a or b != b:
+        return math.nan
+    return a if a <= b else b
+
+
+def _maximum(a: float, b: float) -> float:
+    if a != a or b != b:
+        return math.nan
+    return a if a >= b else b
+
+
+def _clip(value: float, low: float, high: float) -> float:
+    return _minimum(_maximum(value, low), high)
+
+
+def add(a: Any, b: Any) -> Any:
+    """Element-wise sum of two scalar or array operands."""
+    return broadcast(operator.add, "add", a, b)
+
+
+def subtract(a: Any, b: Any) -> Any:
+    """Element-wise difference ``a - b`` of two scalar or array operands."""
+    return broadcast(operator.sub, "subtract", a, b)
+
+
+def multiply(a: Any, b: Any) -> Any:
+    """Element-wise product of two scalar or array operands."""
+    return broadcast(operator.mul, "multiply", a, b)
+
+
+def divide(a: Any, b: Any) -> Any:
+    """Element-wise true quotient ``a / b``; division by zero gives ±inf or nan."""
+    return broadcast(_true_divide, "true_divide", a, b)
+
+
+def power(a: Any, b: Any) -> Any:
+    """Element-wise ``a ** b``; results outside the reals are nan.
+
+    Raises:
+        ValueError: If integer arrays are raised to negative integer powers (NumPy)
+    """
+    return broadcast(_power, "power", a, b)
+
+
+def mod(a: Any, b: Any) -> Any:
+    """Element-wise remainder of ``a / b`` with the sign of ``b``; modulo zero gives nan."""
+    return broadcast(_mod, "mod", a, b)
+
+
+def minimum(a: Any, b: Any) -> Any:
+    """Element-wise minimum of two operands; nan if either element is nan."""
+    return broadcast(_minimum, "minimum", a, b)
+
+
+def maximum(a: Any, b: Any) -> Any:
+    """Element-wise maximum of two operands; nan if either element is nan."""
+    return broadcast(_maximum, "maximum", a, b)
+
+
+def absolute(a: Any) -> Any:
+    """Element-wise absolute value of a scalar or array operand."""
+    return broadcast(abs, "absolute", a)
+
+
+def clip(a: Any, low: Any, high: Any) -> Any:
+    """Limit the elements of ``a`` to ``[low, high]``; the bounds may be arrays too."""
+    return broadcast(_clip, "clip", a, low, high)
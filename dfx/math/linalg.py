@@ -0,0 +1,289 @@
+"""Matrix and linear-algebra kernels shared by the matrix components.
+
+Matrices are nested lists, 2-D buffers or, when NumPy is installed,
+``numpy.ndarray``; a stack of matrices (one more leading dimension) is
+processed in one call. With NumPy, products and solves run in BLAS/LAPACK and
+results are float64 arrays. Without NumPy, matrices are lists of rows of
+floats and products use a cache-blocked pure-Python kernel.
+
+``set_num_threads(n)`` (initially the ``LINALG_THREADS`` environment variable)
+splits large products and stacks of matrices into ``n`` parts computed on as
+many threads (NumPy releases the GIL in BLAS calls). The default of 1 makes a
+single BLAS call, which uses BLAS's own threading (see ``OPENBLAS_NUM_THREADS``
+/ ``OMP_NUM_THREADS``); when splitting, limit BLAS to one thread to avoid
+oversubscribing the cores.
+"""
+
+import operator
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Columns of the right-hand matrix kept hot while sweeping the rows (pure-Python kernel)
+DEFAULT_BLOCK_SIZE = 64
+
+# Products below this many floating-point operations are not split across threads
+PARALLEL_MIN_FLOPS = 1 << 22
+
+# Threads large products and stacks of matrices are split across (see set_num_threads)
+_num_threads = max(int(os.getenv("LINALG_THREADS", "1")), 1)
+
+
+def set_num_threads(threads: int) -> None:
+    """Set the number of threads large products and stacks of matrices are split across.
+
+    Raises:
+        ValueError: If ``threads`` is less than 1
+    """
+    global _num_threads
+    if threads < 1:
+        raise ValueError(f"threads must be positive, got {threads}")
+    _num_threads = threads
+
+
+def get_num_threads() -> int:
+    """Return the number of threads set with ``set_num_threads``."""
+    return _num_threads
+
+
+def shape(value: Any) -> tuple[int, ...]:
+    """Return the shape of a matrix result."""
+    if np is not None and isinstance(value, np.ndarray):
+        return value.shape
+    dims = []
+    while isinstance(value, list):
+        dims.append(len(value))
+        value = value[0] if value else None
+    return tuple(dims)
+
+
+def matmul(a: Any, b: Any, block_size: int = DEFAULT_BLOCK_SIZE) -> Any:
+    """Matrix product ``a @ b`` with NumPy's ``matmul`` semantics.
+
+    ``b`` may be a vector (a matrix-vector product) and either operand may be
+    a stack of matrices, giving a stack of products.
+
+    Args:
+        a: Matrix, stack of matrices or vector
+        b: Matrix, stack of matrices or vector
+        block_size: Column block size of the pure-Python kernel
+
+    Raises:
+        ValueError: If the operands are not numeric or their shapes don't match
+    """
+    if np is not None:
+        left, right = _as_ndarray(a), _as_ndarray(b)
+        flops = 2 * left.size * (right.shape[-1] if right.ndim > 1 else 1)
+        return _call(np.matmul, left, right, split_rows=True, flops=flops)
+
+    left, right = _as_rows(a), _as_rows(b)
+    left_dims, right_dims = len(shape(left)), len(shape(right))
+    if left_dims == 3 or right_dims == 3:
+        return [
+            _matmul_rows(x, y, block_size)
+            for x, y in _pair_stacks(left, right, left_dims, right_dims)
+        ]
+    if left_dims == 1 and right_dims == 1:
+        if len(left) != len(right):
+            raise ValueError(
+                f"Shapes {shape(left)} and {shape(right)} are not aligned for matrix multiplication"
+            )
+        return sum(map(operator.mul, left, right))
+    if left_dims == 1 and right_dims == 2:
+        return _matmul_rows([left], right, block_size)[0]
+    if right_dims == 1:
+        return [row[0] for row in _matmul_rows(left, [[v] for v in right], block_size)]
+    return _matmul_rows(left, right, block_size)
+
+
+def matvec(a: Any, x: Any) -> Any:
+    """Matrix-vector product; a stack of matrices takes one vector per matrix.
+
+    Raises:
+        ValueError: If ``x`` is not a vector (or a stack of vectors for a stack of
+            matrices), or its length doesn't match the matrix
+    """
+    if np is not None:
+        matrix, vector = _as_ndarray(a), _as_ndarray(x)
+        if matrix.ndim < 2 or vector.ndim != matrix.ndim - 1:
+            raise ValueError(
+                f"Expected a matrix and a vector (or stacks of them), "
+                f"got shapes {matrix.shape} and {vector.shape}"
+            )
+        if matrix.ndim == 2:
+            return matmul(matrix, vector)
+        return matmul(matrix, vector[..., np.newaxis])[..., 0]
+
+    matrix, vector = _as_rows(a), _as_rows(x)
+    if len(shape(matrix)) != len(shape(vector)) + 1 or len(shape(matrix)) < 2:
+        raise ValueError(
+            f"Expected a matrix and a vector (or stacks of them), "
+            f"got shapes {shape(matrix)} and {shape(vector)}"
+        )
+    if len(shape(matrix)) == 2:
+        return matmul(matrix, vector)
+    return [matmul(m, v) for m, v in _pair_stacks(matrix, vector, 3, 3)]
+
+
+def transpose(a: Any) -> Any:
+    """Transpose a matrix (or each matrix of a stack); with NumPy this is a view."""
+    if np is not None:
+        matrix = _as_ndarray(a)
+        return matrix if matrix.ndim < 2 else np.swapaxes(matrix, -1, -2)
+    matrix = _as_rows(a)
+    dims = len(shape(matrix))
+    if dims == 3:
+        return [[list(column) for column in zip(*m)] for m in matrix]
+    if dims == 2:
+        return [list(column) for column in zip(*matrix)]
+    return list(matrix)
+
+
+def solve(a: Any, b: Any) -> Any:
+    """Solve ``a @ x = b`` for ``x`` (LAPACK ``gesv``, or Gaussian elimination).
+
+    ``b`` is a vector or a matrix of right-hand sides; a stack of matrices
+    ``a`` is solved with one right-hand side (or a shared one) per matrix.
+
+    Raises:
+        ValueError: If a matrix is singular or not square, or the shapes don't match
+    """
+    if np is not None:
+        matrix, rhs = _as_ndarray(a), _as_ndarray(b)
+        if matrix.ndim < 2 or matrix.shape[-1] != matrix.shape[-2]:
+            raise ValueError(f"Expected square matrices, got shape {matrix.shape}")
+        flops = 2 * matrix.size * matrix.shape[-1] // 3
+        return _call(np.linalg.solve, matrix, rhs, split_rows=False, flops=flops)
+
+    matrix, rhs = _as_rows(a), _as_rows(b)
+    matrix_dims, rhs_dims = len(shape(matrix)), len(shape(rhs))
+    if matrix_dims == 3:
+        return [
+            _solve_rows(m, r)
+            for m, r in _pair_stacks(matrix, rhs, 3, 3 if rhs_dims == matrix_dims else rhs_dims)
+        ]
+    return _solve_rows(matrix, rhs)
+
+
+def _call(
+    func: Callable[[Any, Any], Any], a: Any, b: Any, split_rows: bool, flops: int
+) -> Any:
+    """Call a NumPy kernel, split across threads along the leading axis if worthwhile.
+
+    The leading axis of ``a`` is split into one part per thread: the stack
+    dimension (with ``b``'s stack split alike when it has one of the same
+    size), or the rows of a single matrix when ``split_rows`` is set.
+    """
+    try:
+        threads = min(_num_threads, a.shape[0]) if a.ndim >= 2 else 1
+        stacked = a.ndim >= 3 and (b.ndim < 3 or b.shape[0] == a.shape[0])
+        splittable = stacked or (split_rows and a.ndim == 2)
+        if threads <= 1 or flops < PARALLEL_MIN_FLOPS or not splittable:
+            return func(a, b)
+
+        split_b = stacked and b.ndim == a.ndim
+        bounds = [a.shape[0] * i // threads for i in range(threads + 1)]
+        parts = [(a[lo:hi], b[lo:hi] if split_b else b) for lo, hi in zip(bounds, bounds[1:])]
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="linalg") as executor:
+            return np.concatenate(list(executor.map(lambda part: func(*part), parts)))
+    except np.linalg.LinAlgError as e:
+        raise ValueError(str(e)) from e
+    except ValueError as e:
+        raise ValueError(f"Invalid operands with shapes {a.shape} and {b.shape}: {e}") from e
+
+
+def _as_ndarray(value: Any) -> Any:
+    """Convert a matrix operand to a float64 array (buffers of float64 are not copied)."""
+    try:
+        array = np.asarray(value, dtype=np.float64)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid numeric matrix: {e}") from e
+    if array.ndim == 0:
+        raise ValueError("Expected a vector or a matrix, got a scalar")
+    return array
+
+
+def _as_rows(value: Any) -> Any:
+    """Convert a matrix operand to (nested) lists of floats, checking rows are even."""
+    if isinstance(value, memoryview):
+        value = value.tolist()
+    if not isinstance(value, (list, tuple, array)):
+        raise ValueError(f"Expected a vector or a matrix, got {type(value).__name__}")
+    if value and isinstance(value[0], (list, tuple, array, memoryview)):
+        rows = [_as_rows(item) for item in value]
+        if len({shape(row) for row in rows}) > 1:
+            raise ValueError("Invalid numeric matrix: rows have different lengths")
+        return rows
+    try:
+        return [float(item) for item in value]
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid numeric matrix: {e}") from e
+
+
+def _pair_stacks(a: list, b: list, a_dims: int, b_dims: int) -> list[tuple[Any, Any]]:
+    """Pair the matrices of two stacks, broadcasting a single (non-stacked) operand."""
+    if a_dims == 3 and b_dims == 3:
+        if len(a) != len(b):
+            raise ValueError(f"Stacks of {len(a)} and {len(b)} matrices cannot be paired")
+        return list(zip(a, b))
+    if a_dims == 3:
+        return [(matrix, b) for matrix in a]
+    return [(a, matrix) for matrix in b]
+
+
+def _matmul_rows(a: list, b: list, block_size: int) -> list[list[float]]:
+    """Cache-blocked product of two matrices given as lists of rows.
+
+    The columns of ``b`` are processed ``block_size`` at a time, so one block
+    of columns stays in cache while every row of ``a`` is multiplied with it;
+    each dot product runs in C through ``sum(map(mul, ...))``.
+    """
+    inner = len(b)
+    if any(len(row) != inner for row in a):
+        raise ValueError(
+            f"Shapes {shape(a)} and {shape(b)} are not aligned for matrix multiplication"
+        )
+    columns = list(zip(*b)) if b else []
+    result: list[list[float]] = [[] for _ in a]
+    for start in range(0, len(columns), block_size):
+        block = columns[start : start + block_size]
+        for row, out in zip(a, result):
+            out.extend([sum(map(operator.mul, row, column)) for column in block])
+    return result
+
+
+def _solve_rows(a: list, b: list) -> list:
+    """Gaussian elimination with partial pivoting on lists of rows."""
+    size = len(a)
+    if any(len(row) != size for row in a):
+        raise ValueError(f"Expected a square matrix, got shape {shape(a)}")
+    vector = len(shape(b)) == 1
+    rhs = [[value] for value in b] if vector else [list(row) for row in b]
+    if len(rhs) != size:
+        raise ValueError(f"Right-hand side has {len(rhs)} rows, the matrix has {size}")
+    rows = [list(row) + rhs_row for row, rhs_row in zip(a, rhs)]
+
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(rows[r][column]))
+        if rows[pivot][column] == 0.0:
+            raise ValueError("Singular matrix")
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        pivot_row = rows[column]
+        for row in rows[column + 1 :]:
+            factor = row[column] / pivot_row[column]
+            if factor:
+                row[column:] = [x - factor * p for x, p in zip(row[column:], pivot_row[column:])]
+
+    solution = [[0.0] * len(rhs[0]) for _ in range(size)]
+    for r in range(size - 1, -1, -1):
+        row = rows[r]
+        for k in range(len(rhs[0])):
+            total = row[size + k] - sum(row[c] * solution[c][k] for c in range(r + 1, size))
+            solution[r][k] = total / row[r]
+    return [row[0] for row in solution] if vector else solution
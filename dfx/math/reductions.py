@@ -0,0 +1,538 @@
+"""Single-pass, mergeable reductions over chunked or streamed numeric data.
+
+Each accumulator consumes data one chunk at a time in constant memory and can
+be merged with accumulators that saw other chunks, on other threads or other
+nodes, giving the same result as one pass over all the data (up to rounding):
+
+- ``Moments``: count, sum, mean, variance, min and max. Chunks are combined
+  with Chan et al.'s parallel form of Welford's algorithm and the sum is kept
+  with Neumaier (improved Kahan) compensation.
+- ``QuantileSketch``: a DDSketch, whose quantiles are within a relative error
+  of the exact value, in memory bounded by ``max_bins``.
+- ``Histogram``: counts in equal-width bins over a fixed range.
+
+``to_dict()`` returns a JSON-ready partial aggregate and ``from_dict()``
+restores it, so partial results can travel between nodes. NaN elements are
+skipped by the quantile sketch and the histogram, and make the moments NaN;
+the quantile sketch rejects infinite elements.
+"""
+
+import itertools
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from dfx.chunked import DEFAULT_CHUNK_SIZE, iter_chunks
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Threads a reduction is split across by default (1 reduces every chunk inline)
+DEFAULT_WORKERS = max(int(os.getenv("REDUCE_WORKERS", "1")), 1)
+
+
+def reduce(
+    create: Callable[[], Any],
+    values: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+    check: Callable[[], None] | None = None,
+) -> Any:
+    """Reduce an array or an iterator of array chunks with a fresh accumulator.
+
+    With several workers and more than one chunk, each thread takes the next
+    chunk as soon as it is free, updates its own accumulator and the
+    per-thread accumulators are merged at the end, so at most ``max_workers``
+    chunks are held in memory. Data that fits in one chunk never starts a thread.
+
+    Args:
+        create: Returns an empty accumulator (e.g. ``Moments``)
+        values: Array, scalar or iterator yielding array chunks
+        chunk_size: Elements per chunk for array values
+        max_workers: Threads updating accumulators (NumPy releases the GIL);
+            defaults to ``REDUCE_WORKERS`` (1), the first chunk is always reduced inline
+        check: Called before each chunk, e.g. to raise if the run was cancelled
+
+    Returns:
+        The accumulator holding the reduction of all elements
+    """
+    chunks = iter_chunks(values, chunk_size)
+    workers = max_workers or DEFAULT_WORKERS
+    first = next(chunks, None)
+    accumulator = create()
+    if first is None:
+        return accumulator
+    if check is not None:
+        check()
+    accumulator.update(first)
+    second = next(chunks, None)
+    if second is None:
+        return accumulator
+    chunks = itertools.chain([second], chunks)
+    if workers <= 1:
+        for chunk in chunks:
+            if check is not None:
+                check()
+            accumulator.update(chunk)
+        return accumulator
+
+    lock = threading.Lock()
+
+    def work() -> Any:
+        partial = create()
+        while True:
+            with lock:
+                chunk = next(chunks, None)
+            if chunk is None:
+                return partial
+            if check is not None:
+                check()
+            partial.update(chunk)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reduce") as executor:
+        partials = [executor.submit(work) for _ in range(workers)]
+        for future in partials:
+            accumulator.merge(future.result())
+    return accumulator
+
+
+class Moments:
+    """Count, compensated sum, mean, variance, min and max of a data stream."""
+
+    kind = "moments"
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    @property
+    def sum(self) -> float:
+        """Sum of all elements, with the rounding error of the running sum added back."""
+        return self._sum + self._compensation
+
+    def variance(self, ddof: int = 0) -> float:
+        """Variance with ``ddof`` delta degrees of freedom (0: population, 1: sample).
+
+        Returns:
+            The variance, or nan if there are no more elements than ``ddof``
+        """
+        if self.count <= ddof:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def update(self, values: Iterable[float]) -> "Moments":
+        """Add a chunk of elements."""
+        if np is not None:
+            data = np.asarray(values, dtype=np.float64).reshape(-1)
+            count = data.size
+            if count == 0:
+                return self
+            chunk_sum = float(data.sum())
+            chunk_mean = chunk_sum / count
+            deviations = data - chunk_mean
+            chunk_m2 = float(np.dot(deviations, deviations))
+            low, high = float(data.min()), float(data.max())
+        else:
+            count, chunk_mean, chunk_m2 = 0, 0.0, 0.0
+            chunk = Moments()
+            low, high = math.inf, -math.inf
+            for value in values:
+                value = float(value)
+                count += 1
+                delta = value - chunk_mean
+                chunk_mean += delta / count
+                chunk_m2 += delta * (value - chunk_mean)
+                chunk._add(value)
+                low, high = _nanmin(low, value), _nanmax(high, value)
+            if count == 0:
+                return self
+            chunk_sum = chunk.sum
+        self._combine(count, chunk_mean, chunk_m2, low, high)
+        self._add(chunk_sum)
+        return self
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Add the elements summarized by another accumulator."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+            self._add(other._sum)
+            self._add(other._compensation)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the partial aggregate in a JSON-ready form."""
+        return {
+            "type": self.kind,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "sum": self._sum,
+            "compensation": self._compensation,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, partial: dict[str, Any]) -> "Moments":
+        """Restore a partial aggregate returned by ``to_dict()``.
+
+        Raises:
+            ValueError: If ``partial`` is not a moments aggregate
+        """
+        _check_kind(partial, cls.kind)
+        moments = cls()
+        try:
+            moments.count = int(partial["count"])
+            if moments.count:
+                moments.mean = float(partial["mean"])
+                moments.m2 = float(partial["m2"])
+                moments.min = float(partial["min"])
+                moments.max = float(partial["max"])
+                moments._sum = float(partial["sum"])
+                moments._compensation = float(partial.get("compensation", 0.0))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid moments aggregate: {e}") from e
+        return moments
+
+    def _combine(self, count: int, mean: float, m2: float, low: float, high: float) -> None:
+        """Chan et al.'s pairwise update of count, mean and sum of squared deviations."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min, self.max = _nanmin(self.min, low), _nanmax(self.max, high)
+
+    def _add(self, value: float) -> None:
+        """Neumaier compensated addition to the running sum."""
+        total = self._sum + value
+        if math.isinf(total):
+            self._sum = total
+            return
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+
+_INFINITE_QUANTILE_INPUT = "Cannot estimate quantiles of infinite values"
+
+
+class QuantileSketch:
+    """DDSketch: quantiles within a relative error ``relative_accuracy`` of the exact value.
+
+    Positive and negative elements are counted in logarithmically spaced bins
+    (bin ``k`` holds magnitudes in ``(gamma**(k-1), gamma**k]``). When a store
+    exceeds ``max_bins``, its lowest bins are collapsed into one, which only
+    affects the accuracy of the quantiles of the smallest magnitudes.
+    """
+
+    kind = "ddsketch"
+    # Magnitudes below this are counted as zero
+    MIN_MAGNITUDE = 1e-300
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        """Create an empty sketch.
+
+        Raises:
+            ValueError: If ``relative_accuracy`` is not in (0, 1) or ``max_bins`` < 1
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        if max_bins < 1:
+            raise ValueError(f"max_bins must be positive, got {max_bins}")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._inverse_log_gamma = 1.0 / math.log(self.gamma)
+        self.count = 0
+        self.zero_count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+
+    def update(self, values: Iterable[float]) -> "QuantileSketch":
+        """Add a chunk of elements (NaN elements are skipped).
+
+        Raises:
+            ValueError: If an element is infinite (the chunk is not added)
+        """
+        if np is not None:
+            data = np.asarray(values, dtype=np.float64).reshape(-1)
+            data = data[~np.isnan(data)]
+            if data.size == 0:
+                return self
+            if np.isinf(data).any():
+                raise ValueError(_INFINITE_QUANTILE_INPUT)
+            magnitudes = np.abs(data)
+            indexable = magnitudes > self.MIN_MAGNITUDE
+            self._add_keys(self.positive, magnitudes[indexable & (data > 0)])
+            self._add_keys(self.negative, magnitudes[indexable & (data < 0)])
+            self.zero_count += int(data.size - np.count_nonzero(indexable))
+            self.count += int(data.size)
+            self.min = min(self.min, float(data.min()))
+            self.max = max(self.max, float(data.max()))
+        else:
+            data = [value for value in map(float, values) if value == value]
+            if any(math.isinf(value) for value in data):
+                raise ValueError(_INFINITE_QUANTILE_INPUT)
+            for value in data:
+                if abs(value) <= self.MIN_MAGNITUDE:
+                    self.zero_count += 1
+                else:
+                    store = self.positive if value > 0 else self.negative
+                    key = self._key(abs(value))
+                    store[key] = store.get(key, 0) + 1
+                self.count += 1
+                self.min, self.max = min(self.min, value), max(self.max, value)
+        self._collapse(self.positive)
+        self._collapse(self.negative)
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add the elements summarized by another sketch.
+
+        Raises:
+            ValueError: If the sketches have different relative accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge sketches with relative accuracies {self.relative_accuracy} "
+                f"and {other.relative_accuracy}"
+            )
+        stores = ((self.positive, other.positive), (self.negative, other.negative))
+        for store, other_store in stores:
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+            self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Return the ``q``-quantile (0 <= q <= 1), or nan if the sketch is empty.
+
+        Raises:
+            ValueError: If ``q`` is outside [0, 1]
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Quantile must be in [0, 1], got {q}")
+        if self.count == 0:
+            return math.nan
+        if q == 0.0:
+            return self.min
+        if q == 1.0:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the partial aggregate in a JSON-ready form."""
+        return {
+            "type": self.kind,
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "positive": sorted(self.positive.items()),
+            "negative": sorted(self.negative.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, partial: dict[str, Any]) -> "QuantileSketch":
+        """Restore a partial aggregate returned by ``to_dict()``.
+
+        Raises:
+            ValueError: If ``partial`` is not a DDSketch aggregate
+        """
+        _check_kind(partial, cls.kind)
+        try:
+            sketch = cls(float(partial["relative_accuracy"]), int(partial["max_bins"]))
+            sketch.count = int(partial["count"])
+            sketch.zero_count = int(partial["zero_count"])
+            if sketch.count:
+                sketch.min, sketch.max = float(partial["min"]), float(partial["max"])
+            sketch.positive = {int(key): int(count) for key, count in partial["positive"]}
+            sketch.negative = {int(key): int(count) for key, count in partial["negative"]}
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid DDSketch aggregate: {e}") from e
+        return sketch
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) * self._inverse_log_gamma)
+
+    def _value(self, key: int) -> float:
+        """Value of a bin within the relative accuracy of every magnitude in it."""
+        return 2.0 * self.gamma**key / (self.gamma + 1.0)
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def _add_keys(self, store: dict[int, int], magnitudes: Any) -> None:
+        if magnitudes.size == 0:
+            return
+        keys = np.ceil(np.log(magnitudes) * self._inverse_log_gamma).astype(np.int64)
+        offset = int(keys.min())
+        counts = np.bincount(keys - offset)
+        for index in np.flatnonzero(counts).tolist():
+            key = index + offset
+            store[key] = store.get(key, 0) + int(counts[index])
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        """Merge the lowest bins until at most ``max_bins`` remain."""
+        if len(store) <= self.max_bins:
+            return
+        keys = sorted(store)
+        excess = keys[: len(keys) - self.max_bins + 1]
+        target = excess[-1]
+        store[target] = sum(store.pop(key) for key in excess[:-1]) + store[target]
+
+
+class Histogram:
+    """Counts of elements in ``bins`` equal-width bins over ``[low, high]``.
+
+    The last bin includes ``high``. Elements outside the range are counted in
+    ``underflow`` and ``overflow``; NaN elements are skipped.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, low: float, high: float, bins: int = 10) -> None:
+        """Create an empty histogram.
+
+        Raises:
+            ValueError: If the range is empty or not finite, or ``bins`` < 1
+        """
+        if not (math.isfinite(low) and math.isfinite(high) and low < high):
+            raise ValueError(f"Histogram range must be finite with low < high, got [{low}, {high}]")
+        if bins < 1:
+            raise ValueError(f"bins must be positive, got {bins}")
+        self.low = float(low)
+        self.high = float(high)
+        self.bins = int(bins)
+        self.counts = [0] * self.bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self) -> list[float]:
+        """The ``bins + 1`` bin edges."""
+        width = (self.high - self.low) / self.bins
+        return [self.low + i * width for i in range(self.bins)] + [self.high]
+
+    @property
+    def count(self) -> int:
+        """Number of elements counted, out-of-range ones included."""
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def update(self, values: Iterable[float]) -> "Histogram":
+        """Add a chunk of elements."""
+        scale = self.bins / (self.high - self.low)
+        if np is not None:
+            data = np.asarray(values, dtype=np.float64).reshape(-1)
+            self.underflow += int(np.count_nonzero(data < self.low))
+            self.overflow += int(np.count_nonzero(data > self.high))
+            inside = data[(data >= self.low) & (data <= self.high)]
+            indices = np.minimum(((inside - self.low) * scale).astype(np.intp), self.bins - 1)
+            for index, count in enumerate(np.bincount(indices, minlength=self.bins).tolist()):
+                self.counts[index] += count
+            return self
+        for value in values:
+            value = float(value)
+            if value < self.low:
+                self.underflow += 1
+            elif value > self.high:
+                self.overflow += 1
+            elif value == value:
+                self.counts[min(int((value - self.low) * scale), self.bins - 1)] += 1
+        return self
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Add the counts of another histogram.
+
+        Raises:
+            ValueError: If the histograms have different bins
+        """
+        if (other.low, other.high, other.bins) != (self.low, self.high, self.bins):
+            raise ValueError(
+                f"Cannot merge histograms with bins {self.bins} over [{self.low}, {self.high}] "
+                f"and {other.bins} over [{other.low}, {other.high}]"
+            )
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the partial aggregate in a JSON-ready form."""
+        return {
+            "type": self.kind,
+            "low": self.low,
+            "high": self.high,
+            "bins": self.bins,
+            "counts": list(self.counts),
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+        }
+
+    @classmethod
+    def from_dict(cls, partial: dict[str, Any]) -> "Histogram":
+        """Restore a partial aggregate returned by ``to_dict()``.
+
+        Raises:
+            ValueError: If ``partial`` is not a histogram aggregate
+        """
+        _check_kind(partial, cls.kind)
+        try:
+            histogram = cls(float(partial["low"]), float(partial["high"]), int(partial["bins"]))
+            counts = [int(count) for count in partial["counts"]]
+            histogram.underflow = int(partial["underflow"])
+            histogram.overflow = int(partial["overflow"])
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid histogram aggregate: {e}") from e
+        if len(counts) != histogram.bins:
+            raise ValueError(
+                f"Histogram aggregate has {len(counts)} counts for {histogram.bins} bins"
+            )
+        histogram.counts = counts
+        return histogram
+
+
+def _check_kind(partial: Any, kind: str) -> None:
+    if not isinstance(partial, dict) or partial.get("type") != kind:
+        found = partial.get("type") if isinstance(partial, dict) else type(partial).__name__
+        raise ValueError(f"Expected a '{kind}' partial aggregate, got {found!r}")
+
+
+def _nanmin(a: float, b: float) -> float:
+    return math.nan if a != a or b != b else min(a, b)
+
+
+def _nanmax(a: float, b: float) -> float:
+    return math.nan if a != a or b != b else max(a, b)
@@ -1,12 +1,14 @@
 """NATS client helper for publishing and consuming messages."""
 
+import asyncio
 import json
 import logging
 import os
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import nats
 from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
 from nats.js import JetStreamContext
 from nats.js.api import RetentionPolicy, StorageType, StreamConfig
 
@@ -89,7 +91,7 @@ class NATSClient:
     async def publish(
         self,
         subject: str,
-        data: dict[str, Any],
+        data: dict[str, Any] | bytes,
         headers: dict[str, str] | None = None,
     ) -> None:
         """
@@ -97,22 +99,17 @@ class NATSClient:
 
         Args:
             subject: NATS subject to publish to (can be full topic path or relative)
-            data: Data to publish (will be JSON encoded)
+            data: Data to publish (JSON encoded unless already bytes)
             headers: Optional headers to include
         """
         if not self.js:
             raise RuntimeError("Not connected to NATS. Call connect() first.")
 
         try:
-            # If subject starts with "droq.", use it as full topic path
-            # Otherwise, prefix with stream name for backward compatibility
-            if subject.startswith("droq."):
-                full_subject = subject
-            else:
-                full_subject = f"{self.stream_name}.{subject}"
+            full_subject = self._full_subject(subject)
 
             # Encode data as JSON
-            payload = json.dumps(data).encode()
+            payload = self._encode(data)
             payload_size = len(payload)
 
             logger.info(f"[NATS] Publishing to subject: {full_subject}, payload size: {payload_size} bytes")
@@ -128,6 +125,90 @@ class NATSClient:
             logger.error(f"Failed to publish message: {e}")
             raise
 
+    async def publish_many(
+        self,
+        messages: list[tuple[str, dict[str, Any] | bytes]],
+    ) -> list[Exception | None]:
+        """
+        Publish several messages, sending them all before waiting for any ack.
+
+        Args:
+            messages: (subject, data) pairs to publish
+
+        Returns:
+            One entry per message: None if it was acked, otherwise the exception raised
+        """
+        if not self.js:
+            raise RuntimeError("Not connected to NATS. Call connect() first.")
+        if not messages:
+            return []
+
+        # Each publish writes its message to the connection's pending buffer before
+        # awaiting the ack, so running them together pipelines the whole batch
+        # into a single flush instead of one round-trip per message.
+        results = await asyncio.gather(
+            *(
+                self.js.publish(self._full_subject(subject), self._encode(data))
+                for subject, data in messages
+            ),
+            return_exceptions=True,
+        )
+        errors = [result if isinstance(result, Exception) else None for result in results]
+        failed = sum(1 for error in errors if error is not None)
+        logger.info(f"[NATS] Published batch of {len(messages)} messages ({failed} failed)")
+        return errors
+
+    async def subscribe(
+        self,
+        subject: str,
+        callback: Callable[[dict[str, Any], dict[str, str]], Awaitable[None]],
+        queue: str | None = None,
+    ) -> None:
+        """
+        Subscribe to a subject and dispatch decoded messages until cancelled.
+
+        Args:
+            subject: NATS subject to subscribe to (resolved like in publish())
+            callback: Coroutine called with the JSON-decoded data and headers
+            queue: Optional queue group to share messages between subscribers
+        """
+        if not self.nc:
+            raise RuntimeError("Not connected to NATS. Call connect() first.")
+
+        async def handler(msg: Msg) -> None:
+            try:
+                data = json.loads(msg.data.decode())
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                logger.warning(f"[NATS] Dropping undecodable message on {msg.subject}: {e}")
+                return
+            await callback(data, dict(msg.headers or {}))
+
+        full_subject = self._full_subject(subject)
+        sub = await self.nc.subscribe(full_subject, queue=queue or "", cb=handler)
+        queue_info = f" (queue: {queue})" if queue else ""
+        logger.info(f"[NATS] Subscribed to {full_subject}{queue_info}")
+        try:
+            # Messages are dispatched by the client; keep the subscription alive
+            await asyncio.Future()
+        finally:
+            if not self.nc.is_closed:
+                await sub.unsubscribe()
+
+    @staticmethod
+    def _encode(data: dict[str, Any] | bytes) -> bytes:
+        """Encode a payload as JSON, passing pre-encoded bytes through."""
+        if isinstance(data, (bytes, bytearray)):
+            return bytes(data)
+        return json.dumps(data).encode()
+
+    def _full_subject(self, subject: str) -> str:
+        """Resolve a subject to its full JetStream subject."""
+        # If subject starts with "droq.", use it as full topic path
+        # Otherwise, prefix with stream name for backward compatibility
+        if subject.startswith("droq."):
+            return subject
+        return f"{self.stream_name}.{subject}"
+
     async def close(self) -> None:
         """Close NATS connection."""
         if self.nc:
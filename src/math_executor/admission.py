@@ -0,0 +1,238 @@
+"""Admission control and scheduling of executions.
+
+Bounded concurrency with a bounded wait queue, ordered by priority and deadline.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import defaultdict
+from typing import Any
+
+
+class AdmissionRejectedError(Exception):
+    """An execution was shed instead of being queued.
+
+    Attributes:
+        status_code: HTTP status to answer with (429 queue full, 503 deadline can't be met)
+        retry_after: Seconds after which a retry is likely to be admitted
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+# Upper bounds (ms) of the queue-wait histogram buckets
+QUEUE_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class AdmissionController:
+    """Limits concurrent executions, schedules queued ones and sheds load early.
+
+    Up to ``max_concurrency`` executions run at once; up to ``max_queue`` more
+    wait for a slot. A freed slot goes to the waiting request with the highest
+    priority, and among equal priorities to the one with the earliest deadline
+    (its absolute deadline, or its arrival plus its timeout if that is sooner).
+    Waiting requests whose deadline passed are dropped instead of run.
+
+    A request is rejected immediately when the queue is full, or when the
+    expected wait (from an exponential moving average of execution time and the
+    number of requests ahead of it) already exceeds its remaining deadline,
+    instead of waiting only to time out.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        max_queue: int = 256,
+        saturation_threshold: float = 0.8,
+        initial_service_time: float = 0.01,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Executions allowed to run at once
+            max_queue: Executions allowed to wait for a slot
+            saturation_threshold: Queue fill ratio from which the node reports itself saturated
+            initial_service_time: Execution time estimate (seconds) until one is measured
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.saturation_threshold = saturation_threshold
+        self.service_time = initial_service_time
+        self.active = 0
+        # Heap of (-priority, deadline, arrival sequence, waiter)
+        self._heap: list[tuple[int, float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self.queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_deadline = 0
+        self.expired_in_queue = 0
+        self.queue_wait_histograms: dict[int, dict[int | None, int]] = {}
+
+    def expected_wait(self, priority: int | None = None) -> float:
+        """Seconds a request arriving now is expected to wait for a slot.
+
+        Args:
+            priority: Only count queued requests that would run before one of this
+                priority (all queued requests if None)
+        """
+        if self.active < self.max_concurrency and not self.queued:
+            return 0.0
+        if priority is None:
+            ahead = self.queued
+        else:
+            ahead = sum(
+                1
+                for negative_priority, _, _, waiter in self._heap
+                if -negative_priority >= priority and not waiter.done()
+            )
+        rounds = math.ceil((ahead + 1) / self.max_concurrency)
+        return rounds * self.service_time
+
+    async def acquire(
+        self,
+        timeout: float,
+        priority: int = 0,
+        deadline: float | None = None,
+    ) -> float:
+        """Wait for an execution slot.
+
+        Args:
+            timeout: Seconds the request may spend, waiting included
+            priority: Higher priorities are given slots first
+            deadline: Absolute deadline as a Unix timestamp, if the request has one
+
+        Returns:
+            Seconds spent waiting for the slot
+
+        Raises:
+            AdmissionRejectedError: If the queue is full, the deadline can't be met,
+                or the deadline passed while queued
+        """
+        budget = timeout if deadline is None else min(timeout, deadline - time.time())
+        if budget <= 0:
+            self.rejected_deadline += 1
+            raise AdmissionRejectedError("Request deadline has already passed", 503, 1)
+
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            self._admit(priority, 0.0)
+            return 0.0
+
+        expected_wait = self.expected_wait(priority)
+        retry_after = max(1, math.ceil(self.expected_wait()))
+        if self.queued >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejectedError(
+                f"Execution queue is full ({self.max_queue} waiting)", 429, retry_after
+            )
+        if expected_wait > budget:
+            self.rejected_deadline += 1
+            raise AdmissionRejectedError(
+                f"Expected queue wait of {expected_wait:.3f}s exceeds the {budget:g}s deadline",
+                503,
+                retry_after,
+            )
+
+        start = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._heap, (-priority, time.monotonic() + budget, next(self._sequence), waiter)
+        )
+        self.queued += 1
+        try:
+            await asyncio.wait_for(waiter, timeout=budget)
+        except AdmissionRejectedError:
+            # Dropped by release() because its deadline passed
+            raise
+        except asyncio.TimeoutError:
+            self.queued -= 1
+            self.expired_in_queue += 1
+            raise AdmissionRejectedError(
+                f"Deadline passed after {budget:g}s waiting for an execution slot",
+                503,
+                retry_after,
+            ) from None
+        except BaseException:
+            if waiter.cancelled():
+                self.queued -= 1
+            elif waiter.exception() is None:
+                # The slot was handed over just as we were cancelled - pass it on
+                self.release()
+            raise
+        waited = time.perf_counter() - start
+        self._admit(priority, waited)
+        return waited
+
+    def _admit(self, priority: int, waited: float) -> None:
+        self.admitted += 1
+        histogram = self.queue_wait_histograms.setdefault(priority, defaultdict(int))
+        waited_ms = waited * 1000
+        histogram[next((b for b in QUEUE_WAIT_BUCKETS_MS if waited_ms <= b), None)] += 1
+
+    def release(self, service_time: float | None = None) -> None:
+        """Free a slot, handing it to the next scheduled request.
+
+        Args:
+            service_time: How long the finished execution took, to refine the wait estimate
+        """
+        if service_time is not None:
+            self.service_time += 0.2 * (service_time - self.service_time)
+        now = time.monotonic()
+        while self._heap:
+            _, deadline, _, waiter = heapq.heappop(self._heap)
+            if waiter.done():
+                # Timed out or cancelled while queued, already accounted for
+                continue
+            self.queued -= 1
+            if deadline <= now:
+                self.expired_in_queue += 1
+                waiter.set_exception(
+                    AdmissionRejectedError("Deadline passed while queued", 503, 1)
+                )
+                continue
+            # The slot moves to the waiter without being freed in between
+            waiter.set_result(None)
+            return
+        self.active -= 1
+
+    def saturation(self) -> dict[str, Any]:
+        """Return load figures.
+
+        ``saturated`` is set once all slots are busy and the queue is filled to
+        ``saturation_threshold``.
+        """
+        return {
+            "saturated": self.active >= self.max_concurrency
+            and self.queued >= self.saturation_threshold * self.max_queue,
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "expected_wait": self.expected_wait(),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return load figures, counters and per-priority queue-wait histograms."""
+        return {
+            **self.saturation(),
+            "service_time_avg": self.service_time,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_deadline": self.rejected_deadline,
+            "expired_in_queue": self.expired_in_queue,
+            "queue_wait_ms_histogram": {
+                str(priority): {
+                    f"le_{bucket or 'inf'}": histogram.get(bucket, 0)
+                    for bucket in (*QUEUE_WAIT_BUCKETS_MS, None)
+                }
+                for priority, histogram in sorted(self.queue_wait_histograms.items())
+            },
+        }
@@ -2,47 +2,324 @@
 
 import asyncio
 import importlib
+import inspect
 import logging
 import os
+import signal
 import sys
 import time
 import uuid
-from typing import Any
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, PrivateAttr, ValidationError
+from starlette.background import BackgroundTask
+
+from math_executor.admission import AdmissionController, AdmissionRejectedError
+from math_executor.backends import ProcessPoolBackend, ThreadBackend, load_component_backends
+from math_executor.binary import (
+    MSGPACK_AVAILABLE,
+    MSGPACK_MEDIA_TYPE,
+    accepts_msgpack,
+    is_msgpack,
+    looks_like_msgpack,
+    packb,
+    unpackb,
+)
+from math_executor.buffers import (
+    BufferHandleError,
+    describe,
+    has_handles,
+    open_buffer,
+    resolve_handles,
+    write_buffer,
+)
+from math_executor.cache import ComponentClassCache
+from math_executor.coalescer import RequestCoalescer
+from math_executor.connection import NATSConnectionManager
+from math_executor.graph import (
+    GraphError,
+    default_method,
+    extract_value,
+    resolve_output_method,
+    topological_order,
+)
+from math_executor.memo import ResultCache
+from math_executor.nats_executor import NATSExecutor
+from math_executor.outbox import Outbox
+from math_executor.publisher import PublishQueueFullError, ResultPublisher
+from math_executor.registry import ComponentRegistry
+from math_executor.sessions import Session, SessionCache
+from math_executor.streaming import STREAM_MEDIA_TYPES, frame, iterate_chunks, negotiate_format
 
 # dfx framework is at the root of the repo - ensure it's in the path
 _node_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if _node_dir not in sys.path:
     sys.path.insert(0, _node_dir)
 
+from dfx import Data, run_chunked  # noqa: E402
+from dfx.math.kernels import is_array  # noqa: E402
+from math_executor.serialization import (  # noqa: E402
+    ENCODER,
+    dumps,
+    encode_envelope,
+    encode_result,
+    to_jsonable,
+)
+
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Droq Math Executor Node", version="0.1.0")
 
-# Initialize NATS client (lazy connection)
-_nats_client = None
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services around the HTTP server."""
+    global nats_executor
+    # Preload registered components in the background; /health reports ready once done
+    registry_task = asyncio.create_task(asyncio.to_thread(component_registry.load))
+    if os.getenv("NATS_EXECUTOR_ENABLED", "false").lower() in ("1", "true", "yes"):
+        mode = os.getenv("NATS_EXECUTION_MODE", "core")
+        nats_executor = NATSExecutor(
+            get_client=get_nats_client,
+            handle=handle_nats_request,
+            subject=os.getenv(
+                "NATS_EXECUTION_SUBJECT",
+                "droq-stream.math.execute" if mode == "pull" else "droq.math.execute",
+            ),
+            mode=mode,
+            queue_group=os.getenv("NATS_EXECUTION_QUEUE", "math-executor"),
+            durable=os.getenv("NATS_EXECUTION_DURABLE", "math-executor"),
+            max_concurrency=int(os.getenv("NATS_EXECUTION_CONCURRENCY", "16")),
+        )
+        nats_executor.start()
+    if process_backend is not None:
+        await asyncio.to_thread(process_backend.start)
+    nats_connection.ensure_connecting()
+    result_publisher.start()
+    reload_tasks: set[asyncio.Task] = set()
+    if os.getenv("COMPONENT_RELOAD_ON_SIGHUP", "true").lower() in ("1", "true", "yes"):
+        _install_reload_signal(reload_tasks)
+    reload_interval = float(os.getenv("COMPONENT_RELOAD_INTERVAL_S", "0"))
+    if reload_interval > 0:
+        reload_tasks.add(asyncio.create_task(watch_components(reload_interval)))
+    try:
+        yield
+    finally:
+        _remove_reload_signal()
+        for task in reload_tasks:
+            task.cancel()
+        if not registry_task.done():
+            registry_task.cancel()
+        if nats_executor is not None:
+            await nats_executor.stop()
+            nats_executor = None
+        await result_publisher.stop(timeout=float(os.getenv("PUBLISH_DRAIN_TIMEOUT", "5")))
+        await nats_connection.close()
+        if process_backend is not None:
+            process_backend.stop()
+        thread_backend.stop()
+
 
+app = FastAPI(title="Droq Math Executor Node", version="0.1.0", lifespan=lifespan)
 
-async def get_nats_client():
-    """Get or create NATS client instance."""
-    global _nats_client
-    if _nats_client is None:
-        logger.info("[NATS] Creating new NATS client instance...")
-        from dfx.nats import NATSClient
-        nats_url = os.getenv("NATS_URL", "nats://localhost:4222")
-        logger.info(f"[NATS] Connecting to NATS at {nats_url}")
-        _nats_client = NATSClient(nats_url=nats_url)
+# Executes requests received over NATS (started by lifespan when enabled)
+nats_executor: NATSExecutor | None = None
+
+# Upper bound on items of one batch request executing at the same time
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "32"))
+
+# Bounded concurrency and wait queue for /api/v1/execute, shedding load once saturated
+admission = AdmissionController(
+    max_concurrency=int(os.getenv("EXECUTION_MAX_CONCURRENCY", "64")),
+    max_queue=int(os.getenv("EXECUTION_MAX_QUEUE", "256")),
+    saturation_threshold=float(os.getenv("HEALTH_SATURATION_THRESHOLD", "0.8")),
+)
+
+# Opt-in coalescing of concurrent scalar requests into batched component calls
+request_coalescer = (
+    RequestCoalescer(
+        window_ms=float(os.getenv("MICROBATCH_WINDOW_MS", "2")),
+        max_batch_size=int(os.getenv("MICROBATCH_MAX_SIZE", "256")),
+    )
+    if os.getenv("MICROBATCH_ENABLED", "false").lower() in ("1", "true", "yes")
+    else None
+)
+
+# Classes built from submitted component_code, keyed by a hash of (code, class name)
+component_class_cache = ComponentClassCache(
+    max_size=int(os.getenv("COMPONENT_CACHE_SIZE", "128")),
+    bytecode_dir=os.getenv("COMPONENT_BYTECODE_DIR") or None,
+)
+
+NODE_JSON_PATH = os.getenv("NODE_JSON_PATH", os.path.join(_node_dir, "node.json"))
+
+# Registered components, imported, validated and warmed up at startup
+component_registry = ComponentRegistry(
+    NODE_JSON_PATH,
+    warmup=os.getenv("COMPONENT_WARMUP", "true").lower() in ("1", "true", "yes"),
+)
+
+# Backend (thread, process or inline) of sync methods, per component module from node.json
+DEFAULT_EXECUTOR_BACKEND = os.getenv("EXECUTOR_BACKEND", "thread")
+component_backends = load_component_backends(NODE_JSON_PATH, default=DEFAULT_EXECUTOR_BACKEND)
+
+# Threads for components on the thread backend; timed-out runs are cancelled cooperatively
+thread_backend = ThreadBackend(max_workers=int(os.getenv("THREAD_POOL_WORKERS", "0")) or None)
+
+# Worker processes for components on the process backend, pre-warmed with their modules.
+# Workers over the CPU limit, or whose request timed out, are killed and replaced.
+_process_modules = [path for path, backend in component_backends.items() if backend == "process"]
+process_backend = (
+    ProcessPoolBackend(
+        max_workers=int(os.getenv("PROCESS_POOL_WORKERS", "0")) or None,
+        modules=_process_modules,
+        cpu_limit=float(os.getenv("EXECUTION_CPU_LIMIT_S", "0")),
+        memory_limit_mb=int(os.getenv("EXECUTION_MEMORY_LIMIT_MB", "0")),
+    )
+    if _process_modules or DEFAULT_EXECUTOR_BACKEND == "process"
+    else None
+)
+
+# Encoded results of components declared pure, keyed by their canonicalized inputs
+result_cache = ResultCache(
+    max_entries=int(os.getenv("RESULT_CACHE_SIZE", "1024")),
+    max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl=float(os.getenv("RESULT_CACHE_TTL_S", "300")),
+)
+
+# Last execution per component_id, for requests that opt into incremental re-execution
+session_cache = SessionCache(
+    max_sessions=int(os.getenv("SESSION_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("SESSION_CACHE_TTL_S", "3600")),
+)
+
+
+# Out-of-core execution of components with chunk methods into an output buffer
+OUT_OF_CORE_CHUNK_SIZE = int(os.getenv("OUT_OF_CORE_CHUNK_SIZE", str(1 << 20)))
+OUT_OF_CORE_WORKERS = int(os.getenv("OUT_OF_CORE_WORKERS", "1"))
+
+# Encoding of results published to stream_topic: "json" or "msgpack" (binary typed arrays)
+NATS_PAYLOAD_FORMAT = os.getenv("NATS_PAYLOAD_FORMAT", "json").lower()
+if NATS_PAYLOAD_FORMAT == "msgpack" and not MSGPACK_AVAILABLE:
+    logger.warning("NATS_PAYLOAD_FORMAT=msgpack but msgpack is not installed, publishing JSON")
+    NATS_PAYLOAD_FORMAT = "json"
+
+
+# Serializes reloads triggered by SIGHUP, the mtime poller and the reload endpoint
+_reload_lock = asyncio.Lock()
+
+
+async def reload_components(force: bool = False) -> list[str]:
+    """Reload changed component modules and drop everything derived from their old classes.
+
+    The registry swaps the new classes in atomically; requests that already
+    loaded the old class finish on it. Memoized results and sessions are
+    cleared (requests still running on an old class don't store their results),
+    and worker processes are recycled if a reloaded module runs on the process
+    backend. Concurrent calls run one after the other.
+
+    Args:
+        force: Reload every registered module, changed or not
+
+    Returns:
+        The reloaded module paths
+    """
+    if not component_registry.ready:
+        return []
+    async with _reload_lock:
+        reloaded = await asyncio.to_thread(component_registry.reload, force)
+        if not reloaded:
+            return []
+        result_cache.clear()
+        session_cache.clear()
+        if process_backend is not None and any(
+            component_backends.get(module_path, DEFAULT_EXECUTOR_BACKEND) == "process"
+            for module_path in reloaded
+        ):
+            await process_backend.recycle()
+        return reloaded
+
+
+async def watch_components(interval: float) -> None:
+    """Reload component modules whenever their source files change, polling every ``interval`` s."""
+    while True:
+        await asyncio.sleep(interval)
         try:
-            await _nats_client.connect()
-            logger.info("[NATS] ✅ Successfully connected to NATS")
+            await reload_components()
         except Exception as e:
-            logger.warning(f"[NATS] ❌ Failed to connect to NATS (non-critical): {e}", exc_info=True)
-            _nats_client = None
-    else:
-        logger.debug("[NATS] Using existing NATS client instance")
-    return _nats_client
+            logger.error(f"[REGISTRY] Component reload failed: {e}", exc_info=True)
+
+
+def _install_reload_signal(tasks: set[asyncio.Task]) -> None:
+    """Reload all component modules on SIGHUP, where the platform supports it."""
+    def on_sighup() -> None:
+        logger.info("[REGISTRY] SIGHUP received, reloading components")
+        task = asyncio.get_running_loop().create_task(reload_components(force=True))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, on_sighup)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError) as e:
+        # No SIGHUP on Windows; signals only work from the main thread
+        logger.debug(f"[REGISTRY] Reload on SIGHUP unavailable: {e}")
+
+
+def _remove_reload_signal() -> None:
+    try:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        pass
+
+
+def _create_nats_client():
+    """Create an unconnected NATS client from the environment."""
+    from dfx.nats import NATSClient
+
+    nats_url = os.getenv("NATS_URL", "nats://localhost:4222")
+    logger.info(f"[NATS] Connecting to NATS at {nats_url}")
+    return NATSClient(nats_url=nats_url)
+
+
+# Connects (and reconnects) in the background with exponential backoff
+nats_connection = NATSConnectionManager(
+    client_factory=_create_nats_client,
+    initial_backoff=float(os.getenv("NATS_RECONNECT_BACKOFF_MS", "500")) / 1000.0,
+    max_backoff=float(os.getenv("NATS_RECONNECT_MAX_BACKOFF_MS", "30000")) / 1000.0,
+)
+
+
+async def get_nats_client():
+    """Get the connected NATS client instance.
+
+    Never waits for a connection attempt: returns None while NATS is being
+    (re)connected in the background.
+    """
+    return nats_connection.get()
+
+
+# Publishes results in the background so responses don't wait for JetStream acks
+result_publisher = ResultPublisher(
+    get_client=get_nats_client,
+    max_queue=int(os.getenv("PUBLISH_QUEUE_SIZE", "10000")),
+    max_in_flight=int(os.getenv("PUBLISH_MAX_IN_FLIGHT", "256")),
+    backpressure=os.getenv("PUBLISH_BACKPRESSURE", "block"),
+    max_retries=int(os.getenv("PUBLISH_MAX_RETRIES", "3")),
+    retry_backoff=float(os.getenv("PUBLISH_RETRY_BACKOFF_MS", "100")) / 1000.0,
+    outbox=(
+        Outbox(
+            directory=os.environ["OUTBOX_DIR"],
+            segment_max_bytes=int(os.getenv("OUTBOX_SEGMENT_MAX_BYTES", str(16 * 1024 * 1024))),
+            fsync=os.getenv("OUTBOX_FSYNC", "interval"),
+            fsync_interval=float(os.getenv("OUTBOX_FSYNC_INTERVAL_MS", "1000")) / 1000.0,
+        )
+        if os.getenv("OUTBOX_DIR")
+        else None
+    ),
+)
 
 
 class ComponentState(BaseModel):
@@ -67,6 +344,36 @@ class ExecutionRequest(BaseModel):
     is_async: bool = False
     timeout: int = 30
     message_id: str | None = None
+    # Skip the result cache of pure components for this request (the result is still stored)
+    bypass_cache: bool = False
+    # Reuse or incrementally update the previous result of the same component_id
+    incremental: bool = False
+    # Higher priorities are scheduled first when executions queue up
+    priority: int = 0
+    # Absolute deadline as a Unix timestamp in seconds; queued work past it is dropped
+    deadline: float | None = None
+    # Buffer handle (see math_executor.buffers) the array result is written into
+    output_buffer: dict[str, Any] | None = None
+    # Key of the array within the result's data to write (None for the whole result)
+    output_key: str | None = None
+    # Seconds spent waiting for admission, charged against the timeout
+    _queue_time: float = PrivateAttr(default=0.0)
+
+    def admitted(self, waited: float) -> None:
+        """Record the seconds the request waited for admission (see ``time_budget``)."""
+        self._queue_time += waited
+
+    def time_budget(self, queued: bool = True) -> float:
+        """Seconds the execution may still take: its timeout, capped by its deadline.
+
+        Args:
+            queued: Take the time spent waiting for admission out of the timeout, so
+                the wait and the execution together stay within it
+        """
+        budget = self.timeout - self._queue_time if queued else self.timeout
+        if self.deadline is not None:
+            budget = min(budget, self.deadline - time.time())
+        return max(budget, 0.0)
 
 
 class ExecutionResponse(BaseModel):
@@ -78,6 +385,112 @@ class ExecutionResponse(BaseModel):
     execution_time: float
     error: str | None = None
     message_id: str | None = None
+    # The previous result of the same component_id was returned (and not re-published)
+    reused: bool = False
+
+    # Encoded result, set when it was already encoded for the NATS payload
+    _result_json: bytes | None = PrivateAttr(default=None)
+
+    def to_json_bytes(self) -> bytes:
+        """Encode the response, reusing the already-encoded result when available."""
+        result_json = self._result_json
+        if result_json is None:
+            result_json = encode_result(self.result)
+        return encode_envelope(result_json, self.model_dump(exclude={"result"}))
+
+    def to_msgpack_bytes(self) -> bytes:
+        """Encode the response as msgpack, with numeric arrays as typed binary buffers."""
+        return packb({"result": self.result, **self.model_dump(exclude={"result"})})
+
+
+# The request body of /api/v1/execute, parsed by read_execution_request
+EXECUTION_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            media_type: {"schema": {"$ref": "#/components/schemas/ExecutionRequest"}}
+            for media_type in ("application/json", MSGPACK_MEDIA_TYPE)
+        },
+    }
+}
+
+
+class BatchExecutionRequest(BaseModel):
+    """Request to execute many component methods in one round-trip."""
+
+    requests: list[ExecutionRequest]
+    max_concurrency: int | None = None
+
+
+class BatchExecutionResponse(BaseModel):
+    """Per-item responses of a batch execution, in request order."""
+
+    results: list[ExecutionResponse]
+    execution_time: float
+
+    def to_json_bytes(self) -> bytes:
+        """Encode the batch response from the items' encodings."""
+        return (
+            b'{"results":['
+            + b",".join(response.to_json_bytes() for response in self.results)
+            + b'],"execution_time":'
+            + dumps(self.execution_time)
+            + b"}"
+        )
+
+
+class GraphNode(BaseModel):
+    """A component of a graph execution."""
+
+    id: str
+    component_state: ComponentState
+    # Output method returned for sinks (defaults to the method of the first output)
+    method_name: str | None = None
+    is_async: bool = False
+    message_id: str | None = None
+
+
+class GraphEdge(BaseModel):
+    """Feeds an output of one node into an input of another."""
+
+    source: str
+    target: str
+    target_input: str
+    # Name of the source's dfx Output to feed (defaults to the source node's method)
+    source_output: str | None = None
+    # Key within the output's data to feed instead of the whole result (e.g. "result")
+    source_key: str | None = None
+
+
+class GraphExecutionRequest(BaseModel):
+    """Request to execute a graph of chained components in one round-trip."""
+
+    nodes: list[GraphNode]
+    edges: list[GraphEdge] = []
+    # Nodes whose results are returned and published (defaults to nodes without outgoing edges)
+    sinks: list[str] | None = None
+    timeout: int = 30
+    max_concurrency: int | None = None
+
+
+class GraphExecutionResponse(BaseModel):
+    """Responses of the sink nodes of a graph execution, by node id."""
+
+    results: dict[str, ExecutionResponse]
+    execution_time: float
+
+    def to_json_bytes(self) -> bytes:
+        """Encode the graph response from the sinks' encodings."""
+        return (
+            b'{"results":{'
+            + b",".join(
+                dumps(node_id) + b":" + response.to_json_bytes()
+                for node_id, response in self.results.items()
+            )
+            + b'},"execution_time":'
+            + dumps(self.execution_time)
+            + b"}"
+        )
 
 
 async def load_component_class(
@@ -95,6 +508,9 @@ async def load_component_class(
 
     # Try to import from module first
     if module_path and not component_code:
+        component_class_obj = component_registry.get(module_path, component_class)
+        if component_class_obj is not None:
+            return component_class_obj
         try:
             module = importlib.import_module(module_path)
             component_class_obj = getattr(module, component_class)
@@ -110,12 +526,11 @@ async def load_component_class(
         try:
             # Create a namespace for the code execution with dfx available
             namespace = {"dfx": __import__("dfx")}
-            exec(component_code, namespace)
-            component_class_obj = namespace.get(component_class)
-            if component_class_obj:
-                logger.info(f"Loaded {component_class} from provided code")
-                return component_class_obj
-            raise ValueError(f"Component class {component_class} not found in provided code")
+            component_class_obj = component_class_cache.load(
+                component_code, component_class, namespace
+            )
+            logger.info(f"Loaded {component_class} from provided code")
+            return component_class_obj
         except Exception as e:
             raise ValueError(f"Failed to execute component code: {e}") from e
 
@@ -123,49 +538,109 @@ async def load_component_class(
 
 
 def serialize_result(result: Any) -> Any:
-    """Serialize result to JSON-serializable format."""
-    if result is None:
-        return None
+    """Serialize result to JSON-ready format (numeric arrays are left to the encoder)."""
+    return to_jsonable(result)
 
-    # If it's a Data object (dfx or lfx), extract its data dict
-    if hasattr(result, "data"):
-        if hasattr(result, "model_dump"):
-            try:
-                return result.model_dump()
-            except Exception:
-                pass
-        # Fallback: extract data dict directly
-        if isinstance(result.data, dict):
-            return {"data": result.data, "text_key": getattr(result, "text_key", "text")}
-        return {"data": result.data if hasattr(result, "data") else str(result)}
-
-    # If it's a Pydantic model, try model_dump
-    if hasattr(result, "model_dump"):
-        try:
-            return result.model_dump()
-        except Exception:
-            pass
 
-    # If it's a dict, recursively serialize
-    if isinstance(result, dict):
-        return {k: serialize_result(v) for k, v in result.items()}
+async def read_execution_request(http_request: Request) -> ExecutionRequest:
+    """Parse an ExecutionRequest body sent as JSON or, by Content-Type, as msgpack.
+
+    Raises:
+        HTTPException: 415 if the body is msgpack and msgpack is not installed
+        RequestValidationError: If the body is not a valid ExecutionRequest
+    """
+    body = await http_request.body()
+    try:
+        if not is_msgpack(http_request.headers.get("content-type")):
+            return ExecutionRequest.model_validate_json(body)
+        if not MSGPACK_AVAILABLE:
+            raise HTTPException(status_code=415, detail="msgpack is not installed on this node")
+        return ExecutionRequest.model_validate(unpackb(body))
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+    except ValueError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        ) from e
+
 
-    # If it's a list, recursively serialize
-    if isinstance(result, list):
-        return [serialize_result(item) for item in result]
+@app.post(
+    "/api/v1/execute", response_model=ExecutionResponse, openapi_extra=EXECUTION_REQUEST_BODY
+)
+async def execute_component(
+    request: ExecutionRequest = Depends(read_execution_request),
+    accept: str | None = Header(default=None),
+) -> Response:
+    """Execute a math component method.
 
-    # For primitives, return as-is
-    if isinstance(result, (str, int, float, bool)):
-        return result
+    Requests beyond the concurrency limit wait in a bounded queue, ordered by
+    priority and then earliest deadline. When the queue is full (429) or the
+    request can't be started within its timeout or deadline (503), it is
+    rejected right away with a Retry-After hint.
 
-    # For other types, convert to string
-    return str(result)
+    The request may be sent as msgpack (``Content-Type: application/msgpack``),
+    with numeric arrays as typed binary buffers that reach the component
+    without being parsed element by element. ``Accept: application/msgpack``
+    returns the response the same way.
+    """
+    binary = accepts_msgpack(accept)
+    try:
+        request.admitted(
+            await admission.acquire(request.timeout, request.priority, request.deadline)
+        )
+    except AdmissionRejectedError as e:
+        logger.warning(f"[ADMISSION] Rejected execution ({e.status_code}): {e}")
+        raise HTTPException(
+            status_code=e.status_code, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+        ) from e
+    start = time.perf_counter()
+    try:
+        response, publish_data = await run_execution(request, binary=binary)
+    finally:
+        admission.release(time.perf_counter() - start)
+    if publish_data is not None:
+        try:
+            await publish_result(
+                request.component_state.stream_topic, publish_data, response.message_id
+            )
+        except PublishQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"}) from e
+    if binary:
+        return Response(content=response.to_msgpack_bytes(), media_type=MSGPACK_MEDIA_TYPE)
+    return Response(content=response.to_json_bytes(), media_type="application/json")
 
 
-@app.post("/api/v1/execute", response_model=ExecutionResponse)
-async def execute_component(request: ExecutionRequest) -> ExecutionResponse:
-    """Execute a math component method."""
+async def run_execution(
+    request: ExecutionRequest,
+    component_class: type | None = None,
+    binary: bool = False,
+) -> tuple[ExecutionResponse, bytes | None]:
+    """Execute a component method without publishing its result.
+
+    Args:
+        request: The execution request
+        component_class: Already-loaded component class (loaded from the request if None)
+        binary: The response will be encoded as msgpack (see ``build_success``)
+
+    Returns:
+        The response and, if the request has a stream_topic and succeeded, the
+        encoded NATS payload to publish for it
+    """
     start_time = time.time()
+    timeout = request.time_budget()
+    if timeout <= 0:
+        # Past its deadline already - don't spend any work on it
+        logger.warning(f"[EXECUTOR] Dropping request {request.message_id}: deadline passed")
+        return ExecutionResponse(
+            result=None,
+            success=False,
+            result_type="TimeoutError",
+            execution_time=0.0,
+            error="Deadline passed before execution started",
+            message_id=request.message_id,
+        ), None
 
     try:
         # Log what we received (matching langflow-executor-node pattern)
@@ -181,128 +656,103 @@ async def execute_component(request: ExecutionRequest) -> ExecutionResponse:
         print(f"[EXECUTOR] {log_msg}")  # Also print to ensure visibility
 
         # Load component class
-        try:
-            component_class = await load_component_class(
-                request.component_state.component_module,
-                request.component_state.component_class,
-                request.component_state.component_code,
-            )
-        except ValueError as e:
-            # Component loading failed - return error response instead of HTTPException
-            execution_time = time.time() - start_time
-            error_msg = f"Failed to load component class: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return ExecutionResponse(
-                result=None,
-                success=False,
-                result_type="ValueError",
-                execution_time=execution_time,
-                error=error_msg,
-                message_id=request.message_id,
-            )
+        if component_class is None:
+            try:
+                component_class = await load_component_class(
+                    request.component_state.component_module,
+                    request.component_state.component_class,
+                    request.component_state.component_code,
+                )
+            except ValueError as e:
+                # Component loading failed - return error response instead of HTTPException
+                execution_time = time.time() - start_time
+                error_msg = f"Failed to load component class: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                return ExecutionResponse(
+                    result=None,
+                    success=False,
+                    result_type="ValueError",
+                    execution_time=execution_time,
+                    error=error_msg,
+                    message_id=request.message_id,
+                ), None
 
         # Instantiate component with parameters
-        component_params = request.component_state.parameters.copy()
-
-        # Merge input_values if provided
-        if request.component_state.input_values:
-            component_params.update(request.component_state.input_values)
-
-        if request.component_state.config:
-            for key, value in request.component_state.config.items():
-                component_params[f"_{key}"] = value
+        component_params = get_component_params(request.component_state)
 
-        component = component_class(**component_params)
-
-        # Get the method
-        if not hasattr(component, request.method_name):
-            execution_time = time.time() - start_time
-            error_msg = f"Method {request.method_name} not found on component {request.component_state.component_class}"
-            logger.error(error_msg)
-            return ExecutionResponse(
-                result=None,
-                success=False,
-                result_type="AttributeError",
-                execution_time=execution_time,
-                error=error_msg,
-                message_id=request.message_id,
+        # Short-circuit a re-triggered component whose inputs did not change
+        # (not for buffer handles: the referenced contents may have changed)
+        state = request.component_state
+        uses_buffers = request.output_buffer is not None or has_handles(component_params)
+        session_id = state.component_id if request.incremental and not uses_buffers else None
+        session = None
+        fingerprint = None
+        if session_id and session_cache.max_sessions > 0:
+            fingerprint = ResultCache.make_key(
+                state.component_module,
+                state.component_class,
+                state.component_code,
+                request.method_name,
+                component_params,
             )
+        # Parameters that can't be fingerprinted (e.g. arrays) are never session-tracked
+        if fingerprint is not None:
+            session = session_cache.get(session_id)
+            if session is not None and session.fingerprint == fingerprint:
+                session_cache.unchanged += 1
+                return build_reused(request, session, start_time), None
 
-        method = getattr(component, request.method_name)
-
-        # Execute method
-        if request.is_async:
-            result = await asyncio.wait_for(method(), timeout=request.timeout)
+        cache_key = get_cache_key(component_class, request, component_params)
+        cached = None
+        if cache_key is not None and not request.bypass_cache:
+            cached = result_cache.get(cache_key)
+        if cached is not None:
+            result_type, result, result_json = cached
+        elif request.output_buffer is not None and get_chunk_method(component_class, request):
+            result = await execute_out_of_core(request, component_class, component_params, timeout)
+            result_type, result_json = None, None
         else:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(method), timeout=request.timeout
+            outcome = await execute_method(
+                request, component_class, component_params, timeout, session
             )
+            if outcome is None:
+                return method_not_found(request, start_time), None
+            result, result_type = outcome
+            result_json = None
+            if request.output_buffer is not None:
+                result = await write_output_buffer(request, result)
 
-        execution_time = time.time() - start_time
-
-        # Serialize result
-        serialized_result = serialize_result(result)
-
-        logger.info(
-            f"Method {request.method_name} completed successfully "
-            f"in {execution_time:.3f}s, result type: {type(result).__name__}"
+        # A reload may have replaced the class meanwhile: don't memoize what the old one computed
+        current = component_registry.is_current(
+            state.component_module, state.component_class, component_class
         )
-
-        # Use message_id from request (generated by backend) or generate one if not provided
-        message_id = request.message_id or str(uuid.uuid4())
-
-        # Publish result to NATS stream if topic is provided (matching langflow-executor-node pattern)
-        if request.component_state.stream_topic:
-            topic = request.component_state.stream_topic
-            logger.info(f"[NATS] Attempting to publish to topic: {topic} with message_id: {message_id}")
-            print(f"[NATS] Attempting to publish to topic: {topic} with message_id: {message_id}")
-            try:
-                nats_client = await get_nats_client()
-                if nats_client:
-                    logger.info("[NATS] NATS client obtained, preparing publish data...")
-                    print("[NATS] NATS client obtained, preparing publish data...")
-                    # Publish result to NATS with message ID from backend
-                    publish_data = {
-                        "message_id": message_id,  # Use message_id from backend request
-                        "component_id": request.component_state.component_id,
-                        "component_class": request.component_state.component_class,
-                        "result": serialized_result,
-                        "result_type": type(result).__name__,
-                        "execution_time": execution_time,
-                    }
-                    logger.info(f"[NATS] Publishing to topic: {topic}, message_id: {message_id}, data keys: {list(publish_data.keys())}")
-                    print(f"[NATS] Publishing to topic: {topic}, message_id: {message_id}, data keys: {list(publish_data.keys())}")
-                    # Use the topic directly (already in format: droq.local.public.userid.workflowid.component.out)
-                    # Publish to NATS (message_id is already in publish_data, no need for headers)
-                    await nats_client.publish(
-                        subject=topic,
-                        data=publish_data,
-                    )
-                    logger.info(f"[NATS] ✅ Successfully published result to NATS topic: {topic} with message_id: {message_id}")
-                    print(f"[NATS] ✅ Successfully published result to NATS topic: {topic} with message_id: {message_id}")
-                else:
-                    logger.warning("[NATS] NATS client is None, cannot publish")
-                    print("[NATS] ⚠️  NATS client is None, cannot publish")
-            except Exception as e:
-                # Non-critical: log but don't fail execution
-                logger.warning(f"[NATS] ❌ Failed to publish to NATS (non-critical): {e}", exc_info=True)
-                print(f"[NATS] ❌ Failed to publish to NATS (non-critical): {e}")
-        else:
-            msg = f"[NATS] ⚠️  No stream_topic provided in request, skipping NATS publish. Component: {request.component_state.component_class}, ID: {request.component_state.component_id}"
-            logger.info(msg)
-            print(msg)
-
-        return ExecutionResponse(
-            result=serialized_result,
-            success=True,
-            result_type=type(result).__name__,
-            execution_time=execution_time,
-            message_id=message_id,  # Return message ID (from request or generated) so backend can match it
+        response, publish_data = build_success(
+            request,
+            result,
+            start_time,
+            result_type=result_type,
+            result_json=result_json,
+            cache_key=None if cached is not None or not current else cache_key,
+            binary=binary,
         )
+        if fingerprint is not None and current:
+            session_cache.put(
+                session_id,
+                Session(
+                    fingerprint=fingerprint,
+                    class_key=get_class_key(request),
+                    parameters=component_params,
+                    result=result if result_type is None else None,
+                    result_type=response.result_type,
+                    serialized_result=response.result,
+                    result_json=response._result_json,
+                ),
+            )
+        return response, publish_data
 
     except asyncio.TimeoutError:
         execution_time = time.time() - start_time
-        error_msg = f"Execution timed out after {request.timeout}s"
+        error_msg = f"Execution timed out after {timeout:g}s"
         logger.error(error_msg)
         return ExecutionResponse(
             result=None,
@@ -311,7 +761,7 @@ async def execute_component(request: ExecutionRequest) -> ExecutionResponse:
             execution_time=execution_time,
             error=error_msg,
             message_id=request.message_id,
-        )
+        ), None
 
     except HTTPException:
         raise
@@ -327,13 +777,960 @@ async def execute_component(request: ExecutionRequest) -> ExecutionResponse:
             execution_time=execution_time,
             error=error_msg,
             message_id=request.message_id,
+        ), None
+
+
+def get_component_params(state: ComponentState) -> dict[str, Any]:
+    """Merge a component's parameters, input values and config (as ``_key``) into kwargs."""
+    component_params = state.parameters.copy()
+
+    # Merge input_values if provided
+    if state.input_values:
+        component_params.update(state.input_values)
+
+    if state.config:
+        for key, value in state.config.items():
+            component_params[f"_{key}"] = value
+    return component_params
+
+
+async def execute_method(
+    request: ExecutionRequest,
+    component_class: type,
+    component_params: dict[str, Any],
+    timeout: float,
+    session: Session | None = None,
+) -> tuple[Any, str | None] | None:
+    """Run the requested method on the backend configured for the component.
+
+    Args:
+        request: The execution request
+        component_class: The component class
+        component_params: Parameters to instantiate the component with
+        timeout: Seconds the method may take
+        session: The component's previous execution, for incremental methods
+
+    Returns:
+        The result and, if the result was already converted with ``to_jsonable``
+        (in a worker process), its type name; None if the method doesn't exist
+    """
+    batch_fn = get_batch_function(component_class, request, component_params)
+    if batch_fn is not None:
+        return await asyncio.wait_for(
+            request_coalescer.submit(
+                (component_class, request.method_name),
+                partial(run_batch, request, batch_fn),
+                component_params,
+                timeout,
+            ),
+            timeout=timeout,
+        )
+
+    backend = get_backend(request)
+    if backend == "process":
+        if not hasattr(component_class, request.method_name):
+            return None
+        if session is not None:
+            session_cache.full += 1
+        result_type, result = await asyncio.wait_for(
+            process_backend.run(
+                request.component_state.component_module,
+                request.component_state.component_class,
+                request.method_name,
+                component_params,
+            ),
+            timeout=timeout,
+        )
+        return result, result_type
+
+    component = component_class(**resolve_handles(component_params))
+
+    # Get the method
+    if not hasattr(component, request.method_name):
+        return None
+
+    method = getattr(component, request.method_name)
+    if session is not None:
+        incremental = get_incremental_method(component, request, session, component_params)
+        if incremental is not None:
+            session_cache.incremental += 1
+            method = incremental
+        else:
+            session_cache.full += 1
+
+    # Execute method
+    if request.is_async:
+        result = await asyncio.wait_for(method(), timeout=timeout)
+    elif backend == "inline":
+        result = method()
+    else:
+        result = await thread_backend.run(component, method, timeout)
+    return result, None
+
+
+async def run_batch(
+    request: ExecutionRequest,
+    batch_fn: Callable[[list[dict[str, Any]]], list[Any]],
+    parameter_sets: list[dict[str, Any]],
+    timeout: float | None,
+) -> list[tuple[Any, str | None]]:
+    """Run a coalesced batch on the backend configured for the component.
+
+    Returns:
+        One (result, type name) pair per parameter set, as ``execute_method``
+        returns them (the type name is set if the batch ran in a worker process)
+    """
+    backend = get_backend(request)
+    if backend == "process":
+        state = request.component_state
+        results = await asyncio.wait_for(
+            process_backend.run_batch(
+                state.component_module, state.component_class, batch_fn.__name__, parameter_sets
+            ),
+            timeout=timeout,
         )
+        return [(value, result_type) for result_type, value in results]
+    if backend == "inline":
+        results = batch_fn(parameter_sets)
+    else:
+        results = await thread_backend.run(None, partial(batch_fn, parameter_sets), timeout)
+    return [(result, None) for result in results]
+
+
+def get_chunk_method(component_class: type, request: ExecutionRequest) -> str | None:
+    """Return the component's chunk method for the requested method, if it declares one."""
+    return getattr(component_class, "chunk_methods", {}).get(request.method_name)
+
+
+async def execute_out_of_core(
+    request: ExecutionRequest,
+    component_class: type,
+    component_params: dict[str, Any],
+    timeout: float,
+) -> Data:
+    """Compute an element-wise method chunk by chunk straight into the output buffer.
+
+    Neither the operands nor the result are ever fully in memory: each chunk of
+    the (memory-mapped) inputs goes through the component's chunk method and is
+    written to the output buffer before the next chunks are read.
+
+    Returns:
+        A result holding the output buffer's handle under ``output_key`` (or "result")
+    """
+    component = component_class(**resolve_handles(component_params))
+    target = open_buffer(request.output_buffer, writable=True)
+    run = partial(
+        run_chunked,
+        component,
+        request.method_name,
+        target,
+        chunk_size=OUT_OF_CORE_CHUNK_SIZE,
+        max_workers=OUT_OF_CORE_WORKERS,
+    )
+    summary = await thread_backend.run(component, run, timeout)
+    capacity = target.nbytes // target.itemsize
+    if summary.elements != capacity:
+        raise BufferHandleError(
+            f"Result has {summary.elements} elements, the output buffer holds {capacity}"
+        )
+    return Data(
+        data={
+            request.output_key or "result": describe(request.output_buffer, summary.elements),
+            "length": summary.elements,
+            "chunks": summary.chunks,
+        }
+    )
+
+
+async def write_output_buffer(request: ExecutionRequest, result: Any) -> Any:
+    """Copy the array result into the request's output buffer.
+
+    Returns:
+        The result, with the written array replaced by the buffer's handle
+
+    Raises:
+        GraphError: If the result has no ``output_key``
+        BufferHandleError: If the output buffer is invalid or doesn't match the array
+    """
+    value = extract_value(result, request.output_key)
+    written = await asyncio.to_thread(write_buffer, request.output_buffer, value)
+    handle = describe(request.output_buffer, written)
+    if request.output_key is None:
+        return handle
+    data = getattr(result, "data", result)
+    if request.output_key not in data:
+        # JSON-ready form of a Data result
+        data = data["data"]
+    data[request.output_key] = handle
+    return result
+
+
+def get_class_key(request: ExecutionRequest) -> tuple[str, str, str | None, str]:
+    """Identify the component class and method of a request, regardless of its inputs."""
+    state = request.component_state
+    return (
+        state.component_module,
+        state.component_class,
+        state.component_code,
+        request.method_name,
+    )
+
+
+def get_incremental_method(
+    component: Any,
+    request: ExecutionRequest,
+    session: Session,
+    component_params: dict[str, Any],
+) -> Callable[[], Any] | None:
+    """Return the component's incremental update bound to its previous execution, if any.
+
+    The incremental method declared in ``incremental_methods`` is called with the
+    previous parameters, the previous result and the names of the parameters
+    that changed, on a component instantiated with the new parameters.
+    """
+    method_name = getattr(component, "incremental_methods", {}).get(request.method_name)
+    if not method_name or session.result is None:
+        return None
+    if session.class_key != get_class_key(request):
+        return None
+    return partial(
+        getattr(component, method_name),
+        session.parameters,
+        session.result,
+        session.changed_inputs(component_params),
+    )
+
+
+def build_reused(
+    request: ExecutionRequest,
+    session: Session,
+    start_time: float,
+) -> ExecutionResponse:
+    """Answer with the result of the component's previous execution, which had the same inputs.
+
+    Nothing is published: consumers already received this result.
+    """
+    execution_time = time.time() - start_time
+    logger.info(
+        f"[EXECUTOR] Inputs of component {request.component_state.component_id} unchanged, "
+        f"reusing its previous result"
+    )
+    response = ExecutionResponse(
+        result=session.serialized_result,
+        success=True,
+        result_type=session.result_type,
+        execution_time=execution_time,
+        message_id=request.message_id or str(uuid.uuid4()),
+        reused=True,
+    )
+    response._result_json = session.result_json
+    return response
+
+
+def method_not_found(request: ExecutionRequest, start_time: float) -> ExecutionResponse:
+    """Build the error response for a method the component doesn't have."""
+    execution_time = time.time() - start_time
+    error_msg = (
+        f"Method {request.method_name} not found on component "
+        f"{request.component_state.component_class}"
+    )
+    logger.error(error_msg)
+    return ExecutionResponse(
+        result=None,
+        success=False,
+        result_type="AttributeError",
+        execution_time=execution_time,
+        error=error_msg,
+        message_id=request.message_id,
+    )
+
+
+def get_backend(request: ExecutionRequest) -> str:
+    """Return the backend a synchronous method of this request runs on.
+
+    Components submitted as code run on the thread backend when their module is
+    configured for the process backend, since workers import components by module.
+    """
+    if request.is_async:
+        return "async"
+    state = request.component_state
+    backend = component_backends.get(state.component_module, DEFAULT_EXECUTOR_BACKEND)
+    if backend == "process" and (state.component_code or process_backend is None):
+        return "thread"
+    return backend
+
+
+def get_cache_key(
+    component_class: type,
+    request: ExecutionRequest,
+    component_params: dict[str, Any],
+) -> str | None:
+    """Return the result cache key of this request, or None if its result isn't cacheable.
+
+    Only results of components that declare themselves ``pure`` are cached, and
+    only when they neither read nor write buffers by handle.
+    """
+    if not getattr(component_class, "pure", False) or result_cache.max_entries <= 0:
+        return None
+    if request.output_buffer is not None or has_handles(component_params):
+        return None
+    state = request.component_state
+    return ResultCache.make_key(
+        state.component_module,
+        state.component_class,
+        state.component_code,
+        request.method_name,
+        component_params,
+    )
+
+
+def get_batch_function(
+    component_class: type,
+    request: ExecutionRequest,
+    component_params: dict[str, Any],
+) -> Any | None:
+    """Return the component's batch method if this request may be coalesced.
+
+    Only synchronous calls with scalar parameters and no config are coalesced,
+    and only when micro-batching is enabled and the component declares a batch
+    method for the requested output method.
+    """
+    if request_coalescer is None or request.is_async or request.component_state.config:
+        return None
+    batch_method = getattr(component_class, "batch_methods", {}).get(request.method_name)
+    if not batch_method:
+        return None
+    if has_handles(component_params):
+        return None
+    if any(is_array(value) for value in component_params.values()):
+        return None
+    return getattr(component_class, batch_method, None)
+
+
+def build_success(
+    request: ExecutionRequest,
+    result: Any,
+    start_time: float,
+    result_type: str | None = None,
+    result_json: bytes | None = None,
+    cache_key: str | None = None,
+    binary: bool = False,
+) -> tuple[ExecutionResponse, bytes | None]:
+    """Serialize a method result into its response and NATS payload.
+
+    The result is encoded once; the bytes are shared by the NATS payload and the
+    HTTP response body.
+
+    Args:
+        request: The execution request
+        result: The method's result
+        start_time: When execution of the request started
+        result_type: Type name of a result already converted with ``to_jsonable``
+            (e.g. by a worker process); the result is converted here if None
+        result_json: The result's encoding, if it is already encoded (e.g. cached)
+        cache_key: Result cache key to store the encoded result under
+        binary: The response will be encoded as msgpack, so the result is only
+            encoded as JSON if the result cache or the NATS payload needs it
+    """
+    execution_time = time.time() - start_time
+
+    # Serialize result
+    if result_type is None:
+        result_type = type(result).__name__
+        serialized_result = serialize_result(result)
+    else:
+        serialized_result = result
+    if result_json is None and (not binary or cache_key is not None):
+        result_json = dumps(serialized_result)
+    if cache_key is not None:
+        result_cache.put(cache_key, result_type, serialized_result, result_json)
+
+    logger.info(
+        f"Method {request.method_name} completed successfully "
+        f"in {execution_time:.3f}s, result type: {result_type}"
+    )
+
+    # Use message_id from request (generated by backend) or generate one if not provided
+    message_id = request.message_id or str(uuid.uuid4())
+
+    publish_data = None
+    if request.component_state.stream_topic:
+        publish_data = encode_nats_payload(
+            result_json,
+            serialized_result,
+            {
+                "message_id": message_id,  # Use message_id from backend request
+                "component_id": request.component_state.component_id,
+                "component_class": request.component_state.component_class,
+                "result_type": result_type,
+                "execution_time": execution_time,
+            },
+        )
+    else:
+        msg = f"[NATS] ⚠️  No stream_topic provided in request, skipping NATS publish. Component: {request.component_state.component_class}, ID: {request.component_state.component_id}"
+        logger.info(msg)
+        print(msg)
+
+    response = ExecutionResponse(
+        result=serialized_result,
+        success=True,
+        result_type=result_type,
+        execution_time=execution_time,
+        message_id=message_id,  # Return message ID (from request or generated) so backend can match it
+    )
+    response._result_json = result_json
+    return response, publish_data
+
+
+def encode_nats_payload(result_json: bytes | None, result: Any, fields: dict[str, Any]) -> bytes:
+    """Encode a result published to NATS in NATS_PAYLOAD_FORMAT.
+
+    Args:
+        result_json: The result already encoded as JSON, if it is
+        result: The JSON-ready result
+        fields: Metadata sent alongside the result
+    """
+    if NATS_PAYLOAD_FORMAT == "msgpack":
+        return packb({"result": result, **fields})
+    return encode_envelope(result_json if result_json is not None else dumps(result), fields)
+
+
+async def publish_result(topic: str, publish_data: bytes, message_id: str | None = None) -> None:
+    """Queue an execution result for publishing to its NATS stream topic.
+
+    Publishing happens in the background, so the response does not wait for the
+    JetStream ack.
+
+    Raises:
+        PublishQueueFullError: If the publish queue is full and PUBLISH_BACKPRESSURE is "fail"
+    """
+    # Use the topic directly (already in format: droq.local.public.userid.workflowid.component.out)
+    # message_id is already in publish_data, no need for headers
+    logger.info(f"[NATS] Queueing result for topic: {topic} with message_id: {message_id}")
+    await result_publisher.submit(topic, publish_data, message_id=message_id)
+
+
+@app.post("/api/v1/execute/batch", response_model=BatchExecutionResponse)
+async def execute_batch(batch: BatchExecutionRequest) -> Response:
+    """Execute many component methods in one request.
+
+    Each distinct component class is loaded once, items run concurrently under a
+    bounded limit, and results are returned in request order. Every item takes
+    its own admission slot, like a single execution; items that are rejected
+    report the rejection as their error. NATS results are published together
+    once every item has finished.
+    """
+    start_time = time.time()
+
+    # Load each distinct component class once
+    classes: dict[tuple[str, str, str | None], type | ValueError] = {}
+    for request in batch.requests:
+        state = request.component_state
+        key = (state.component_module, state.component_class, state.component_code)
+        if key not in classes:
+            try:
+                classes[key] = await load_component_class(*key)
+            except ValueError as e:
+                classes[key] = e
+
+    limit = BATCH_MAX_CONCURRENCY
+    if batch.max_concurrency:
+        limit = min(limit, batch.max_concurrency)
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run_item(request: ExecutionRequest) -> tuple[ExecutionResponse, bytes | None]:
+        state = request.component_state
+        key = (state.component_module, state.component_class, state.component_code)
+        component_class = classes[key]
+        if isinstance(component_class, ValueError):
+            error_msg = f"Failed to load component class: {component_class}"
+            return ExecutionResponse(
+                result=None,
+                success=False,
+                result_type="ValueError",
+                execution_time=0.0,
+                error=error_msg,
+                message_id=request.message_id,
+            ), None
+        async with semaphore:
+            try:
+                request.admitted(
+                    await admission.acquire(request.timeout, request.priority, request.deadline)
+                )
+            except AdmissionRejectedError as e:
+                logger.warning(f"[ADMISSION] Rejected batch item ({e.status_code}): {e}")
+                return ExecutionResponse(
+                    result=None,
+                    success=False,
+                    result_type="AdmissionRejectedError",
+                    execution_time=0.0,
+                    error=str(e),
+                    message_id=request.message_id,
+                ), None
+            start = time.perf_counter()
+            try:
+                return await run_execution(request, component_class)
+            finally:
+                admission.release(time.perf_counter() - start)
+
+    outcomes = await asyncio.gather(*(run_item(request) for request in batch.requests))
+
+    messages = [
+        (request.component_state.stream_topic, publish_data, response.message_id)
+        for request, (response, publish_data) in zip(batch.requests, outcomes)
+        if publish_data is not None
+    ]
+    if messages:
+        try:
+            await publish_results(messages)
+        except PublishQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"}) from e
+
+    batch_response = BatchExecutionResponse(
+        results=[response for response, _ in outcomes],
+        execution_time=time.time() - start_time,
+    )
+    return Response(content=batch_response.to_json_bytes(), media_type="application/json")
+
+
+@app.post("/api/v1/execute/graph", response_model=GraphExecutionResponse)
+async def execute_graph(graph: GraphExecutionRequest) -> Response:
+    """Execute a graph of chained components in one request.
+
+    Nodes run in topological order, independent branches concurrently under a
+    bounded limit. Each node execution takes its own admission slot, so a graph
+    counts against the node's concurrency and queue limits like the single
+    executions it is made of. Intermediate results are passed to downstream
+    inputs in memory without being serialized; only the sinks' results are
+    encoded, returned and published to their stream topics.
+    """
+    start_time = time.time()
+    nodes = {node.id: node for node in graph.nodes}
+    try:
+        order, predecessors = topological_order(
+            [node.id for node in graph.nodes], [(edge.source, edge.target) for edge in graph.edges]
+        )
+        sources = {edge.source for edge in graph.edges}
+        sinks = graph.sinks if graph.sinks is not None else [n for n in order if n not in sources]
+        for sink in sinks:
+            if sink not in nodes:
+                raise GraphError(f"Sink references unknown node '{sink}'")
+
+        # Load each distinct component class once and resolve the methods to run
+        classes: dict[str, type] = {}
+        loaded: dict[tuple[str, str, str | None], type] = {}
+        for node in graph.nodes:
+            state = node.component_state
+            key = (state.component_module, state.component_class, state.component_code)
+            if key not in loaded:
+                try:
+                    loaded[key] = await load_component_class(*key)
+                except ValueError as e:
+                    raise GraphError(f"Node '{node.id}': {e}") from e
+            classes[node.id] = loaded[key]
+        node_methods = {
+            node.id: node.method_name or default_method(classes[node.id]) for node in graph.nodes
+        }
+        edge_methods = [
+            resolve_output_method(classes[edge.source], edge.source_output)
+            if edge.source_output
+            else node_methods[edge.source]
+            for edge in graph.edges
+        ]
+    except GraphError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    methods: dict[str, list[str]] = {node_id: [] for node_id in order}
+    for sink in sinks:
+        methods[sink].append(node_methods[sink])
+    for edge, method in zip(graph.edges, edge_methods):
+        if method not in methods[edge.source]:
+            methods[edge.source].append(method)
+    incoming: dict[str, list[tuple[GraphEdge, str]]] = {node_id: [] for node_id in order}
+    for edge, method in zip(graph.edges, edge_methods):
+        incoming[edge.target].append((edge, method))
+
+    limit = BATCH_MAX_CONCURRENCY
+    if graph.max_concurrency:
+        limit = min(limit, graph.max_concurrency)
+    semaphore = asyncio.Semaphore(max(limit, 1))
+    deadline = start_time + graph.timeout
+    results: dict[tuple[str, str], Any] = {}
+    outcomes: dict[str, tuple[ExecutionResponse, bytes | None]] = {}
+
+    def failed(request: ExecutionRequest, result_type: str, error: str, node_start: float):
+        logger.error(f"[GRAPH] {error}")
+        return ExecutionResponse(
+            result=None,
+            success=False,
+            result_type=result_type,
+            execution_time=time.time() - node_start,
+            error=error,
+            message_id=request.message_id,
+        )
+
+    async def run_node(node_id: str) -> str | None:
+        """Run the node's methods once its predecessors are done; return an error or None."""
+        upstream_errors = await asyncio.gather(*(tasks[p] for p in sorted(predecessors[node_id])))
+        node = nodes[node_id]
+        node_start = time.time()
+        error = next((e for e in upstream_errors if e is not None), None)
+        if error is not None:
+            error, result_type = f"Upstream node failed: {error}", "UpstreamError"
+        else:
+            try:
+                component_params = get_component_params(node.component_state)
+                for edge, method in incoming[node_id]:
+                    component_params[edge.target_input] = extract_value(
+                        results[(edge.source, method)], edge.source_key
+                    )
+            except GraphError as e:
+                error, result_type = f"Node '{node_id}': {e}", "GraphError"
+
+        for method in methods[node_id]:
+            request = ExecutionRequest(
+                component_state=node.component_state,
+                method_name=method,
+                is_async=node.is_async,
+                timeout=graph.timeout,
+                message_id=node.message_id,
+                deadline=deadline,
+            )
+            if error is None:
+                timeout = request.time_budget()
+                try:
+                    async with semaphore:
+                        request.admitted(await admission.acquire(timeout))
+                        slot_start = time.perf_counter()
+                        try:
+                            timeout = request.time_budget()
+                            outcome = await execute_method(
+                                request, classes[node_id], component_params, timeout
+                            )
+                        finally:
+                            admission.release(time.perf_counter() - slot_start)
+                    if outcome is None:
+                        raise AttributeError(
+                            f"Method {method} not found on component "
+                            f"{node.component_state.component_class}"
+                        )
+                except AdmissionRejectedError as e:
+                    error = f"Node '{node_id}' was not admitted: {e}"
+                    result_type = "AdmissionRejectedError"
+                except asyncio.TimeoutError:
+                    error = f"Node '{node_id}' timed out after {timeout:g}s"
+                    result_type = "TimeoutError"
+                except Exception as e:
+                    error = f"Node '{node_id}' failed: {type(e).__name__}: {e}"
+                    result_type = type(e).__name__
+            if error is not None:
+                if node_id in sinks and method == node_methods[node_id]:
+                    outcomes[node_id] = failed(request, result_type, error, node_start), None
+                return error
+
+            result, result_type_name = outcome
+            results[(node_id, method)] = result
+            if node_id in sinks and method == node_methods[node_id]:
+                outcomes[node_id] = build_success(
+                    request, result, node_start, result_type=result_type_name
+                )
+        return error
+
+    tasks: dict[str, asyncio.Task] = {}
+    for node_id in order:
+        tasks[node_id] = asyncio.ensure_future(run_node(node_id))
+    await asyncio.gather(*tasks.values())
+
+    messages = [
+        (nodes[sink].component_state.stream_topic, publish_data, response.message_id)
+        for sink in sinks
+        for response, publish_data in [outcomes[sink]]
+        if publish_data is not None
+    ]
+    if messages:
+        try:
+            await publish_results(messages)
+        except PublishQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"}) from e
+
+    graph_response = GraphExecutionResponse(
+        results={sink: outcomes[sink][0] for sink in sinks},
+        execution_time=time.time() - start_time,
+    )
+    return Response(content=graph_response.to_json_bytes(), media_type="application/json")
+
+
+@app.post("/api/v1/execute/stream")
+async def execute_stream(
+    request: ExecutionRequest,
+    format: str | None = None,
+    accept: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Execute a component method, streaming its result chunk by chunk.
+
+    Methods that are generators or async generators have each yielded chunk
+    encoded and sent as soon as it is produced; the next chunk is only computed
+    once the client has taken the previous one, so memory stays bounded however
+    large the total output. Other methods are sent as a single chunk. The stream
+    is NDJSON, or Server-Sent Events with ``format=sse`` or an Accept header of
+    ``text/event-stream``. Every message is a JSON object; the last one has
+    ``"done": true`` and reports success or the error that ended the stream.
+    With a stream_topic, each chunk (and the final message) is also published to
+    NATS. The request's timeout applies to each chunk (the first one including
+    the wait for admission), its deadline to the whole stream. Streamed results
+    bypass the result cache and sessions.
+    """
+    try:
+        stream_format = negotiate_format(format, accept)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if request.output_buffer is not None:
+        raise HTTPException(status_code=400, detail="Streamed results can't use output_buffer")
+    try:
+        request.admitted(
+            await admission.acquire(request.timeout, request.priority, request.deadline)
+        )
+    except AdmissionRejectedError as e:
+        logger.warning(f"[ADMISSION] Rejected stream ({e.status_code}): {e}")
+        raise HTTPException(
+            status_code=e.status_code, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+        ) from e
+
+    start = time.perf_counter()
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            admission.release(time.perf_counter() - start)
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for message in stream_execution(request, stream_format):
+                yield message
+        finally:
+            release()
+
+    # The background task releases the slot if the client left before the body started
+    return StreamingResponse(
+        body(), media_type=STREAM_MEDIA_TYPES[stream_format], background=BackgroundTask(release)
+    )
+
+
+async def stream_execution(request: ExecutionRequest, stream_format: str) -> AsyncIterator[bytes]:
+    """Run a component method and yield its framed chunks, ending with a final message."""
+    start_time = time.time()
+    state = request.component_state
+    message_id = request.message_id or str(uuid.uuid4())
+    nats_fields = {
+        "message_id": message_id,
+        "component_id": state.component_id,
+        "component_class": state.component_class,
+    }
+    chunks = 0
+    component = None
+    completed = False
+    final: dict[str, Any] = {"done": True, "success": True, "error": None}
+    try:
+        if request.time_budget() <= 0:
+            raise asyncio.TimeoutError("Deadline passed before execution started")
+        component_class = await load_component_class(
+            state.component_module, state.component_class, state.component_code
+        )
+        component_params = get_component_params(state)
+        method = getattr(component_class, request.method_name, None)
+        result_type = None
+        if method is None:
+            raise AttributeError(
+                f"Method '{request.method_name}' not found on component '{state.component_class}'"
+            )
+        if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method):
+            # Generators run on a thread (or inline), never in a worker process
+            component = component_class(**resolve_handles(component_params))
+            output = getattr(component, request.method_name)()
+        else:
+            outcome = await execute_method(
+                request, component_class, component_params, request.time_budget()
+            )
+            output, result_type = outcome
+
+        if component is None or get_backend(request) == "inline":
+            # Also drains generators returned (not yielded) by non-generator methods
+            async def run_step(step: Callable[[], Any], timeout: float) -> Any:
+                return step()
+        else:
+            run_step = partial(thread_backend.run, component)
+
+        def chunk_budget() -> float:
+            # The admission wait is charged to the first chunk; later ones get the full timeout
+            return request.time_budget(queued=chunks == 0)
+
+        async for chunk in iterate_chunks(output, run_step, chunk_budget):
+            chunk_type = result_type or type(chunk).__name__
+            serialized_chunk = chunk if result_type else serialize_result(chunk)
+            chunk_json = dumps(serialized_chunk)
+            fields = {"seq": chunks, "result_type": chunk_type, "message_id": message_id}
+            if state.stream_topic:
+                await publish_result(
+                    state.stream_topic,
+                    encode_nats_payload(
+                        chunk_json,
+                        serialized_chunk,
+                        {
+                            **nats_fields,
+                            "result_type": chunk_type,
+                            "chunk": chunks,
+                            "final": False,
+                            "execution_time": time.time() - start_time,
+                        },
+                    ),
+                    # Chunks share the message_id; the outbox dedups spooled results by this key
+                    f"{message_id}:{chunks}",
+                )
+            chunks += 1
+            yield frame(encode_envelope(chunk_json, fields), stream_format, "chunk")
+        completed = True
+    except asyncio.TimeoutError as e:
+        error = str(e) or "Timed out waiting for the next chunk"
+        final.update(success=False, result_type="TimeoutError", error=error)
+    except Exception as e:
+        logger.error(f"[EXECUTOR] Stream failed: {type(e).__name__}: {e}", exc_info=True)
+        final.update(
+            success=False,
+            result_type=type(e).__name__,
+            error=f"Execution failed: {type(e).__name__}: {e}",
+        )
+    finally:
+        # Failed, timed out or abandoned by the client
+        if component is not None and not completed:
+            component.cancel()
+
+    execution_time = time.time() - start_time
+    final.update(chunks=chunks, execution_time=execution_time, message_id=message_id)
+    if state.stream_topic:
+        try:
+            await publish_result(
+                state.stream_topic,
+                encode_nats_payload(
+                    b"null",
+                    None,
+                    {
+                        **nats_fields,
+                        "final": True,
+                        "chunks": chunks,
+                        "success": final["success"],
+                        "error": final["error"],
+                        "execution_time": execution_time,
+                    },
+                ),
+                message_id,
+            )
+        except PublishQueueFullError as e:
+            logger.warning(f"[NATS] Could not publish end of stream {message_id}: {e}")
+    logger.info(
+        f"Streamed {chunks} chunks of {request.method_name} in {execution_time:.3f}s "
+        f"(success={final['success']})"
+    )
+    yield frame(dumps(final), stream_format, "done" if final["success"] else "error")
+
+
+async def handle_nats_request(payload: bytes) -> bytes:
+    """Execute an encoded ExecutionRequest received over NATS.
+
+    The result is published to the request's stream_topic like for HTTP requests,
+    and the encoded ExecutionResponse is returned for request/reply callers.
+    Requests encoded as msgpack are answered in msgpack, others in JSON.
+    """
+    binary = MSGPACK_AVAILABLE and looks_like_msgpack(payload)
+    try:
+        if binary:
+            request = ExecutionRequest.model_validate(unpackb(payload))
+        else:
+            request = ExecutionRequest.model_validate_json(payload)
+    except ValueError as e:
+        logger.warning(f"[NATS] Received invalid execution request: {e}")
+        response = ExecutionResponse(
+            result=None,
+            success=False,
+            result_type="ValidationError",
+            execution_time=0.0,
+            error=f"Invalid execution request: {e}",
+        )
+        return response.to_msgpack_bytes() if binary else response.to_json_bytes()
+
+    response, publish_data = await run_execution(request, binary=binary)
+    if publish_data is not None:
+        await publish_result(
+            request.component_state.stream_topic, publish_data, response.message_id
+        )
+    return response.to_msgpack_bytes() if binary else response.to_json_bytes()
+
+
+async def publish_results(messages: list[tuple[str, bytes, str | None]]) -> None:
+    """Queue several execution results; the publisher pipelines them into one flush.
+
+    Raises:
+        PublishQueueFullError: If the publish queue is full and PUBLISH_BACKPRESSURE is "fail"
+    """
+    for topic, publish_data, message_id in messages:
+        await result_publisher.submit(topic, publish_data, message_id=message_id)
+
+
+@app.post("/api/v1/components/reload")
+async def reload_components_endpoint(force: bool = False):
+    """Reload registered component modules whose source changed (all of them with ``force``)."""
+    if not component_registry.ready:
+        raise HTTPException(status_code=503, detail="Components are still loading")
+    reloaded = await reload_components(force=force)
+    return {"reloaded": reloaded, "reloads": component_registry.reloads}
 
 
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "droq-math-executor-node"}
+    """Health check endpoint.
+
+    Answers 503 with status "starting" until the registered components are
+    loaded and warmed up, and with status "saturated" while all execution slots
+    are busy and the wait queue is filling up, so load balancers route new work
+    elsewhere.
+    """
+    if not component_registry.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "starting", "service": "droq-math-executor-node"},
+        )
+    saturation = admission.saturation()
+    if saturation["saturated"]:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "saturated",
+                "service": "droq-math-executor-node",
+                "saturation": saturation,
+            },
+        )
+    return {"status": "healthy", "service": "droq-math-executor-node", "saturation": saturation}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime metrics for the executor's caches and queues."""
+    return {
+        "json_encoder": ENCODER,
+        "registry": component_registry.stats(),
+        "admission": admission.stats(),
+        "component_cache": component_class_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "sessions": session_cache.stats(),
+        "executor_backends": component_backends,
+        "thread_pool": thread_backend.stats(),
+        "process_pool": process_backend.stats() if process_backend else None,
+        "microbatch": request_coalescer.stats() if request_coalescer else None,
+        "nats_executor": nats_executor.stats() if nats_executor else None,
+        "publisher": result_publisher.stats(),
+        "nats": nats_connection.stats(),
+    }
 
 
 @app.get("/")
@@ -0,0 +1,486 @@
+"""Executor backends for synchronous component methods.
+
+Each component runs on one of three backends, chosen per component through the
+``executor`` key of its ``node.json`` entry:
+
+- ``thread``: the method runs in the executor's thread pool
+- ``process``: the method runs in a pool of worker processes, one core each
+- ``inline``: the method runs directly on the event loop, for trivially cheap methods
+
+Over-deadline work is stopped as far as the backend allows. Threads cannot be
+killed, so a timed-out thread is asked to stop through the component's
+cooperative cancellation flag (``Component.raise_if_cancelled``) and tracked
+until it returns. Worker processes are killed and replaced; they also run under
+per-request CPU time and per-worker memory limits.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - resource limits are Unix-only
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("thread", "process", "inline")
+
+
+def load_component_backends(node_json_path: str, default: str = "thread") -> dict[str, str]:
+    """Read the executor backend of each component from node.json.
+
+    Args:
+        node_json_path: Path to the node's node.json
+        default: Backend of components without (or with an unknown) ``executor`` key
+
+    Returns:
+        Component module path -> backend name
+    """
+    try:
+        with open(node_json_path, encoding="utf-8") as f:
+            components = json.load(f).get("components", {})
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"[EXECUTOR] Could not read executor backends from {node_json_path}: {e}")
+        return {}
+
+    backends = {}
+    for name, component in components.items():
+        module_path = component.get("path")
+        if not module_path:
+            continue
+        backend = component.get("executor", default)
+        if backend not in BACKENDS:
+            logger.warning(
+                f"[EXECUTOR] Unknown executor '{backend}' for component {name}, "
+                f"expected one of {BACKENDS}; using '{default}'"
+            )
+            backend = default
+        backends[module_path] = backend
+    return backends
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker process running a request exited before returning a result."""
+
+
+class ThreadBackend:
+    """Runs synchronous component methods on a dedicated thread pool (created on first use).
+
+    A dedicated pool keeps runaway components from starving the default executor
+    used by the rest of the node. When a run times out, its component is
+    cancelled cooperatively and the thread is counted as runaway until the method
+    returns; it is counted as reclaimed once it does.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """
+        Initialize the backend.
+
+        Args:
+            max_workers: Threads in the pool (defaults to CPU count + 4, at most 32)
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor: ThreadPoolExecutor | None = None
+        self.timed_out = 0
+        self.runaway = 0
+        self.reclaimed = 0
+
+    async def run(
+        self, component: Any | None, method: Callable[[], Any], timeout: float | None
+    ) -> Any:
+        """Run ``method`` of ``component`` in the pool.
+
+        ``component`` may be None for class-level calls (e.g. batch methods),
+        which can't be cancelled but are still tracked once they time out.
+
+        Raises:
+            asyncio.TimeoutError: If the method did not return within ``timeout``
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="component"
+            )
+        future = self._executor.submit(method)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            if not future.cancel():
+                if component is not None:
+                    component.cancel()
+                self.timed_out += 1
+                self.runaway += 1
+                future.add_done_callback(self._on_runaway_done)
+            raise
+
+    def _on_runaway_done(self, future: Future) -> None:
+        self.runaway -= 1
+        self.reclaimed += 1
+
+    def stop(self) -> None:
+        """Shut the pool down without waiting for runaway threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool size and cancellation counters."""
+        return {
+            "workers": self.max_workers,
+            "timed_out": self.timed_out,
+            "runaway": self.runaway,
+            "reclaimed": self.reclaimed,
+        }
+
+
+def _set_cpu_limit(seconds: float) -> None:
+    """Let the worker use at most ``seconds`` more CPU time before SIGXCPU."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = usage.ru_utime + usage.ru_stime
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = math.ceil(used + seconds)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(
+    conn: Connection,
+    parent_sys_path: list[str],
+    modules: list[str],
+    memory_limit_mb: int,
+) -> None:
+    """Worker process loop: import the component modules, then run requests until told to stop."""
+    for path in reversed(parent_sys_path):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    for module_path in modules:
+        try:
+            importlib.import_module(module_path)
+        except Exception as e:
+            logging.getLogger(__name__).warning(
+                f"[EXECUTOR] Worker {os.getpid()} could not preload {module_path}: {e}"
+            )
+    if memory_limit_mb and resource is not None:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    from math_executor.buffers import resolve_handles
+    from math_executor.serialization import to_jsonable
+
+    classes: dict[tuple[str, str], type] = {}
+    conn.send(os.getpid())
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        module_path, class_name, method_name, parameters, cpu_limit = task
+        try:
+            if cpu_limit and resource is not None:
+                _set_cpu_limit(cpu_limit)
+            key = (module_path, class_name)
+            component_class = classes.get(key)
+            if component_class is None:
+                component_class = getattr(importlib.import_module(module_path), class_name)
+                classes[key] = component_class
+            if isinstance(parameters, list):
+                # A batch method, called on the class with every parameter set
+                results = getattr(component_class, method_name)(parameters)
+                reply = (
+                    True,
+                    None,
+                    [(type(result).__name__, to_jsonable(result)) for result in results],
+                )
+            else:
+                result = getattr(component_class(**resolve_handles(parameters)), method_name)()
+                reply = (True, type(result).__name__, to_jsonable(result))
+        except BaseException as e:
+            reply = (False, None, e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Unpicklable result or exception - report it by type and message
+            conn.send((False, None, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """A worker process and the parent's end of its pipe."""
+
+    def __init__(self, process: multiprocessing.Process, conn: Connection, generation: int = 0):
+        self.process = process
+        self.conn = conn
+        self.generation = generation
+
+
+class ProcessPoolBackend:
+    """Supervised pool of pre-warmed worker processes for CPU-bound component methods.
+
+    Workers are spawned (not forked, so they don't inherit the event loop's
+    threads) and import the component modules before taking work, so the first
+    request routed to a worker doesn't pay for the import. Each worker runs one
+    request at a time. A worker whose request is cancelled (e.g. timed out) or
+    that dies (e.g. on exceeding its CPU time limit) is killed and replaced by a
+    fresh one, so over-deadline work never keeps holding a slot. ``recycle()``
+    replaces every worker with one importing the current module sources, letting
+    busy workers finish their request first.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        modules: list[str] | None = None,
+        cpu_limit: float = 0.0,
+        memory_limit_mb: int = 0,
+    ):
+        """
+        Initialize the backend. Workers are started by ``start()`` or on first use.
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            modules: Component modules each worker imports on startup
+            cpu_limit: CPU seconds one request may use before its worker is killed (0 = no limit)
+            memory_limit_mb: Address space limit of each worker in MiB (0 = no limit)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.modules = list(modules or [])
+        self.cpu_limit = cpu_limit
+        self.memory_limit_mb = memory_limit_mb
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._starting: asyncio.Future | None = None
+        self._respawns: set[asyncio.Task] = set()
+        self._generation = 0
+        self.executed = 0
+        self.failed = 0
+        self.reclaimed = 0
+        self.recycled = 0
+        self.startup_time = 0.0
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, list(sys.path), self.modules, self.memory_limit_mb),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn, self._generation)
+        self._workers.append(worker)
+        return worker
+
+    def start(self) -> None:
+        """Start every worker and wait until each has imported the component modules.
+
+        This blocks until the workers are ready; from the event loop, call it with
+        ``asyncio.to_thread``. The pool is published only once it is filled, so no
+        coroutine waits on it while this thread is still adding workers.
+        """
+        if self._idle is not None:
+            return
+        start_time = time.perf_counter()
+        idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        workers = [self._spawn() for _ in range(self.max_workers)]
+        for worker in workers:
+            worker.conn.recv()
+            idle.put_nowait(worker)
+        self._idle = idle
+        self.startup_time = time.perf_counter() - start_time
+        logger.info(
+            f"[EXECUTOR] Started {self.max_workers} worker processes "
+            f"in {self.startup_time:.2f}s (preloaded: {', '.join(self.modules) or 'none'})"
+        )
+
+    async def run(
+        self,
+        module_path: str,
+        class_name: str,
+        method_name: str,
+        parameters: dict[str, Any],
+    ) -> tuple[str, Any]:
+        """Run a component method in a worker process.
+
+        Returns:
+            The result's type name and its JSON-ready value
+
+        Raises:
+            WorkerCrashedError: If the worker died while running the method
+        """
+        return await self._call(module_path, class_name, method_name, parameters)
+
+    async def run_batch(
+        self,
+        module_path: str,
+        class_name: str,
+        method_name: str,
+        parameter_sets: list[dict[str, Any]],
+    ) -> list[tuple[str, Any]]:
+        """Run a component's batch method (a classmethod) in a worker process.
+
+        Returns:
+            The type name and JSON-ready value of each result, in order
+
+        Raises:
+            WorkerCrashedError: If the worker died while running the method
+        """
+        _, results = await self._call(module_path, class_name, method_name, parameter_sets)
+        return results
+
+    async def _call(
+        self,
+        module_path: str,
+        class_name: str,
+        method_name: str,
+        parameters: dict[str, Any] | list[dict[str, Any]],
+    ) -> tuple[str | None, Any]:
+        if self._idle is None:
+            # Started on first use: spawn the workers off the event loop, once, and
+            # shielded so a caller timing out doesn't leave a half-started pool
+            if self._starting is None:
+                self._starting = asyncio.ensure_future(asyncio.to_thread(self.start))
+            await asyncio.shield(self._starting)
+        worker = await self._idle.get()
+        try:
+            worker.conn.send((module_path, class_name, method_name, parameters, self.cpu_limit))
+            ok, result_type, value = await self._receive(worker)
+        except BaseException:
+            # Cancelled (timed out) or crashed - the worker's state is unknown
+            self.failed += 1
+            self._reclaim(worker)
+            raise
+        if worker.generation == self._generation:
+            self._idle.put_nowait(worker)
+        else:
+            self._retire(worker)
+        if not ok:
+            self.failed += 1
+            raise value
+        self.executed += 1
+        return result_type, value
+
+    async def _receive(self, worker: _Worker) -> Any:
+        """Wait for the worker's next message without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = worker.conn.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            raise WorkerCrashedError(self._describe_exit(worker.process.exitcode)) from None
+
+    def _describe_exit(self, exitcode: int | None) -> str:
+        if resource is not None and exitcode == -getattr(resource, "SIGXCPU", 24):
+            return f"Worker exceeded the CPU time limit of {self.cpu_limit}s"
+        if exitcode is not None and exitcode < 0:
+            return f"Worker was killed by signal {-exitcode}"
+        return f"Worker exited with code {exitcode}"
+
+    def _reclaim(self, worker: _Worker) -> None:
+        """Kill a worker and start a replacement in the background."""
+        self.reclaimed += 1
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.conn.close()
+        self._workers.remove(worker)
+        logger.warning(
+            f"[EXECUTOR] Reclaimed worker {worker.process.pid}, starting a replacement"
+        )
+        task = asyncio.get_running_loop().create_task(self._respawn(worker))
+        self._respawns.add(task)
+        task.add_done_callback(self._respawns.discard)
+
+    async def recycle(self) -> None:
+        """Replace all workers so they import the current version of the component modules.
+
+        Idle workers are replaced right away; busy ones finish their request
+        on the old version and are replaced when they return.
+        """
+        if self._idle is None:
+            return
+        self._generation += 1
+        while not self._idle.empty():
+            self._retire(self._idle.get_nowait())
+        logger.info(f"[EXECUTOR] Recycling worker processes (generation {self._generation})")
+
+    def _retire(self, worker: _Worker) -> None:
+        """Stop an idle worker from an older generation and start a replacement."""
+        self.recycled += 1
+        try:
+            worker.conn.send(None)
+        except OSError:
+            worker.process.kill()
+        worker.conn.close()
+        self._workers.remove(worker)
+        task = asyncio.get_running_loop().create_task(self._respawn(worker))
+        self._respawns.add(task)
+        task.add_done_callback(self._respawns.discard)
+
+    async def _respawn(self, dead: _Worker) -> None:
+        await asyncio.to_thread(dead.process.join)
+        if self._idle is None:
+            return
+        worker = self._spawn()
+        try:
+            await self._receive(worker)
+        except WorkerCrashedError as e:
+            logger.error(f"[EXECUTOR] Replacement worker failed to start: {e}")
+            self._workers.remove(worker)
+            return
+        if worker.generation != self._generation:
+            # Recycled while starting up - it may have imported the old sources
+            self._retire(worker)
+            return
+        self._idle.put_nowait(worker)
+
+    def stop(self) -> None:
+        """Stop all workers, killing any that are still running a request."""
+        for task in self._respawns:
+            task.cancel()
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+        self._workers = []
+        self._idle = None
+        self._starting = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool size, limits and counters."""
+        return {
+            "running": self._idle is not None,
+            "workers": self.max_workers,
+            "alive": sum(worker.process.is_alive() for worker in self._workers),
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "preloaded_modules": self.modules,
+            "cpu_limit": self.cpu_limit,
+            "memory_limit_mb": self.memory_limit_mb,
+            "startup_time": self.startup_time,
+            "executed": self.executed,
+            "failed": self.failed,
+            "reclaimed": self.reclaimed,
+            "generation": self._generation,
+            "recycled": self.recycled,
+        }
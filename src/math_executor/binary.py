@@ -0,0 +1,187 @@
+"""Binary msgpack encoding of execution requests and results.
+
+Maps, lists and scalars are plain msgpack. Numeric arrays (``numpy.ndarray``,
+``array.array``, memoryviews) are written as msgpack extension type 1 holding
+the raw little-endian buffer behind a small header::
+
+    typecode (1 byte, struct format char) | ndim (1 byte) | shape (ndim x uint64 LE) | data
+
+Decoded arrays wrap the extension payload without converting or copying the
+elements: a read-only ``numpy.ndarray`` when NumPy is installed, otherwise a
+typed memoryview. Requires the optional ``msgpack`` package.
+"""
+
+import logging
+import struct
+import sys
+from array import array
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_AVAILABLE = msgpack is not None
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+ARRAY_EXT_TYPE = 1
+
+# (kind, itemsize) -> portable struct format char of the element type
+_TYPECODES = {
+    ("b", 1): "?",
+    ("i", 1): "b",
+    ("i", 2): "h",
+    ("i", 4): "i",
+    ("i", 8): "q",
+    ("u", 1): "B",
+    ("u", 2): "H",
+    ("u", 4): "I",
+    ("u", 8): "Q",
+    ("f", 4): "f",
+    ("f", 8): "d",
+}
+_FORMAT_KINDS = {
+    "?": "b",
+    **dict.fromkeys("bhilq", "i"),
+    **dict.fromkeys("BHILQ", "u"),
+    "f": "f",
+    "d": "f",
+}
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """Return True if a Content-Type header names msgpack."""
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in _MSGPACK_MEDIA_TYPES
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+    """Return True if an Accept header asks for msgpack and msgpack is installed."""
+    if not accept or not MSGPACK_AVAILABLE:
+        return False
+    return any(is_msgpack(media_range) for media_range in accept.split(","))
+
+
+def looks_like_msgpack(payload: bytes) -> bool:
+    """Return True if a payload starts with a msgpack map rather than a JSON object."""
+    return bool(payload) and (0x80 <= payload[0] <= 0x8F or payload[0] in (0xDE, 0xDF))
+
+
+def packb(value: Any) -> bytes:
+    """Encode a JSON-ready value (numeric arrays included) as msgpack.
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(_wrap_memoryviews(value), default=_pack_default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode msgpack, wrapping typed array extensions without copying their elements.
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+        ValueError: If ``data`` is not valid msgpack
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    try:
+        return msgpack.unpackb(data, ext_hook=_unpack_ext, raw=False)
+    except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as e:
+        raise ValueError(f"Invalid msgpack payload: {e}") from e
+
+
+def _wrap_memoryviews(value: Any) -> Any:
+    """Replace memoryviews by typed array extensions (msgpack would write them as raw bytes)."""
+    if isinstance(value, memoryview):
+        return _pack_buffer(value)
+    if isinstance(value, dict):
+        return {key: _wrap_memoryviews(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and any(
+        isinstance(item, (memoryview, dict, list, tuple)) for item in value
+    ):
+        return [_wrap_memoryviews(item) for item in value]
+    return value
+
+
+def _pack_default(value: Any) -> Any:
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            return _pack_ndarray(value)
+        if isinstance(value, np.generic):
+            return value.item()
+    if isinstance(value, array):
+        return _pack_buffer(memoryview(value))
+    return str(value)
+
+
+def _pack_ndarray(value: Any) -> Any:
+    typecode = _TYPECODES.get((value.dtype.kind, value.dtype.itemsize))
+    if typecode is None:
+        return value.tolist()
+    little_endian = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<"))
+    return _array_ext(typecode, value.shape, little_endian.tobytes())
+
+
+def _pack_buffer(view: memoryview) -> Any:
+    element_format = view.format.lstrip("@=")
+    typecode = _TYPECODES.get((_FORMAT_KINDS.get(element_format), view.itemsize))
+    if typecode is None:
+        return view.tolist()
+    data = view.tobytes()
+    if sys.byteorder == "big" and view.itemsize > 1:
+        swapped = array(element_format, data)
+        swapped.byteswap()
+        data = swapped.tobytes()
+    return _array_ext(typecode, view.shape, data)
+
+
+def _array_ext(typecode: str, shape: tuple[int, ...], data: bytes) -> Any:
+    header = struct.pack(f"<cB{len(shape)}Q", typecode.encode(), len(shape), *shape)
+    return msgpack.ExtType(ARRAY_EXT_TYPE, header + data)
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code != ARRAY_EXT_TYPE:
+        return msgpack.ExtType(code, data)
+    try:
+        typecode = chr(data[0])
+        ndim = data[1]
+        shape = struct.unpack_from(f"<{ndim}Q", data, 2)
+    except (IndexError, struct.error) as e:
+        raise ValueError(f"Truncated typed array header: {e}") from e
+    if (_FORMAT_KINDS.get(typecode), struct.calcsize(typecode)) not in _TYPECODES:
+        raise ValueError(f"Unsupported typed array element type '{typecode}'")
+    offset = 2 + 8 * ndim
+
+    if np is not None:
+        dtype = np.dtype(typecode).newbyteorder("<")
+        try:
+            return np.frombuffer(data, dtype=dtype, offset=offset).reshape(shape)
+        except ValueError as e:
+            raise ValueError(f"Typed array data does not match its shape {shape}: {e}") from e
+
+    view = memoryview(data)[offset:]
+    if sys.byteorder == "big" and struct.calcsize(typecode) > 1:
+        swapped = array(typecode, view)
+        swapped.byteswap()
+        view = memoryview(swapped).cast("B")
+    try:
+        if ndim == 1 or 0 in shape:
+            # memoryview can't cast to shapes with a zero dimension
+            return view.cast(typecode)
+        return view.cast(typecode, shape)
+    except TypeError as e:
+        raise ValueError(f"Typed array data does not match its shape {shape}: {e}") from e
@@ -0,0 +1,217 @@
+"""Numeric operands and outputs passed by handle to memory-mapped files or shared memory.
+
+A parameter value of the form ``{"$buffer": {...}}`` references a buffer that
+the node memory-maps read-only instead of receiving its contents in the request::
+
+    {"$buffer": {"path": "/data/x.f64", "dtype": "float64", "shape": [1000000], "offset": 0}}
+    {"$buffer": {"shm": "x", "dtype": "float64"}}
+
+``shm`` names a POSIX shared-memory segment (``/dev/shm/<name>``). ``shape``
+defaults to the rest of the file after ``offset`` as a flat array. Only files
+under the directories listed in ``BUFFER_HANDLE_DIRS`` (``os.pathsep``
+separated; empty disables handles) may be mapped, and ``/dev/shm`` must be
+listed for shared-memory segments.
+
+Operands are exposed as read-only NumPy arrays over the mapping when NumPy is
+installed, and as typed memoryviews otherwise, so nothing is parsed or copied
+up front; pages are read on demand by the kernel.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+HANDLE_KEY = "$buffer"
+SHM_DIR = "/dev/shm"
+
+# Directories whose files may be mapped (resolved, so symlinks can't escape them)
+ALLOWED_DIRS = [
+    os.path.realpath(path)
+    for path in os.getenv("BUFFER_HANDLE_DIRS", "").split(os.pathsep)
+    if path
+]
+
+DTYPES = {
+    "bool": "?",
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+    "float32": "f",
+    "float64": "d",
+}
+
+
+class BufferHandleError(ValueError):
+    """A buffer handle is malformed, outside the allowed directories, or doesn't fit its file."""
+
+
+def is_handle(value: Any) -> bool:
+    """Return True if a parameter value references a buffer by handle."""
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(HANDLE_KEY), dict)
+
+
+def has_handles(parameters: dict[str, Any]) -> bool:
+    """Return True if any parameter references a buffer by handle."""
+    return any(is_handle(value) for value in parameters.values())
+
+
+def resolve_handles(parameters: dict[str, Any]) -> dict[str, Any]:
+    """Replace every handle parameter by a read-only view of the buffer it references.
+
+    Raises:
+        BufferHandleError: If a handle is invalid
+    """
+    if not has_handles(parameters):
+        return parameters
+    return {
+        name: open_buffer(value[HANDLE_KEY]) if is_handle(value) else value
+        for name, value in parameters.items()
+    }
+
+
+def open_buffer(handle: dict[str, Any], writable: bool = False) -> Any:
+    """Memory-map the buffer described by ``handle``.
+
+    Args:
+        handle: ``path`` or ``shm``, plus optional ``dtype`` (default float64),
+            ``shape`` and ``offset`` in bytes
+        writable: Map the file for writing (changes are visible to other mappers)
+
+    Returns:
+        A NumPy array over the mapping, or a typed memoryview without NumPy
+
+    Raises:
+        BufferHandleError: If the handle is invalid
+    """
+    path = _handle_path(handle)
+    typecode = DTYPES.get(handle.get("dtype", "float64"))
+    if typecode is None:
+        raise BufferHandleError(
+            f"Unsupported dtype '{handle.get('dtype')}', expected one of {list(DTYPES)}"
+        )
+    itemsize = struct.calcsize(typecode)
+    offset = handle.get("offset", 0)
+    if not isinstance(offset, int) or offset < 0:
+        raise BufferHandleError(f"Invalid offset {offset!r}")
+
+    try:
+        with open(path, "r+b" if writable else "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            shape = _handle_shape(handle, size - offset, itemsize)
+            nbytes = itemsize * _product(shape)
+            if offset + nbytes > size:
+                raise BufferHandleError(
+                    f"{path} holds {size} bytes, the handle needs {offset + nbytes}"
+                )
+            if nbytes == 0:
+                return np.empty(shape, dtype=typecode) if np is not None else _empty(typecode)
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            mapping = mmap.mmap(f.fileno(), 0, access=access)
+    except OSError as e:
+        raise BufferHandleError(f"Cannot map {path}: {e}") from e
+
+    # The mapping stays open for as long as the returned view references it
+    if np is not None:
+        view = np.frombuffer(mapping, dtype=typecode, count=_product(shape), offset=offset)
+        return view.reshape(shape)
+    view = memoryview(mapping)[offset : offset + nbytes]
+    return view.cast(typecode) if len(shape) == 1 else view.cast(typecode, shape)
+
+
+def write_buffer(handle: dict[str, Any], value: Any) -> int:
+    """Copy an array result into the caller-provided buffer described by ``handle``.
+
+    Args:
+        handle: The output buffer, as for ``open_buffer``
+        value: Numeric array (or sequence) with as many elements as the buffer
+
+    Returns:
+        The number of elements written
+
+    Raises:
+        BufferHandleError: If the handle is invalid or the value doesn't match its size
+    """
+    target = open_buffer(handle, writable=True)
+    if np is not None:
+        source = np.asarray(value)
+        if source.size != target.size:
+            raise BufferHandleError(
+                f"Result has {source.size} elements, the output buffer holds {target.size}"
+            )
+        np.copyto(target, source.reshape(target.shape), casting="unsafe")
+        return int(source.size)
+
+    flat = target.cast("B").cast(target.format) if target.ndim > 1 else target
+    source = memoryview(value).tolist() if isinstance(value, memoryview) else value
+    try:
+        items = array(target.format, _flatten(source))
+    except TypeError as e:
+        raise BufferHandleError(f"Result is not a numeric array: {e}") from e
+    if len(items) != len(flat):
+        raise BufferHandleError(
+            f"Result has {len(items)} elements, the output buffer holds {len(flat)}"
+        )
+    flat[:] = memoryview(items)
+    return len(items)
+
+
+def describe(handle: dict[str, Any], written: int) -> dict[str, Any]:
+    """Return the handle returned in place of a result written to an output buffer."""
+    return {HANDLE_KEY: {**handle, "written": written}}
+
+
+def _handle_path(handle: dict[str, Any]) -> str:
+    if "shm" in handle:
+        name = handle["shm"]
+        if not isinstance(name, str) or not name.strip("/") or "/" in name.strip("/"):
+            raise BufferHandleError(f"Invalid shared memory name {name!r}")
+        path = os.path.join(SHM_DIR, name.strip("/"))
+    elif isinstance(handle.get("path"), str):
+        path = handle["path"]
+    else:
+        raise BufferHandleError("A buffer handle needs a 'path' or an 'shm' name")
+
+    real_path = os.path.realpath(path)
+    if not any(os.path.commonpath([real_path, allowed]) == allowed for allowed in ALLOWED_DIRS):
+        raise BufferHandleError(
+            f"{path} is not under a directory allowed by BUFFER_HANDLE_DIRS"
+        )
+    return real_path
+
+
+def _handle_shape(handle: dict[str, Any], available: int, itemsize: int) -> tuple[int, ...]:
+    shape = handle.get("shape")
+    if shape is None:
+        return (max(available, 0) // itemsize,)
+    if not isinstance(shape, list) or not all(isinstance(n, int) and n >= 0 for n in shape):
+        raise BufferHandleError(f"Invalid shape {shape!r}")
+    return tuple(shape)
+
+
+def _product(shape: tuple[int, ...]) -> int:
+    count = 1
+    for n in shape:
+        count *= n
+    return count
+
+
+def _empty(typecode: str) -> memoryview:
+    return memoryview(b"").cast(typecode)
+
+
+def _flatten(value: Any) -> Any:
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (list, tuple)):
+        return [item for row in value for item in _flatten(row)]
+    return value
@@ -0,0 +1,174 @@
+"""Content-addressed cache of component classes built from ``component_code``."""
+
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentClassCache:
+    """Bounded LRU cache of component classes keyed by a hash of (code, class name).
+
+    Compiling submitted code and building the pydantic model class is by far the
+    most expensive part of a ``component_code`` execution, so classes are cached in
+    memory. When ``bytecode_dir`` is set, the compiled module code is also written to
+    disk so a restarted node can skip compilation for code it has already seen.
+    """
+
+    def __init__(self, max_size: int = 128, bytecode_dir: str | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of classes kept in memory (0 disables caching)
+            bytecode_dir: Optional directory for the on-disk bytecode store
+        """
+        self.max_size = max_size
+        self.bytecode_dir = bytecode_dir
+        self._entries: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytecode_hits = 0
+        self.bytecode_writes = 0
+
+        if self.bytecode_dir:
+            os.makedirs(self.bytecode_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(component_code: str, component_class: str) -> str:
+        """Return the content hash identifying a (code, class name) pair."""
+        digest = hashlib.sha256()
+        digest.update(component_class.encode())
+        digest.update(b"\0")
+        digest.update(component_code.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> type | None:
+        """Return the cached class for ``key`` and mark it as recently used."""
+        with self._lock:
+            component_class = self._entries.get(key)
+            if component_class is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return component_class
+
+    def put(self, key: str, component_class: type) -> None:
+        """Store a class, evicting the least recently used entries past ``max_size``."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = component_class
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logger.debug(f"Evicted component class {evicted_key[:12]} from cache")
+
+    def load(self, component_code: str, component_class: str, namespace: dict[str, Any]) -> type:
+        """Return the class defined by ``component_code``, compiling it on a cache miss.
+
+        Raises:
+            ValueError: If the class is not defined by the code
+        """
+        key = self.make_key(component_code, component_class)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        code_obj = self._compile(key, component_code)
+        exec(code_obj, namespace)
+        component_class_obj = namespace.get(component_class)
+        if not component_class_obj:
+            raise ValueError(f"Component class {component_class} not found in provided code")
+
+        self.put(key, component_class_obj)
+        return component_class_obj
+
+    def _compile(self, key: str, component_code: str) -> CodeType:
+        """Compile code, reusing the on-disk bytecode store when configured."""
+        code_obj = self._read_bytecode(key)
+        if code_obj is not None:
+            return code_obj
+
+        code_obj = compile(component_code, f"<component_code:{key[:12]}>", "exec")
+        self._write_bytecode(key, code_obj)
+        return code_obj
+
+    def _bytecode_path(self, key: str) -> str:
+        return os.path.join(self.bytecode_dir, f"{key}.bin")
+
+    def _read_bytecode(self, key: str) -> CodeType | None:
+        if not self.bytecode_dir:
+            return None
+        path = self._bytecode_path(key)
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read cached bytecode {path}: {e}")
+            return None
+
+        magic = importlib.util.MAGIC_NUMBER
+        if not raw.startswith(magic):
+            # Written by a different interpreter version - recompile and overwrite
+            return None
+        try:
+            code_obj = marshal.loads(raw[len(magic):])
+        except (EOFError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding corrupt cached bytecode {path}: {e}")
+            return None
+
+        with self._lock:
+            self.bytecode_hits += 1
+        return code_obj
+
+    def _write_bytecode(self, key: str, code_obj: CodeType) -> None:
+        if not self.bytecode_dir:
+            return
+        path = self._bytecode_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(importlib.util.MAGIC_NUMBER)
+                f.write(marshal.dumps(code_obj))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached bytecode {path}: {e}")
+            return
+
+        with self._lock:
+            self.bytecode_writes += 1
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the bytecode store is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "bytecode_dir": self.bytecode_dir,
+                "bytecode_hits": self.bytecode_hits,
+                "bytecode_writes": self.bytecode_writes,
+            }
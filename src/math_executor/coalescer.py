@@ -0,0 +1,152 @@
+"""Micro-batching of concurrent executions into one batched component call."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the batch-size histogram buckets
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+# Runs a batch of parameter sets within a timeout (seconds, None = unbounded)
+BatchFunction = Callable[[list[dict[str, Any]], float | None], Awaitable[list[Any]]]
+
+
+class _PendingBatch:
+    """Requests collected for one (class, method) key that have not run yet."""
+
+    def __init__(self, batch_fn: BatchFunction):
+        self.batch_fn = batch_fn
+        self.parameter_sets: list[dict[str, Any]] = []
+        self.futures: list[asyncio.Future] = []
+        self.timer: asyncio.TimerHandle | None = None
+        # Loop time by which the last request of the batch gives up (None = never)
+        self.deadline: float | None = None
+
+
+class RequestCoalescer:
+    """Collects same-class, same-method requests and runs them as one batch.
+
+    A batch is flushed when it reaches ``max_batch_size`` or when its oldest
+    request has waited ``window_ms``, so batch sizes follow the arrival rate:
+    under light load requests run (almost) alone, under heavy load they are
+    merged into large vectorized calls. The batch function decides where the
+    batch runs (e.g. on the component's execution backend); it is given the
+    time left until the last request of the batch times out.
+    """
+
+    def __init__(self, window_ms: float = 2.0, max_batch_size: int = 256):
+        """
+        Initialize the coalescer.
+
+        Args:
+            window_ms: Maximum time a request waits for others to join its batch
+            max_batch_size: Batch size that triggers an immediate flush
+        """
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: dict[Hashable, _PendingBatch] = {}
+        self._running: set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+        self.max_observed_batch_size = 0
+        self.batch_size_histogram: dict[int | None, int] = defaultdict(int)
+
+    async def submit(
+        self,
+        key: Hashable,
+        batch_fn: BatchFunction,
+        parameters: dict[str, Any],
+        timeout: float | None = None,
+    ) -> Any:
+        """Queue one parameter set and wait for its result.
+
+        Args:
+            key: Identifies requests that may share a batch (e.g. class and method)
+            batch_fn: Coroutine function computing results for a list of parameter
+                sets within a timeout
+            parameters: Parameters of this request
+            timeout: Seconds this request may wait for its result (None = unbounded)
+
+        Returns:
+            The result for ``parameters``
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingBatch(batch_fn)
+            pending.timer = loop.call_later(self.window, self._flush, key)
+            pending.deadline = None if timeout is None else loop.time() + timeout
+        elif pending.deadline is not None:
+            pending.deadline = None if timeout is None else max(
+                pending.deadline, loop.time() + timeout
+            )
+
+        future = loop.create_future()
+        pending.parameter_sets.append(parameters)
+        pending.futures.append(future)
+
+        if len(pending.futures) >= self.max_batch_size:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        """Detach the pending batch for ``key`` and start running it."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        size = len(pending.futures)
+        self.batches += 1
+        self.items += size
+        self.max_observed_batch_size = max(self.max_observed_batch_size, size)
+        bucket = next((b for b in BATCH_SIZE_BUCKETS if size <= b), None)
+        self.batch_size_histogram[bucket] += 1
+
+        task = asyncio.get_running_loop().create_task(self._run(pending))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, pending: _PendingBatch) -> None:
+        try:
+            timeout = pending.deadline
+            if timeout is not None:
+                timeout = max(timeout - asyncio.get_running_loop().time(), 0.0)
+            results = await pending.batch_fn(pending.parameter_sets, timeout)
+            if len(results) != len(pending.futures):
+                raise RuntimeError(
+                    f"Batch method returned {len(results)} results "
+                    f"for {len(pending.futures)} requests"
+                )
+        except Exception as e:
+            logger.error(f"Coalesced batch of {len(pending.futures)} failed: {e}", exc_info=True)
+            for future in pending.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(pending.futures, results):
+            # Requests that timed out while waiting have already been cancelled
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict[str, Any]:
+        """Return batching counters."""
+        return {
+            "window_ms": self.window * 1000.0,
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "items": self.items,
+            "average_batch_size": self.items / self.batches if self.batches else 0.0,
+            "max_observed_batch_size": self.max_observed_batch_size,
+            "batch_size_histogram": {
+                f"le_{bucket or 'inf'}": self.batch_size_histogram.get(bucket, 0)
+                for bucket in (*BATCH_SIZE_BUCKETS, None)
+            },
+        }
@@ -0,0 +1,102 @@
+"""Background-managed NATS connection."""
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class NATSConnectionManager:
+    """Owns the node's NATS client and (re)connects it in the background.
+
+    ``get()`` never blocks: it returns the client while it is connected and
+    otherwise returns None after making sure a reconnect loop with exponential
+    backoff is running. Callers fall back (e.g. to the outbox) instead of
+    waiting on a connection attempt.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            client_factory: Returns a new, unconnected NATSClient
+            initial_backoff: Delay before the first retry in seconds
+            max_backoff: Upper bound of the retry delay in seconds
+        """
+        self.client_factory = client_factory
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._client: Any | None = None
+        self._task: asyncio.Task | None = None
+        self.connects = 0
+        self.failed_attempts = 0
+
+    def get(self) -> Any | None:
+        """Return the connected client, or None while (re)connecting."""
+        client = self._client
+        if client is not None and client.nc is not None:
+            if client.nc.is_connected:
+                return client
+            if not client.nc.is_closed:
+                # The client library is reconnecting on its own
+                return None
+            # The client library gave up - start over with a fresh client
+            self._client = None
+        self.ensure_connecting()
+        return None
+
+    def ensure_connecting(self) -> None:
+        """Start the background connect loop unless connected or already connecting."""
+        if self._client is not None or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._connect_loop())
+
+    async def _connect_loop(self) -> None:
+        delay = self.initial_backoff
+        while True:
+            client = self.client_factory()
+            try:
+                await client.connect()
+            except Exception as e:
+                self.failed_attempts += 1
+                logger.warning(
+                    f"[NATS] ❌ Failed to connect to NATS (non-critical), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+                continue
+            self._client = client
+            self.connects += 1
+            logger.info("[NATS] ✅ Successfully connected to NATS")
+            return
+
+    async def close(self) -> None:
+        """Stop reconnecting and close the client."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection state and counters."""
+        client = self._client
+        return {
+            "connected": bool(client and client.nc and client.nc.is_connected),
+            "connecting": self._task is not None and not self._task.done(),
+            "connects": self.connects,
+            "failed_attempts": self.failed_attempts,
+        }
@@ -0,0 +1,107 @@
+"""Validation and ordering of component graphs executed in a single request."""
+
+from collections import defaultdict, deque
+from typing import Any, Iterable
+
+
+class GraphError(ValueError):
+    """The submitted graph is invalid (unknown node, duplicate id, cycle, bad output)."""
+
+
+def topological_order(
+    node_ids: Iterable[str],
+    edges: Iterable[tuple[str, str]],
+) -> tuple[list[str], dict[str, set[str]]]:
+    """Order the nodes of a graph so every node comes after its predecessors.
+
+    Args:
+        node_ids: Identifiers of the graph's nodes
+        edges: (source, target) pairs
+
+    Returns:
+        The node ids in topological order and each node's set of predecessors
+
+    Raises:
+        GraphError: If an id is duplicated, an edge references an unknown node,
+            or the graph has a cycle
+    """
+    node_ids = list(node_ids)
+    if len(set(node_ids)) != len(node_ids):
+        raise GraphError("Node ids must be unique")
+
+    predecessors: dict[str, set[str]] = {node_id: set() for node_id in node_ids}
+    successors: dict[str, set[str]] = defaultdict(set)
+    for source, target in edges:
+        for node_id in (source, target):
+            if node_id not in predecessors:
+                raise GraphError(f"Edge references unknown node '{node_id}'")
+        predecessors[target].add(source)
+        successors[source].add(target)
+
+    # Kahn's algorithm, keeping the submitted order among ready nodes
+    remaining = {node_id: len(sources) for node_id, sources in predecessors.items()}
+    ready = deque(node_id for node_id in node_ids if not remaining[node_id])
+    order = []
+    while ready:
+        node_id = ready.popleft()
+        order.append(node_id)
+        for target in sorted(successors[node_id], key=node_ids.index):
+            remaining[target] -= 1
+            if not remaining[target]:
+                ready.append(target)
+    if len(order) != len(node_ids):
+        cyclic = sorted(node_id for node_id, count in remaining.items() if count)
+        raise GraphError(f"Graph has a cycle through nodes {cyclic}")
+    return order, predecessors
+
+
+def resolve_output_method(component_class: type, output_name: str) -> str:
+    """Return the method computing the component output named ``output_name``.
+
+    Raises:
+        GraphError: If the component has no such output
+    """
+    for output in _class_outputs(component_class):
+        if output.name == output_name and output.method:
+            return output.method
+    raise GraphError(f"Component {component_class.__name__} has no output '{output_name}'")
+
+
+def default_method(component_class: type) -> str:
+    """Return the method of the component's first output.
+
+    Raises:
+        GraphError: If the component declares no output method
+    """
+    for output in _class_outputs(component_class):
+        if output.method:
+            return output.method
+    raise GraphError(f"Component {component_class.__name__} declares no output method")
+
+
+def extract_value(result: Any, key: str | None) -> Any:
+    """Select the part of an upstream result fed into a downstream input.
+
+    Args:
+        result: The upstream result, as returned by its method (or in its
+            JSON-ready form when it ran in a worker process)
+        key: Key within the result's data (``Data.data`` or a dict), or None for
+            the whole result
+
+    Raises:
+        GraphError: If the result has no such key
+    """
+    if key is None:
+        return result
+    data = getattr(result, "data", result)
+    if isinstance(data, dict) and isinstance(data.get("data"), dict) and key not in data:
+        # JSON-ready form of a Data result
+        data = data["data"]
+    if not isinstance(data, dict) or key not in data:
+        raise GraphError(f"Upstream result has no key '{key}'")
+    return data[key]
+
+
+def _class_outputs(component_class: type) -> list:
+    field = getattr(component_class, "model_fields", {}).get("outputs")
+    return list(field.default or []) if field is not None else []
@@ -0,0 +1,129 @@
+"""Memoization of encoded results of pure components."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Bounded LRU/TTL cache of already-encoded results, for components declared ``pure``.
+
+    Entries are keyed by a hash of (module, class, code, method, canonicalized
+    parameters) and hold the result's type name, its JSON-ready value and its
+    encoded bytes, so a hit skips instantiation, execution and serialization.
+    The cache is bounded both by entry count and by the total size of the
+    encoded results; entries older than ``ttl`` are treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept (0 disables caching)
+            max_bytes: Maximum total size of the encoded results kept
+            ttl: Seconds a result stays valid (0 = until evicted)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str, Any, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.oversized = 0
+
+    @staticmethod
+    def make_key(
+        module_path: str,
+        component_class: str,
+        component_code: str | None,
+        method_name: str,
+        parameters: dict[str, Any],
+    ) -> str | None:
+        """Return the cache key of an execution, or None if its parameters aren't plain JSON."""
+        try:
+            canonical = json.dumps(
+                [module_path, component_class, component_code, method_name, parameters],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[str, Any, bytes] | None:
+        """Return (result type, JSON-ready result, encoded result) for ``key``, if cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, result_type, result, result_json = entry
+            if self.ttl and time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result_type, result, result_json
+
+    def put(self, key: str, result_type: str, result: Any, result_json: bytes) -> None:
+        """Store an encoded result, evicting least recently used entries past the limits."""
+        if self.max_entries <= 0:
+            return
+        if len(result_json) > self.max_bytes:
+            self.oversized += 1
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), result_type, result, result_json)
+            self.bytes += len(result_json)
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._remove(evicted_key)
+                self.evictions += 1
+                logger.debug(f"Evicted result {evicted_key[:12]} from cache")
+
+    def _remove(self, key: str) -> None:
+        _, _, _, result_json = self._entries.pop(key)
+        self.bytes -= len(result_json)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache size and counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "oversized": self.oversized,
+        }
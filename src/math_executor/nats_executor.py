@@ -0,0 +1,193 @@
+"""NATS-native execution of ExecutionRequest payloads alongside the HTTP API."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from nats.aio.msg import Msg
+from nats.errors import TimeoutError as NATSTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Reconnect delays while waiting for NATS to become available at startup
+_CONNECT_BACKOFF_INITIAL = 1.0
+_CONNECT_BACKOFF_MAX = 30.0
+
+# Seconds between checks whether the subscribed client was closed or replaced
+_CLIENT_CHECK_INTERVAL = 1.0
+
+
+class NATSExecutor:
+    """Receives execution requests over NATS and runs them with bounded concurrency.
+
+    Two modes are supported:
+
+    - ``core``: subscribe to ``subject`` in a queue group, so every node replica
+      in the group shares the load. Requests sent with ``nc.request`` get the
+      encoded ``ExecutionResponse`` as reply.
+    - ``pull``: run a durable JetStream pull consumer on the work-queue stream.
+      Messages are acked once executed; results go out on their ``stream_topic``.
+
+    When the client it subscribed with is closed or replaced by a new
+    connection, the executor subscribes again on the new client.
+    """
+
+    def __init__(
+        self,
+        get_client: Callable[[], Awaitable[Any]],
+        handle: Callable[[bytes], Awaitable[bytes]],
+        subject: str,
+        mode: str = "core",
+        queue_group: str = "math-executor",
+        durable: str = "math-executor",
+        max_concurrency: int = 16,
+        fetch_batch: int | None = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            get_client: Coroutine returning a connected NATSClient (or None)
+            handle: Coroutine that executes an encoded request and returns the encoded response
+            subject: Subject requests are received on
+            mode: "core" (queue-group subscription) or "pull" (JetStream pull consumer)
+            queue_group: Queue group name in core mode
+            durable: Durable consumer name in pull mode
+            max_concurrency: Maximum requests executing at the same time
+            fetch_batch: Messages fetched per pull (defaults to max_concurrency)
+        """
+        if mode not in ("core", "pull"):
+            raise ValueError(f"Unknown NATS execution mode '{mode}', expected 'core' or 'pull'")
+        self.get_client = get_client
+        self.handle = handle
+        self.subject = subject
+        self.mode = mode
+        self.queue_group = queue_group
+        self.durable = durable
+        self.max_concurrency = max(max_concurrency, 1)
+        self.fetch_batch = fetch_batch or self.max_concurrency
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self.received = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start receiving requests in the background."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop receiving requests and wait for in-flight executions."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            client = await self._wait_for_client()
+            consume = self._consume_pull if self.mode == "pull" else self._consume_core
+            consumer = asyncio.get_running_loop().create_task(consume(client))
+            try:
+                while not consumer.done() and not await self._client_lost(client):
+                    await asyncio.wait({consumer}, timeout=_CLIENT_CHECK_INTERVAL)
+            finally:
+                consumer.cancel()
+                await asyncio.gather(consumer, return_exceptions=True)
+            if not consumer.cancelled() and consumer.exception() is not None:
+                logger.warning(f"[NATS] Executor subscription failed: {consumer.exception()}")
+                await asyncio.sleep(_CONNECT_BACKOFF_INITIAL)
+            logger.info(f"[NATS] Executor resubscribing to {self.subject}")
+
+    async def _client_lost(self, client: Any) -> bool:
+        """Return whether ``client`` was closed or the connection replaced it."""
+        if client.nc is None or client.nc.is_closed:
+            return True
+        current = await self.get_client()
+        return current is not None and current is not client
+
+    async def _wait_for_client(self) -> Any:
+        delay = _CONNECT_BACKOFF_INITIAL
+        while True:
+            client = await self.get_client()
+            if client is not None:
+                return client
+            logger.warning(f"[NATS] Executor waiting for NATS, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _CONNECT_BACKOFF_MAX)
+
+    async def _consume_core(self, client: Any) -> None:
+        async def on_message(msg: Msg) -> None:
+            # Waiting here applies backpressure to the subscription's pending queue
+            await self._semaphore.acquire()
+            self._spawn(self._process(msg, ack=False))
+
+        sub = await client.nc.subscribe(self.subject, queue=self.queue_group, cb=on_message)
+        logger.info(f"[NATS] Executing requests from {self.subject} (queue: {self.queue_group})")
+        try:
+            await asyncio.Future()
+        finally:
+            if not client.nc.is_closed:
+                await sub.unsubscribe()
+
+    async def _consume_pull(self, client: Any) -> None:
+        psub = await client.js.pull_subscribe(
+            self.subject, durable=self.durable, stream=client.stream_name
+        )
+        logger.info(
+            f"[NATS] Executing requests from {self.subject} "
+            f"(stream: {client.stream_name}, durable: {self.durable})"
+        )
+        while True:
+            try:
+                messages = await psub.fetch(self.fetch_batch, timeout=1.0)
+            except NATSTimeoutError:
+                continue
+            except Exception as e:
+                logger.warning(f"[NATS] Pull consumer fetch failed: {e}")
+                await asyncio.sleep(_CONNECT_BACKOFF_INITIAL)
+                continue
+            for msg in messages:
+                await self._semaphore.acquire()
+                self._spawn(self._process(msg, ack=True))
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _process(self, msg: Msg, ack: bool) -> None:
+        self.received += 1
+        try:
+            response = await self.handle(msg.data)
+            if ack:
+                await msg.ack()
+            elif msg.reply:
+                await msg.respond(response)
+            self.completed += 1
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"[NATS] Failed to execute request from {msg.subject}: {e}", exc_info=True)
+            if ack:
+                await msg.nak()
+        finally:
+            self._semaphore.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Return executor counters."""
+        return {
+            "mode": self.mode,
+            "subject": self.subject,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": len(self._inflight),
+            "received": self.received,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
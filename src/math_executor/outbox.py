@@ -0,0 +1,269 @@
+"""Disk-backed outbox for results that could not be published to NATS."""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+# Publishes (subject, data) pairs, returning one error (or None) per pair
+PublishMany = Callable[[list[tuple[str, dict[str, Any]]]], Awaitable[list[Exception | None]]]
+
+# A spooled result: (subject, message_id, data)
+_Record = tuple[str, str | None, dict[str, Any] | bytes]
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+
+
+class Outbox:
+    """Append-only outbox of unpublished results, stored as JSON-lines segment files.
+
+    Each record holds the subject, the payload and its ``message_id``. Records are
+    appended to the active segment, which is rolled once it exceeds
+    ``segment_max_bytes``. Draining rolls the active segment, publishes every
+    closed segment in bulk and deletes segments once all of their records were
+    acked. When the same ``message_id`` was spooled more than once within a
+    segment, only its latest record is published. Already-encoded payloads
+    (JSON or msgpack bytes) are stored base64-encoded and restored as bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+    ):
+        """
+        Initialize the outbox, picking up segments left by a previous process.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_max_bytes: Size at which the active segment is rolled
+            fsync: "always" (fsync every append), "interval" (at most every
+                ``fsync_interval`` seconds) or "never" (leave it to the OS)
+            fsync_interval: Seconds between fsyncs with the "interval" policy
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {FSYNC_POLICIES}")
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._active = None
+        self._active_path: str | None = None
+        self._last_fsync = 0.0
+        self._draining = False
+
+        os.makedirs(self.directory, exist_ok=True)
+        segments = self._segments()
+        self._next_segment = self._segment_number(segments[-1]) + 1 if segments else 0
+        self.pending = sum(self._count_records(path) for path in segments)
+        self.appended = 0
+        self.drained = 0
+        if self.pending:
+            logger.info(f"[OUTBOX] Found {self.pending} unpublished results in {self.directory}")
+
+    def append(
+        self,
+        subject: str,
+        data: dict[str, Any] | bytes,
+        message_id: str | None = None,
+    ) -> None:
+        """Durably record a result that could not be published.
+
+        Args:
+            subject: NATS subject the result is destined for
+            data: Payload, either a dict or already-encoded bytes
+            message_id: Result identifier (defaults to data["message_id"] for dict payloads)
+        """
+        line = self._encode(subject, data, message_id)
+        with self._lock:
+            if self._active is None:
+                self._open_segment()
+            self._active.write(line)
+            self._active.flush()
+            now = time.monotonic()
+            if self.fsync == "always" or (
+                self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval
+            ):
+                os.fsync(self._active.fileno())
+                self._last_fsync = now
+            self.pending += 1
+            self.appended += 1
+            if self._active.tell() >= self.segment_max_bytes:
+                self._close_segment()
+
+    async def drain(
+        self,
+        publish_many: PublishMany,
+        batch_size: int = 500,
+    ) -> int:
+        """Publish spooled results in bulk, oldest segment first.
+
+        Args:
+            publish_many: Publishes (subject, data) pairs, returning one error (or None) per pair
+            batch_size: Results published per call
+
+        Returns:
+            Number of results published
+        """
+        if self._draining:
+            return 0
+        self._draining = True
+        try:
+            return await self._drain(publish_many, batch_size)
+        finally:
+            self._draining = False
+
+    async def _drain(
+        self,
+        publish_many: PublishMany,
+        batch_size: int,
+    ) -> int:
+        # Segment reads, fsyncs and removals run in a thread; only publishing stays on the loop
+        segments = await asyncio.to_thread(self._roll)
+
+        published = 0
+        for path in segments:
+            records = await asyncio.to_thread(self._read_records, path)
+            failed: list[_Record] = []
+            for start in range(0, len(records), batch_size):
+                batch = records[start:start + batch_size]
+                errors = await publish_many([(subject, data) for subject, _, data in batch])
+                failed.extend(record for record, error in zip(batch, errors) if error is not None)
+
+            published += len(records) - len(failed)
+            await asyncio.to_thread(self._replace_segment, path, failed)
+            if failed:
+                logger.warning(f"[OUTBOX] {len(failed)} results still unpublished, will retry")
+                break
+
+        self.drained += published
+        if published:
+            logger.info(f"[OUTBOX] Drained {published} results to NATS")
+        return published
+
+    def _roll(self) -> list[str]:
+        """Close the active segment and return every closed segment, oldest first."""
+        with self._lock:
+            self._close_segment()
+            return self._segments()
+
+    def _replace_segment(self, path: str, failed: list[_Record]) -> None:
+        """Re-spool the records that still failed, then remove the drained segment."""
+        count = self._count_records(path)
+        synced = None
+        with self._lock:
+            for subject, message_id, data in failed:
+                if self._active is None:
+                    self._open_segment()
+                self._active.write(self._encode(subject, data, message_id))
+            if self._active is not None:
+                self._active.flush()
+                # fsync a duplicate descriptor outside the lock, so appends aren't held up
+                synced = os.dup(self._active.fileno())
+            self.pending -= count - len(failed)
+        if synced is not None:
+            try:
+                os.fsync(synced)
+            finally:
+                os.close(synced)
+        os.remove(path)
+
+    def close(self) -> None:
+        """Flush and close the active segment."""
+        with self._lock:
+            self._close_segment()
+
+    def _open_segment(self) -> None:
+        self._active_path = os.path.join(
+            self.directory, f"{_SEGMENT_PREFIX}{self._next_segment:012d}{_SEGMENT_SUFFIX}"
+        )
+        self._next_segment += 1
+        self._active = open(self._active_path, "a", encoding="utf-8")
+
+    def _close_segment(self) -> None:
+        if self._active is None:
+            return
+        self._active.flush()
+        if self.fsync != "never":
+            os.fsync(self._active.fileno())
+        self._active.close()
+        self._active = None
+        self._active_path = None
+
+    def _segments(self) -> list[str]:
+        names = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)
+        )
+        paths = [os.path.join(self.directory, name) for name in names]
+        return [path for path in paths if path != self._active_path]
+
+    @staticmethod
+    def _encode(subject: str, data: dict[str, Any] | bytes, message_id: str | None = None) -> str:
+        if isinstance(data, (bytes, bytearray)):
+            # Encoded payloads may be binary (msgpack), so they can't be embedded as text
+            record = {
+                "subject": subject,
+                "message_id": message_id,
+                "encoding": "base64",
+                "data": base64.b64encode(data).decode("ascii"),
+            }
+            return json.dumps(record) + "\n"
+        if message_id is None:
+            message_id = data.get("message_id")
+        return json.dumps({"subject": subject, "message_id": message_id, "data": data}) + "\n"
+
+    @staticmethod
+    def _segment_number(path: str) -> int:
+        return int(os.path.basename(path)[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+
+    @staticmethod
+    def _count_records(path: str) -> int:
+        with open(path, encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+
+    @staticmethod
+    def _read_records(path: str) -> list[_Record]:
+        """Read a segment, keeping only the latest record per message_id."""
+        records: dict[Any, _Record] = {}
+        with open(path, encoding="utf-8") as f:
+            for index, line in enumerate(f):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final write from a crash - everything before it is intact
+                    logger.warning(f"[OUTBOX] Skipping corrupt record {index} in {path}")
+                    continue
+                data = record["data"]
+                if record.get("encoding") == "base64":
+                    data = base64.b64decode(data)
+                message_id = record.get("message_id")
+                key = message_id or f"#{index}"
+                records.pop(key, None)
+                records[key] = (record["subject"], message_id, data)
+        return list(records.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Return outbox counters."""
+        return {
+            "directory": self.directory,
+            "fsync": self.fsync,
+            "pending": self.pending,
+            "appended": self.appended,
+            "drained": self.drained,
+        }
@@ -0,0 +1,275 @@
+"""Background publishing of execution results to NATS."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from math_executor.outbox import Outbox
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "fail")
+
+
+class PublishQueueFullError(Exception):
+    """Raised by submit() when the queue is full and the policy is "fail"."""
+
+
+class ResultPublisher:
+    """Publishes results from a bounded queue, keeping many acks in flight.
+
+    Requests hand their NATS payload to ``submit()`` and return immediately; a
+    background worker sends publishes as soon as they are queued and only waits
+    for acks once ``max_in_flight`` publishes are outstanding. Failed publishes
+    are retried with exponential backoff.
+
+    With an ``outbox``, results that cannot be published (NATS unreachable, or
+    retries exhausted) are spooled to disk instead of dropped, and the outbox is
+    drained in bulk once the client is connected again.
+    """
+
+    def __init__(
+        self,
+        get_client: Callable[[], Awaitable[Any]],
+        max_queue: int = 10000,
+        max_in_flight: int = 256,
+        backpressure: str = "block",
+        max_retries: int = 3,
+        retry_backoff: float = 0.1,
+        outbox: Outbox | None = None,
+        drain_interval: float = 1.0,
+    ):
+        """
+        Initialize the publisher.
+
+        Args:
+            get_client: Coroutine returning a connected NATSClient (or None)
+            max_queue: Maximum results waiting to be published
+            max_in_flight: Maximum publishes awaiting their ack
+            backpressure: What submit() does when the queue is full:
+                "block" waits for space, "drop_oldest" discards the oldest
+                queued result, "fail" raises PublishQueueFullError
+            max_retries: Publish attempts after the first one before a result is dropped
+            retry_backoff: Initial delay between attempts in seconds (doubled each retry)
+            outbox: Optional durable outbox for results that could not be published
+            drain_interval: Seconds between checks for spooled results to drain
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy '{backpressure}', "
+                f"expected one of {BACKPRESSURE_POLICIES}"
+            )
+        self.get_client = get_client
+        self.max_queue = max(max_queue, 1)
+        self.max_in_flight = max(max_in_flight, 1)
+        self.backpressure = backpressure
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.outbox = outbox
+        self.drain_interval = drain_interval
+        self._drainer: asyncio.Task | None = None
+        self._queue: asyncio.Queue | None = None
+        self._in_flight: asyncio.Semaphore | None = None
+        self._worker: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.submitted = 0
+        self.published = 0
+        self.retried = 0
+        self.failed = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.spooled = 0
+        self._ack_count = 0
+        self._ack_total = 0.0
+        self._ack_max = 0.0
+        self._recent_acks: deque[float] = deque(maxlen=1024)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is running."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        if self.outbox is not None:
+            self._drainer = asyncio.get_running_loop().create_task(self._drain_outbox())
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Publish what is still queued (up to ``timeout`` seconds), then stop."""
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[NATS] Publisher stopped with {self._queue.qsize()} queued "
+                f"and {len(self._tasks)} in-flight results"
+            )
+        self._worker.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._drainer is not None:
+            self._drainer.cancel()
+        await asyncio.gather(
+            self._worker, *self._tasks, *filter(None, [self._drainer]), return_exceptions=True
+        )
+        self._worker = None
+        self._drainer = None
+        if self.outbox is not None:
+            self.outbox.close()
+
+    async def _drain(self) -> None:
+        await self._queue.join()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def submit(
+        self,
+        subject: str,
+        data: dict[str, Any] | bytes,
+        message_id: str | None = None,
+    ) -> None:
+        """Queue a result for publishing, applying the backpressure policy when full.
+
+        Args:
+            subject: NATS subject to publish to
+            data: Payload, either a dict or already-encoded JSON bytes
+            message_id: Identifies the result in logs and the outbox
+                (defaults to data["message_id"] for dict payloads)
+
+        Raises:
+            PublishQueueFullError: If the queue is full and the policy is "fail"
+        """
+        if not self.running:
+            self.start()
+        if message_id is None and isinstance(data, dict):
+            message_id = data.get("message_id")
+        item = (subject, data, message_id)
+
+        if self.backpressure == "block":
+            await self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if self.backpressure == "fail":
+                    self.rejected += 1
+                    raise PublishQueueFullError(
+                        f"Publish queue is full ({self.max_queue} results waiting)"
+                    ) from None
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                self._queue.put_nowait(item)
+        self.submitted += 1
+
+    async def _run(self) -> None:
+        while True:
+            subject, data, message_id = await self._queue.get()
+            # Only wait here once max_in_flight publishes are awaiting their ack
+            await self._in_flight.acquire()
+            task = asyncio.get_running_loop().create_task(self._publish(subject, data, message_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            self._queue.task_done()
+
+    async def _publish(
+        self, subject: str, data: dict[str, Any] | bytes, message_id: str | None
+    ) -> None:
+        try:
+            delay = self.retry_backoff
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self.retried += 1
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                try:
+                    client = await self.get_client()
+                    if client is None:
+                        if self.outbox is not None:
+                            # Don't hold an in-flight slot while NATS is down
+                            await self._spool(subject, data, message_id)
+                            return
+                        raise ConnectionError("NATS client is not connected")
+                    started = time.monotonic()
+                    await client.publish(subject=subject, data=data)
+                    self._record_ack(time.monotonic() - started)
+                    self.published += 1
+                    return
+                except Exception as e:
+                    error = e
+            if self.outbox is not None:
+                try:
+                    await self._spool(subject, data, message_id)
+                    return
+                except Exception as e:
+                    error = f"{error}; spooling to the outbox also failed: {e}"
+            self.failed += 1
+            logger.warning(
+                f"[NATS] ❌ Failed to publish message_id {message_id} to {subject} "
+                f"after {self.max_retries + 1} attempts (non-critical): {error}"
+            )
+        finally:
+            self._in_flight.release()
+
+    async def _spool(
+        self, subject: str, data: dict[str, Any] | bytes, message_id: str | None
+    ) -> None:
+        await asyncio.to_thread(self.outbox.append, subject, data, message_id)
+        self.spooled += 1
+
+    async def _drain_outbox(self) -> None:
+        while True:
+            await asyncio.sleep(self.drain_interval)
+            if not self.outbox.pending:
+                continue
+            client = await self.get_client()
+            if client is None:
+                continue
+            try:
+                await self.outbox.drain(client.publish_many)
+            except Exception as e:
+                logger.warning(f"[OUTBOX] Drain failed, will retry: {e}")
+
+    def _record_ack(self, latency: float) -> None:
+        self._ack_count += 1
+        self._ack_total += latency
+        self._ack_max = max(self._ack_max, latency)
+        self._recent_acks.append(latency)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, outcome counters and ack latency (in milliseconds)."""
+        recent = sorted(self._recent_acks)
+
+        def percentile(q: float) -> float:
+            return recent[min(int(q * len(recent)), len(recent) - 1)] * 1000.0 if recent else 0.0
+
+        return {
+            "backpressure": self.backpressure,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "in_flight": len(self._tasks),
+            "max_in_flight": self.max_in_flight,
+            "submitted": self.submitted,
+            "published": self.published,
+            "retried": self.retried,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "spooled": self.spooled,
+            "outbox": self.outbox.stats() if self.outbox else None,
+            "ack_latency_ms": {
+                "avg": self._ack_total / self._ack_count * 1000.0 if self._ack_count else 0.0,
+                "max": self._ack_max * 1000.0,
+                "p50": percentile(0.5),
+                "p99": percentile(0.99),
+            },
+        }
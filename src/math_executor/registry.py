@@ -0,0 +1,320 @@
+"""Index of the components registered in node.json, preloaded and warmed up at startup."""
+
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentRegistry:
+    """O(1) (module path, class name) -> class lookup of the node's registered components.
+
+    ``load()`` reads node.json, imports every registered module, and indexes the
+    ``dfx.Component`` subclasses each one defines. Loading also validates each
+    class by building its construction plan and instantiating it with default
+    inputs. With warmup enabled it also runs its first output method once, so
+    the first real request doesn't pay for lazy initialization. Until loading
+    has finished the registry reports itself not ready, and lookups miss.
+
+    ``reload()`` re-imports registered modules whose source changed on disk and
+    swaps the new classes into the index in one assignment. Requests that already
+    looked up the old class finish on it; a module that fails to reload keeps
+    serving its previous classes. Modules of the same top-level package that a
+    registered module uses (shared base classes, kernels) are tracked too: when
+    one of them changes it is reloaded first, followed by every registered module
+    that depends on it. The ``dfx`` framework modules themselves are not reloaded.
+    """
+
+    def __init__(self, node_json_path: str, warmup: bool = True):
+        """
+        Initialize an empty registry.
+
+        Args:
+            node_json_path: Path to the node's node.json
+            warmup: Whether to run each component's first output method once on load
+        """
+        self.node_json_path = node_json_path
+        self.warmup = warmup
+        self._index: dict[tuple[str, str], type] = {}
+        self.components: dict[str, dict[str, Any]] = {}
+        self.ready = False
+        self.startup_time = 0.0
+        self._mtimes: dict[str, float | None] = {}
+        # Registered module path -> the shared modules it uses, dependencies first
+        self._dependencies: dict[str, list[str]] = {}
+        self._dependency_mtimes: dict[str, float | None] = {}
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_reload: float | None = None
+
+    def get(self, module_path: str, class_name: str) -> type | None:
+        """Return the registered class, or None if it isn't (yet) indexed."""
+        return self._index.get((module_path, class_name))
+
+    def is_current(self, module_path: str, class_name: str, component_class: type) -> bool:
+        """Return whether ``component_class`` wasn't replaced by a reload since it was loaded.
+
+        Classes that aren't registered (e.g. built from submitted code) are always current.
+        """
+        registered = self._index.get((module_path, class_name))
+        return registered is None or registered is component_class
+
+    def load(self) -> None:
+        """Import, validate, index and warm up every component listed in node.json."""
+        start_time = time.perf_counter()
+        try:
+            with open(self.node_json_path, encoding="utf-8") as f:
+                registered = json.load(f).get("components", {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"[REGISTRY] Could not read {self.node_json_path}: {e}")
+            registered = {}
+
+        index: dict[tuple[str, str], type] = {}
+        components: dict[str, dict[str, Any]] = {}
+        for name, entry in registered.items():
+            module_path = entry.get("path")
+            if not module_path:
+                components[name] = {"error": "No module path"}
+                continue
+            report = self._load_component(module_path)
+            for component_class in report.pop("component_classes"):
+                index[(module_path, component_class.__name__)] = component_class
+            components[name] = report
+            self._mtimes[module_path] = _source_mtime(module_path)
+            self._track_dependencies(module_path)
+
+        self._index = index
+        self.components = components
+        self.startup_time = time.perf_counter() - start_time
+        self.ready = True
+        logger.info(
+            f"[REGISTRY] Loaded {len(index)} component classes from "
+            f"{len(components)} registered components in {self.startup_time * 1000:.1f}ms"
+        )
+
+    def reload(self, force: bool = False) -> list[str]:
+        """Re-import registered modules whose source file changed since they were loaded.
+
+        Args:
+            force: Reload every registered module, changed or not
+
+        Returns:
+            The module paths whose classes were swapped into the index
+        """
+        changed_dependencies = [
+            dependency
+            for dependency in _merge_ordered(self._dependencies.values())
+            if force or _source_mtime(dependency) != self._dependency_mtimes.get(dependency)
+        ]
+        changed = [
+            module_path
+            for module_path, mtime in self._mtimes.items()
+            if force
+            or _source_mtime(module_path) != mtime
+            or not set(changed_dependencies).isdisjoint(self._dependencies.get(module_path, ()))
+        ]
+        if not changed:
+            return []
+
+        for dependency in changed_dependencies:
+            self._dependency_mtimes[dependency] = _source_mtime(dependency)
+            try:
+                module = sys.modules[dependency]
+                _drop_bytecode(module)
+                importlib.invalidate_caches()
+                importlib.reload(module)
+            except Exception as e:
+                # Dependent modules are still reloaded, on the previous version of this one
+                self.reload_errors += 1
+                logger.error(f"[REGISTRY] Reload of dependency {dependency} failed: {e}")
+
+        index = dict(self._index)
+        reloaded = []
+        for module_path in changed:
+            self._mtimes[module_path] = _source_mtime(module_path)
+            report = self._load_component(module_path, reload=True)
+            component_classes = report.pop("component_classes")
+            if "error" in report or not component_classes:
+                # Keep serving the previous version rather than dropping the component
+                self.reload_errors += 1
+                logger.error(f"[REGISTRY] Reload of {module_path} failed, keeping old classes")
+                continue
+            for key in [key for key in index if key[0] == module_path]:
+                del index[key]
+            for component_class in component_classes:
+                index[(module_path, component_class.__name__)] = component_class
+            self._track_dependencies(module_path)
+            for name, previous in self.components.items():
+                if previous.get("module") == module_path:
+                    self.components[name] = report
+            reloaded.append(module_path)
+
+        # Lookups see either the old or the new index, never a partial one
+        self._index = index
+        if reloaded:
+            self.reloads += 1
+            self.last_reload = time.time()
+            logger.info(f"[REGISTRY] Reloaded {reloaded}")
+        return reloaded
+
+    def _track_dependencies(self, module_path: str) -> None:
+        """Record the shared modules a registered module uses, with their mtimes."""
+        module = sys.modules.get(module_path)
+        if module is None:
+            return
+        dependencies = [
+            name for name in _module_dependencies(module) if name not in self._mtimes
+        ]
+        self._dependencies[module_path] = dependencies
+        for dependency in dependencies:
+            self._dependency_mtimes.setdefault(dependency, _source_mtime(dependency))
+
+    def _load_component(self, module_path: str, reload: bool = False) -> dict[str, Any]:
+        """Import one registered module and validate and warm up its component classes."""
+        from dfx import Component
+
+        report: dict[str, Any] = {"module": module_path, "component_classes": []}
+        start = time.perf_counter()
+        try:
+            module = sys.modules.get(module_path) if reload else None
+            if module is not None:
+                _drop_bytecode(module)
+                importlib.invalidate_caches()
+                module = importlib.reload(module)
+            else:
+                module = importlib.import_module(module_path)
+        except Exception as e:
+            logger.error(f"[REGISTRY] Failed to import {module_path}: {e}", exc_info=True)
+            report["error"] = f"{type(e).__name__}: {e}"
+            return report
+        report["import_ms"] = (time.perf_counter() - start) * 1000
+
+        classes = [
+            obj
+            for obj in vars(module).values()
+            if inspect.isclass(obj)
+            and issubclass(obj, Component)
+            and obj is not Component
+            and obj.__module__ == module.__name__
+        ]
+        report["classes"] = {}
+        for component_class in classes:
+            timings = self._prepare_class(component_class)
+            report["classes"][component_class.__name__] = timings
+            if "error" not in timings:
+                report["component_classes"].append(component_class)
+            logger.info(f"[REGISTRY] {module_path}.{component_class.__name__}: {timings}")
+        if not classes:
+            report["error"] = "Module defines no dfx Component subclass"
+        return report
+
+    def _prepare_class(self, component_class: type) -> dict[str, Any]:
+        """Validate a component class and optionally run its first output method once."""
+        timings: dict[str, Any] = {}
+        start = time.perf_counter()
+        try:
+            component_class._construction_plan()
+            component = component_class()
+        except Exception as e:
+            logger.error(f"[REGISTRY] Invalid component {component_class.__name__}: {e}")
+            return {"error": f"{type(e).__name__}: {e}"}
+        timings["validate_ms"] = (time.perf_counter() - start) * 1000
+
+        method_name = next((o.method for o in component.outputs if o.method), None)
+        if self.warmup and method_name and not inspect.iscoroutinefunction(
+            getattr(component, method_name, None)
+        ):
+            start = time.perf_counter()
+            try:
+                getattr(component, method_name)()
+            except Exception as e:
+                # A failing warmup doesn't make the component unusable with real inputs
+                logger.warning(
+                    f"[REGISTRY] Warmup of {component_class.__name__}.{method_name} failed: {e}"
+                )
+                timings["warmup_error"] = f"{type(e).__name__}: {e}"
+            timings["warmup_ms"] = (time.perf_counter() - start) * 1000
+        return timings
+
+    def stats(self) -> dict[str, Any]:
+        """Return readiness, startup time and per-component load timings."""
+        return {
+            "ready": self.ready,
+            "startup_time": self.startup_time,
+            "indexed_classes": len(self._index),
+            "components": self.components,
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "last_reload": self.last_reload,
+        }
+
+
+def _module_dependencies(module: Any) -> list[str]:
+    """Return the modules of ``module``'s top-level package it uses, dependencies first.
+
+    Follows module objects and the defining modules of classes and functions
+    found in module globals, recursively, skipping the ``dfx`` framework modules.
+    """
+    import dfx
+
+    framework = {"dfx"} | {
+        getattr(obj, "__module__", None) for obj in vars(dfx).values()
+    }
+    package = module.__name__.partition(".")[0]
+    ordered: list[str] = []
+    seen = {module.__name__}
+
+    def visit(current: Any) -> None:
+        for obj in list(vars(current).values()):
+            name = obj.__name__ if inspect.ismodule(obj) else getattr(obj, "__module__", None)
+            if (
+                not isinstance(name, str)
+                or name in seen
+                or name in framework
+                or name.partition(".")[0] != package
+                or not (inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isfunction(obj))
+            ):
+                continue
+            seen.add(name)
+            dependency = sys.modules.get(name)
+            if dependency is None or not getattr(dependency, "__file__", None):
+                continue
+            visit(dependency)
+            ordered.append(name)
+
+    visit(module)
+    return ordered
+
+
+def _merge_ordered(lists: Any) -> list[str]:
+    """Concatenate lists of names, keeping the first occurrence of each."""
+    return list(dict.fromkeys(name for names in lists for name in names))
+
+
+def _source_mtime(module_path: str) -> float | None:
+    """Return the modification time of a module's source file, or None if it has none."""
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return None
+    return os.stat(spec.origin).st_mtime_ns / 1e9
+
+
+def _drop_bytecode(module: Any) -> None:
+    """Remove a module's cached bytecode, so edits within the mtime resolution are picked up."""
+    source = getattr(module, "__file__", None)
+    if not source or not source.endswith(".py"):
+        return
+    try:
+        os.remove(importlib.util.cache_from_source(source))
+    except (OSError, NotImplementedError):
+        pass
@@ -0,0 +1,169 @@
+"""Single-pass serialization of execution results.
+
+Results are converted to JSON-ready values through a per-type dispatch table
+(resolved once per type along the MRO) and encoded to bytes exactly once. The
+encoded result is then spliced into both the HTTP response body and the NATS
+payload, so neither has to walk or encode it again.
+
+The encoder uses ``orjson`` when it is installed (``JSON_ENCODER=auto``), and the
+standard library otherwise. Numeric arrays are left as-is by ``to_jsonable`` and
+written by the encoder directly. Both encoders write non-finite floats (inf, -inf,
+nan) as ``null``, so the output is standard JSON whichever one is used.
+"""
+
+import json
+import logging
+import math
+import os
+from array import array
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from dfx.data import Data
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _serialize_dict(value: dict) -> dict:
+    return {k: to_jsonable(v) for k, v in value.items()}
+
+
+def _serialize_sequence(value: list | tuple) -> list:
+    return [to_jsonable(item) for item in value]
+
+
+def _serialize_data(value: Data) -> dict:
+    return {
+        "text_key": value.text_key,
+        "data": _serialize_dict(value.data),
+        "default_value": value.default_value,
+    }
+
+
+def _serialize_model(value: BaseModel) -> Any:
+    return to_jsonable(value.model_dump())
+
+
+def _serialize_object(value: Any) -> Any:
+    # Unknown types: keep the data of Data-like objects, stringify anything else
+    if hasattr(value, "data"):
+        if isinstance(value.data, dict):
+            text_key = getattr(value, "text_key", "text")
+            return {"data": _serialize_dict(value.data), "text_key": text_key}
+        return {"data": to_jsonable(value.data)}
+    return str(value)
+
+
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    dict: _serialize_dict,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    Data: _serialize_data,
+    BaseModel: _serialize_model,
+    # Numeric arrays are written by the encoder without an intermediate list
+    array: _identity,
+    memoryview: _identity,
+}
+if np is not None:
+    _SERIALIZERS[np.ndarray] = _identity
+    _SERIALIZERS[np.generic] = lambda value: value.item()
+
+
+def _resolve(value_type: type) -> Callable[[Any], Any]:
+    """Find the serializer of the closest registered base class and remember it."""
+    for base in value_type.__mro__:
+        serializer = _SERIALIZERS.get(base)
+        if serializer is not None:
+            break
+    else:
+        serializer = _serialize_object
+    _SERIALIZERS[value_type] = serializer
+    return serializer
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a result to JSON-ready values (numeric arrays are kept for the encoder)."""
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is None:
+        serializer = _resolve(type(value))
+    return serializer(value)
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON backends don't handle natively."""
+    if isinstance(value, (array, memoryview)):
+        return value.tolist()
+    if np is not None and isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return str(value)
+
+
+def _finite(value: Any) -> Any:
+    """Replace non-finite floats with None, as orjson encodes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, (array, memoryview)) or (
+        np is not None and isinstance(value, (np.ndarray, np.generic))
+    ):
+        return _finite(value.tolist())
+    return value
+
+
+def _dumps_json(value: Any) -> bytes:
+    try:
+        return json.dumps(
+            value, separators=(",", ":"), default=_default, allow_nan=False
+        ).encode()
+    except ValueError:
+        # Only walk the value again when it holds a non-finite float
+        return json.dumps(_finite(value), separators=(",", ":"), default=_default).encode()
+
+
+def _dumps_orjson(value: Any) -> bytes:
+    return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+
+_backend = os.getenv("JSON_ENCODER", "auto").lower()
+if _backend == "orjson" and orjson is None:
+    logger.warning("JSON_ENCODER=orjson but orjson is not installed, using the json module")
+if _backend in ("auto", "orjson") and orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    dumps: Callable[[Any], bytes] = _dumps_orjson
+    ENCODER = "orjson"
+else:
+    dumps = _dumps_json
+    ENCODER = "json"
+
+
+def encode_result(result: Any) -> bytes:
+    """Convert and encode a result in one pass."""
+    return dumps(to_jsonable(result))
+
+
+def encode_envelope(result_json: bytes, fields: dict[str, Any]) -> bytes:
+    """Encode ``fields`` as a JSON object with the already-encoded result spliced in."""
+    return b'{"result":' + result_json + b"," + dumps(fields)[1:]
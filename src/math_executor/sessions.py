@@ -0,0 +1,136 @@
+"""Per-component execution sessions for incremental re-execution."""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class Session:
+    """The last successful execution of one workflow component.
+
+    Attributes:
+        fingerprint: Hash of (module, class, code, method, parameters) of the execution
+        class_key: (module, class, code, method) the execution ran, without its parameters
+        parameters: The parameters the component was instantiated with
+        result: The method's result as returned (None if it ran in a worker process)
+        result_type: Type name of the result
+        serialized_result: JSON-ready form of the result
+        result_json: Encoded result (None if the response was encoded as msgpack)
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        class_key: tuple,
+        parameters: dict[str, Any],
+        result: Any,
+        result_type: str,
+        serialized_result: Any,
+        result_json: bytes | None,
+    ):
+        self.fingerprint = fingerprint
+        self.class_key = class_key
+        self.parameters = parameters
+        self.result = result
+        self.result_type = result_type
+        self.serialized_result = serialized_result
+        self.result_json = result_json
+        self.updated_at = time.monotonic()
+
+    def changed_inputs(self, parameters: dict[str, Any]) -> set[str]:
+        """Return the names of parameters that differ from this session's."""
+        return {
+            name
+            for name in self.parameters.keys() | parameters.keys()
+            if not _same_value(self.parameters.get(name, _MISSING), parameters.get(name, _MISSING))
+        }
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Compare two parameter values; arrays compare element-wise, failures count as changed."""
+    if a is b:
+        return True
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        return (
+            isinstance(a, np.ndarray)
+            and isinstance(b, np.ndarray)
+            and a.dtype == b.dtype
+            and bool(np.array_equal(a, b))
+        )
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+class SessionCache:
+    """Bounded LRU map of ``component_id`` -> last Session.
+
+    Lets the executor skip a re-triggered component whose inputs did not change
+    (reusing its result without re-publishing it), and lets components that
+    declare ``incremental_methods`` update their previous result from the inputs
+    that changed instead of recomputing it.
+    """
+
+    def __init__(self, max_sessions: int = 1024, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_sessions: Maximum number of components tracked (0 disables sessions)
+            ttl: Seconds after its last update a session is forgotten (0 = until evicted)
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self.unchanged = 0
+        self.incremental = 0
+        self.full = 0
+        self.evictions = 0
+
+    def get(self, component_id: str) -> Session | None:
+        """Return the live session of ``component_id``, if any."""
+        session = self._sessions.get(component_id)
+        if session is None:
+            return None
+        if self.ttl and time.monotonic() - session.updated_at > self.ttl:
+            del self._sessions[component_id]
+            return None
+        self._sessions.move_to_end(component_id)
+        return session
+
+    def put(self, component_id: str, session: Session) -> None:
+        """Record the latest execution of ``component_id``."""
+        if self.max_sessions <= 0:
+            return
+        self._sessions[component_id] = session
+        self._sessions.move_to_end(component_id)
+        while len(self._sessions) > self.max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Evicted session of component {evicted_id}")
+
+    def clear(self) -> None:
+        """Forget all sessions."""
+        self._sessions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return session counts by outcome."""
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "unchanged": self.unchanged,
+            "incremental": self.incremental,
+            "full": self.full,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,89 @@
+"""Chunked execution results streamed as NDJSON or Server-Sent Events."""
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+_END = object()
+
+
+def negotiate_format(requested: str | None, accept: str | None) -> str:
+    """Pick the stream format from an explicit ``format`` or the Accept header.
+
+    Args:
+        requested: Format asked for explicitly ("ndjson" or "sse"), if any
+        accept: The request's Accept header
+
+    Returns:
+        "sse" if requested or if the client accepts ``text/event-stream``, else "ndjson"
+
+    Raises:
+        ValueError: If ``requested`` is not a known format
+    """
+    if requested:
+        if requested not in STREAM_MEDIA_TYPES:
+            raise ValueError(
+                f"Unknown stream format '{requested}', expected one of {list(STREAM_MEDIA_TYPES)}"
+            )
+        return requested
+    if accept and STREAM_MEDIA_TYPES["sse"] in accept:
+        return "sse"
+    return "ndjson"
+
+
+def frame(message_json: bytes, stream_format: str, event: str) -> bytes:
+    """Frame one encoded message as an NDJSON line or an SSE event."""
+    if stream_format == "sse":
+        return b"event: " + event.encode() + b"\ndata: " + message_json + b"\n\n"
+    return message_json + b"\n"
+
+
+async def iterate_chunks(
+    output: Any,
+    run_step: Callable[[Callable[[], Any], float], Awaitable[Any]],
+    time_budget: Callable[[], float],
+) -> AsyncIterator[Any]:
+    """Yield the chunks of a method's output as they are produced.
+
+    Generators are advanced one chunk at a time and only when the consumer asks
+    for the next chunk, so at most one chunk is held in memory. Any other output
+    is yielded as a single chunk.
+
+    Args:
+        output: What the method returned: a generator, an async generator or a value
+        run_step: Runs a sync callable with a timeout (e.g. on the thread backend)
+        time_budget: Returns the seconds the next chunk may take
+
+    Raises:
+        asyncio.TimeoutError: If a chunk took longer than its time budget
+    """
+    if inspect.isasyncgen(output):
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(output.__anext__(), timeout=time_budget())
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            await output.aclose()
+    elif inspect.isgenerator(output):
+        try:
+            while True:
+                chunk = await run_step(lambda: next(output, _END), time_budget())
+                if chunk is _END:
+                    return
+                yield chunk
+        finally:
+            try:
+                output.close()
+            except ValueError:
+                # Still running in a timed-out thread; it stops at its next yield
+                pass
+    else:
+        yield output
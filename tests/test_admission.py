@@ -0,0 +1,192 @@
+"""Tests for execution admission control."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from math_executor.admission import AdmissionController, AdmissionRejectedError
+from math_executor.api import app
+
+
+@pytest.mark.asyncio
+async def test_admission_queues_then_sheds():
+    """Test that requests queue up to the limit and are rejected beyond it."""
+    admission = AdmissionController(max_concurrency=1, max_queue=1)
+    await admission.acquire(timeout=5)
+
+    queued = asyncio.ensure_future(admission.acquire(timeout=5))
+    await asyncio.sleep(0)
+    assert admission.saturation()["queued"] == 1
+
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        await admission.acquire(timeout=5)
+    assert rejected.value.status_code == 429
+    assert rejected.value.retry_after >= 1
+
+    admission.release(service_time=0.01)
+    await queued
+    admission.release(service_time=0.01)
+    assert admission.stats()["active"] == 0
+    assert admission.stats()["admitted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_unmeetable_deadline():
+    """Test that a request is shed when the expected wait exceeds its timeout."""
+    admission = AdmissionController(max_concurrency=1, max_queue=10, initial_service_time=2.0)
+    await admission.acquire(timeout=5)
+
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        await admission.acquire(timeout=1)
+
+    assert rejected.value.status_code == 503
+    assert rejected.value.retry_after == 2
+    assert admission.stats()["rejected_deadline"] == 1
+
+
+def test_health_reports_saturation(monkeypatch):
+    """Test that /health answers 503 while the node is saturated."""
+    from math_executor import api
+
+    admission = AdmissionController(max_concurrency=1, max_queue=0)
+    admission.active = 1
+    monkeypatch.setattr(api, "admission", admission)
+    monkeypatch.setattr(api.component_registry, "ready", True)
+
+    with TestClient(app) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "saturated"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_orders_by_priority_then_deadline():
+    """Test that freed slots go to higher priorities first, then earliest deadline."""
+    admission = AdmissionController(max_concurrency=1, max_queue=10)
+    await admission.acquire(timeout=5)
+    order = []
+
+    async def wait(label, **kwargs):
+        await admission.acquire(timeout=5, **kwargs)
+        order.append(label)
+        admission.release()
+
+    now = time.time()
+    tasks = [
+        asyncio.ensure_future(wait("batch")),
+        asyncio.ensure_future(wait("late", priority=1, deadline=now + 4)),
+        asyncio.ensure_future(wait("soon", priority=1, deadline=now + 2)),
+    ]
+    await asyncio.sleep(0)
+    admission.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["soon", "late", "batch"]
+    histograms = admission.stats()["queue_wait_ms_histogram"]
+    assert sum(histograms["1"].values()) == 2
+    assert sum(histograms["0"].values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drops_expired_work():
+    """Test that queued work whose deadline passed is dropped instead of run."""
+    admission = AdmissionController(max_concurrency=1, max_queue=10)
+    await admission.acquire(timeout=5)
+
+    with pytest.raises(AdmissionRejectedError):
+        await admission.acquire(timeout=5, deadline=time.time() - 1)
+
+    queued = asyncio.ensure_future(admission.acquire(timeout=5, deadline=time.time() + 0.05))
+    await asyncio.sleep(0.1)
+    with pytest.raises(AdmissionRejectedError):
+        await queued
+    admission.release()
+
+    assert admission.stats()["expired_in_queue"] == 1
+    assert admission.stats()["active"] == 0
+
+
+def test_batch_items_and_graph_nodes_are_admitted_individually(monkeypatch):
+    """Test that batch items and graph nodes each take a slot and are shed when full."""
+    from math_executor import api
+
+    def multiply(node_id):
+        return {
+            "id": node_id,
+            "message_id": node_id,
+            "component_state": {
+                "component_class": "DFXMultiplyComponent",
+                "component_module": "dfx.math.component.multiply",
+                "parameters": {"number1": 2.0, "number2": 3.0},
+            },
+            "method_name": "multiply",
+        }
+
+    batch = {"requests": [multiply("a"), multiply("b"), multiply("c")]}
+    graph = {"nodes": [multiply("a"), multiply("b")], "edges": []}
+    admission = AdmissionController(max_concurrency=4, max_queue=0)
+    monkeypatch.setattr(api, "admission", admission)
+
+    with TestClient(app) as client:
+        results = client.post("/api/v1/execute/batch", json=batch).json()["results"]
+        assert all(r["success"] for r in results)
+        assert client.post("/api/v1/execute/graph", json=graph).status_code == 200
+        assert admission.admitted == 5
+
+        # All slots busy and no queue: every item and node is rejected
+        admission.active = admission.max_concurrency
+        results = client.post("/api/v1/execute/batch", json=batch).json()["results"]
+        assert {r["result_type"] for r in results} == {"AdmissionRejectedError"}
+        results = client.post("/api/v1/execute/graph", json=graph).json()["results"]
+        assert {r["result_type"] for r in results.values()} == {"AdmissionRejectedError"}
+
+
+def test_queue_wait_counts_against_the_timeout(monkeypatch):
+    """Test that time spent waiting for admission is taken out of the execution timeout."""
+    from math_executor import api
+
+    budgets = []
+    admission = AdmissionController(max_concurrency=4, max_queue=0)
+    take_slot = admission.acquire
+
+    async def acquire(timeout, priority=0, deadline=None):
+        await take_slot(timeout, priority, deadline)
+        return 0.75  # as if queued for 0.75s
+
+    async def run_execution(request, component_class=None, binary=False):
+        budgets.append(request.time_budget())
+        return api.ExecutionResponse(
+            result=None, success=True, result_type="NoneType", execution_time=0.0
+        ), None
+
+    monkeypatch.setattr(admission, "acquire", acquire)
+    monkeypatch.setattr(api, "admission", admission)
+    monkeypatch.setattr(api, "run_execution", run_execution)
+    request = {
+        "component_state": {
+            "component_class": "DFXMultiplyComponent",
+            "component_module": "dfx.math.component.multiply",
+            "parameters": {"number1": 2.0, "number2": 3.0},
+        },
+        "method_name": "multiply",
+        "timeout": 1,
+    }
+
+    with TestClient(app) as client:
+        assert client.post("/api/v1/execute", json=request).status_code == 200
+        results = client.post("/api/v1/execute/batch", json={"requests": [request]}).json()
+        assert results["results"][0]["success"]
+
+    assert budgets == [pytest.approx(0.25), pytest.approx(0.25)]
+    assert admission.active == 0
@@ -0,0 +1,428 @@
+"""Tests for the executor HTTP API."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from math_executor.api import app
+
+
+@pytest.fixture
+def client():
+    """Fixture that provides a test client for the FastAPI app."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def multiply_request(number1, number2, message_id=None, module="dfx.math.component.multiply"):
+    """Build an execution request payload for DFXMultiplyComponent."""
+    return {
+        "component_state": {
+            "component_class": "DFXMultiplyComponent",
+            "component_module": module,
+            "parameters": {"number1": number1, "number2": number2},
+        },
+        "method_name": "multiply",
+        "message_id": message_id,
+    }
+
+
+def test_execute_multiply(client):
+    """Test executing the multiply component over HTTP."""
+    response = client.post("/api/v1/execute", json=multiply_request(5.0, 3.0, "msg-1"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["result"]["data"]["result"] == 15.0
+    assert body["message_id"] == "msg-1"
+
+
+def test_execute_batch_preserves_order(client):
+    """Test that batch results come back in request order, including failures."""
+    payload = {
+        "requests": [
+            multiply_request(2.0, 3.0, "a"),
+            multiply_request(1.0, 1.0, "b", module="invalid.module"),
+            multiply_request(4.0, 5.0, "c"),
+        ],
+        "max_concurrency": 2,
+    }
+    response = client.post("/api/v1/execute/batch", json=payload)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["message_id"] for r in results] == ["a", "b", "c"]
+    assert results[0]["result"]["data"]["result"] == 6.0
+    assert results[1]["success"] is False
+    assert results[2]["result"]["data"]["result"] == 20.0
+
+
+def test_execute_multiply_arrays(client):
+    """Test that array operands come back as a flat list."""
+    response = client.post("/api/v1/execute", json=multiply_request([1, 2, 3], 0.5))
+
+    assert response.status_code == 200
+    assert response.json()["result"]["data"]["result"] == [0.5, 1.0, 1.5]
+
+
+@pytest.mark.asyncio
+async def test_handle_nats_request():
+    """Test executing an encoded request as received over NATS."""
+    import json
+
+    from math_executor.api import handle_nats_request
+
+    reply = await handle_nats_request(json.dumps(multiply_request(6.0, 7.0, "nats-1")).encode())
+    body = json.loads(reply)
+    assert body["success"] is True
+    assert body["result"]["data"]["result"] == 42.0
+    assert body["message_id"] == "nats-1"
+
+    invalid = json.loads(await handle_nats_request(b'{"method_name": "multiply"}'))
+    assert invalid["success"] is False
+    assert invalid["result_type"] == "ValidationError"
+
+
+def test_response_and_nats_payload_share_encoded_result():
+    """Test that the NATS payload and the HTTP body carry the same encoded result."""
+    import json
+    import time
+
+    from dfx import Data
+    from math_executor.api import ExecutionRequest, build_success
+    from math_executor.serialization import to_jsonable
+
+    payload = multiply_request(2.0, 3.0, "shared")
+    payload["component_state"]["stream_topic"] = "droq.local.public.u.w.c.out"
+    request = ExecutionRequest.model_validate(payload)
+
+    response, publish_data = build_success(request, Data(data={"result": 6.0}), time.time())
+
+    body = json.loads(response.to_json_bytes())
+    nats_payload = json.loads(publish_data)
+    assert body["result"] == nats_payload["result"] == to_jsonable(Data(data={"result": 6.0}))
+    assert nats_payload["message_id"] == body["message_id"] == "shared"
+    assert nats_payload["result_type"] == "Data"
+
+
+def test_to_jsonable_dispatch():
+    """Test the per-type conversions used for results."""
+    from array import array
+
+    from math_executor.serialization import encode_result, to_jsonable
+
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert to_jsonable({"a": (1, 2), "b": Opaque()}) == {"a": [1, 2], "b": "opaque"}
+    assert encode_result({"values": array("d", [1.5, 2.5])}) == b'{"values":[1.5,2.5]}'
+
+
+@pytest.mark.parametrize("backend", ["process", "inline"])
+def test_execute_on_configured_backend(client, monkeypatch, backend):
+    """Test that a component configured for another backend returns the same result."""
+    from math_executor import api
+    from math_executor.backends import ProcessPoolBackend
+
+    pool = ProcessPoolBackend(max_workers=1, modules=["dfx.math.component.multiply"])
+    monkeypatch.setattr(api, "process_backend", pool)
+    monkeypatch.setitem(api.component_backends, "dfx.math.component.multiply", backend)
+    try:
+        payload = {**multiply_request([1.0, 2.0], 3.0), "bypass_cache": True}
+        response = client.post("/api/v1/execute", json=payload)
+    finally:
+        pool.stop()
+
+    body = response.json()
+    assert body["success"] is True
+    assert body["result_type"] == "Data"
+    assert body["result"]["data"]["result"] == [3.0, 6.0]
+    assert pool.stats()["executed"] == (1 if backend == "process" else 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["thread", "process", "inline"])
+async def test_coalesced_batches_run_on_the_configured_backend(monkeypatch, backend):
+    """Test that micro-batched requests run on the component's backend, not a bare thread."""
+    import asyncio
+
+    from math_executor import api
+    from math_executor.backends import ProcessPoolBackend, ThreadBackend
+    from math_executor.coalescer import RequestCoalescer
+
+    pool = ProcessPoolBackend(max_workers=1, modules=["dfx.math.component.multiply"])
+    threads = ThreadBackend(max_workers=1)
+    thread_runs = []
+    run_on_thread = threads.run
+
+    async def run(component, method, timeout):
+        thread_runs.append(component)
+        return await run_on_thread(component, method, timeout)
+
+    monkeypatch.setattr(threads, "run", run)
+    monkeypatch.setattr(api, "thread_backend", threads)
+    monkeypatch.setattr(api, "process_backend", pool)
+    monkeypatch.setattr(api, "request_coalescer", RequestCoalescer(window_ms=50))
+    monkeypatch.setitem(api.component_backends, "dfx.math.component.multiply", backend)
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                api.run_execution(
+                    api.ExecutionRequest(**multiply_request(i, 2.0), bypass_cache=True)
+                )
+                for i in range(3)
+            )
+        )
+    finally:
+        pool.stop()
+        threads.stop()
+
+    assert [response.result["data"]["result"] for response, _ in outcomes] == [0.0, 2.0, 4.0]
+    assert {response.result_type for response, _ in outcomes} == {"Data"}
+    assert api.request_coalescer.stats()["batches"] == 1
+    assert pool.stats()["executed"] == (1 if backend == "process" else 0)
+    assert thread_runs == ([None] if backend == "thread" else [])
+
+
+def test_pure_component_results_are_memoized(client, monkeypatch):
+    """Test that repeated pure executions are served from the result cache unless bypassed."""
+    from math_executor import api
+    from math_executor.memo import ResultCache
+
+    cache = ResultCache(max_entries=8)
+    monkeypatch.setattr(api, "result_cache", cache)
+
+    first = client.post("/api/v1/execute", json=multiply_request(6.0, 7.0, "m1")).json()
+    second = client.post("/api/v1/execute", json=multiply_request(6.0, 7.0, "m2")).json()
+    bypassed = {**multiply_request(6.0, 7.0, "m3"), "bypass_cache": True}
+    third = client.post("/api/v1/execute", json=bypassed).json()
+
+    assert first["result"] == second["result"] == third["result"]
+    assert second["message_id"] == "m2"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def multiply_node(node_id, number1=None, number2=None):
+    """Build a graph node for DFXMultiplyComponent."""
+    request = multiply_request(number1, number2, message_id=node_id)
+    return {"id": node_id, "component_state": request["component_state"], "message_id": node_id}
+
+
+def feed(source, target, target_input):
+    """Build a graph edge feeding a product into a multiply input."""
+    return {
+        "source": source,
+        "target": target,
+        "target_input": target_input,
+        "source_output": "result",
+        "source_key": "result",
+    }
+
+
+def test_execute_graph_chains_components(client, monkeypatch):
+    """Test a chain with a parallel branch, returning and publishing only the sink."""
+    from math_executor import api
+
+    published = []
+
+    async def publish_results(messages):
+        published.extend(messages)
+
+    monkeypatch.setattr(api, "publish_results", publish_results)
+    a = multiply_node("a", 2.0, 3.0)
+    b = multiply_node("b", number2=10.0)
+    c = multiply_node("c", number2=0.5)
+    sink = multiply_node("sink")
+    sink["component_state"]["stream_topic"] = "droq.test.graph"
+    payload = {
+        "nodes": [sink, c, b, a],
+        "edges": [
+            feed("a", "b", "number1"),
+            feed("a", "c", "number1"),
+            feed("b", "sink", "number1"),
+            feed("c", "sink", "number2"),
+        ],
+    }
+
+    response = client.post("/api/v1/execute/graph", json=payload)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert list(results) == ["sink"]
+    assert results["sink"]["result"]["data"]["result"] == (6.0 * 10.0) * (6.0 * 0.5)
+    assert [topic for topic, _, _ in published] == ["droq.test.graph"]
+
+
+def test_execute_graph_rejects_cycles(client):
+    """Test that a cyclic graph is rejected before anything runs."""
+    payload = {
+        "nodes": [multiply_node("a"), multiply_node("b")],
+        "edges": [feed("a", "b", "number1"), feed("b", "a", "number1")],
+    }
+
+    response = client.post("/api/v1/execute/graph", json=payload)
+
+    assert response.status_code == 422
+    assert "cycle" in response.json()["detail"]
+
+
+COUNTER_CODE = """
+from dfx import Component, Data, IntInput, Output
+
+
+class CounterComponent(Component):
+    inputs: list = [
+        IntInput(name="count", display_name="Count", value=3),
+        IntInput(name="fail_at", display_name="Fail At", value=-1),
+    ]
+    outputs: list = [Output(display_name="Chunks", name="chunks", method="count_up")]
+
+    def count_up(self):
+        for i in range(self.count):
+            if i == self.fail_at:
+                raise ValueError("boom")
+            yield Data(data={"i": i})
+"""
+
+
+def counter_request(count, **parameters):
+    """Build a streaming request for a generator component defined in code."""
+    return {
+        "component_state": {
+            "component_class": "CounterComponent",
+            "component_module": "",
+            "component_code": COUNTER_CODE,
+            "parameters": {"count": count, **parameters},
+            "stream_topic": "droq.test.stream",
+        },
+        "method_name": "count_up",
+        "message_id": "stream-1",
+    }
+
+
+def test_execute_stream_ndjson_and_sse(client, monkeypatch):
+    """Test that generator chunks are streamed as NDJSON or SSE and mirrored to NATS."""
+    import json
+
+    from math_executor import api
+
+    published = []
+    keys = []
+
+    async def publish_result(topic, data, message_id=None):
+        published.append(json.loads(data))
+        keys.append(message_id)
+
+    monkeypatch.setattr(api, "publish_result", publish_result)
+
+    response = client.post("/api/v1/execute/stream", json=counter_request(3))
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["result"]["data"]["i"] for line in lines[:-1]] == [0, 1, 2]
+    assert lines[-1]["done"] and lines[-1]["success"] and lines[-1]["chunks"] == 3
+    assert [message["final"] for message in published] == [False, False, False, True]
+    assert published[1]["chunk"] == 1 and published[1]["result"]["data"]["i"] == 1
+    # Each chunk is spooled under its own outbox key, so none is deduplicated away
+    assert keys == ["stream-1:0", "stream-1:1", "stream-1:2", "stream-1"]
+
+    response = client.post(
+        "/api/v1/execute/stream",
+        json=counter_request(3, fail_at=1),
+        headers={"Accept": "text/event-stream"},
+    )
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [event.split("\n") for event in response.text.strip().split("\n\n")]
+    assert [event[0] for event in events] == ["event: chunk", "event: error"]
+    error = json.loads(events[-1][1].removeprefix("data: "))
+    assert error["chunks"] == 1 and error["result_type"] == "ValueError"
+
+
+def test_execute_stream_sends_plain_results_as_one_chunk(client):
+    """Test that a non-generator method is streamed as a single chunk."""
+    import json
+
+    response = client.post("/api/v1/execute/stream?format=ndjson", json=multiply_request(2.0, 4.0))
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["result"]["data"]["result"] == 8.0
+    assert lines[1]["success"] is True
+
+
+def test_execute_msgpack_round_trip(client):
+    """Test a msgpack request with typed arrays, answered in msgpack."""
+    pytest.importorskip("msgpack")
+    from array import array
+
+    from math_executor.binary import MSGPACK_MEDIA_TYPE, packb, unpackb
+
+    payload = multiply_request(array("d", [1.0, 2.0, 3.0]), 2.0, "bin-1")
+    response = client.post(
+        "/api/v1/execute",
+        content=packb(payload),
+        headers={"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    body = unpackb(response.content)
+    assert body["message_id"] == "bin-1"
+    assert list(body["result"]["data"]["result"]) == [2.0, 4.0, 6.0]
+
+    invalid = client.post(
+        "/api/v1/execute", content=b"\xc1", headers={"Content-Type": MSGPACK_MEDIA_TYPE}
+    )
+    assert invalid.status_code == 422
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "json"])
+def test_non_finite_results_are_null_with_either_encoder(client, monkeypatch, encoder):
+    """Test that inf/nan results are encoded as null and unset clip bounds aren't echoed."""
+    import json
+
+    from math_executor import api, serialization
+
+    if encoder == "orjson":
+        pytest.importorskip("orjson")
+    dumps = serialization._dumps_orjson if encoder == "orjson" else serialization._dumps_json
+    monkeypatch.setattr(serialization, "dumps", dumps)
+    monkeypatch.setattr(api, "dumps", dumps)
+
+    def execute(component_class, module, parameters):
+        response = client.post(
+            "/api/v1/execute",
+            json={
+                "component_state": {
+                    "component_class": component_class,
+                    "component_module": module,
+                    "parameters": parameters,
+                },
+                "method_name": "compute",
+                "bypass_cache": True,
+            },
+        )
+        # Strict parsing: Infinity/NaN literals would be rejected
+        return json.loads(response.content, parse_constant=pytest.fail)["result"]["data"]
+
+    divided = execute(
+        "DFXDivideComponent", "dfx.math.component.divide", {"number1": 1, "number2": 0}
+    )
+    assert divided["result"] is None
+    divided = execute(
+        "DFXDivideComponent", "dfx.math.component.divide", {"number1": [1, 0], "number2": 0}
+    )
+    assert divided["result"] == [None, None]
+
+    clipped = execute("DFXClipComponent", "dfx.math.component.clip", {"number": 5})
+    assert clipped == {"result": 5.0, "number": 5.0, "operation": "clip"}
@@ -0,0 +1,146 @@
+"""Tests for the executor backends' cancellation and worker reclamation."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx import Component, Data, ExecutionCancelledError
+from math_executor.backends import ProcessPoolBackend, ThreadBackend, WorkerCrashedError
+
+
+class SpinComponent(Component):
+    """Component whose methods run until they are stopped."""
+
+    name: str = "Spin"
+
+    def spin_cooperatively(self) -> Data:
+        """Spin until cancelled."""
+        while True:
+            self.raise_if_cancelled()
+            time.sleep(0.01)
+
+    def spin_forever(self) -> Data:
+        """Spin without ever checking for cancellation."""
+        while True:
+            pass
+
+    def quick(self) -> Data:
+        """Return immediately."""
+        return Data(data={"ok": True})
+
+
+@pytest.mark.asyncio
+async def test_thread_backend_cancels_timed_out_component():
+    """Test that a timed-out thread is cancelled cooperatively and counted as reclaimed."""
+    backend = ThreadBackend(max_workers=1)
+    component = SpinComponent()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await backend.run(component, component.spin_cooperatively, timeout=0.05)
+    assert component.cancelled
+    assert backend.stats()["runaway"] == 1
+
+    for _ in range(100):
+        if backend.stats()["reclaimed"]:
+            break
+        await asyncio.sleep(0.01)
+    assert backend.stats() == {"workers": 1, "timed_out": 1, "runaway": 0, "reclaimed": 1}
+    with pytest.raises(ExecutionCancelledError):
+        component.raise_if_cancelled()
+    backend.stop()
+
+
+@pytest.mark.asyncio
+async def test_process_backend_kills_and_replaces_timed_out_worker():
+    """Test that a worker stuck past its deadline is killed and the pool keeps serving."""
+    backend = ProcessPoolBackend(max_workers=1, modules=[__name__])
+    try:
+        await asyncio.to_thread(backend.start)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                backend.run(__name__, "SpinComponent", "spin_forever", {}), timeout=0.2
+            )
+        result_type, result = await asyncio.wait_for(
+            backend.run(__name__, "SpinComponent", "quick", {}), timeout=30
+        )
+    finally:
+        backend.stop()
+
+    assert (result_type, result["data"]) == ("Data", {"ok": True})
+    assert backend.stats()["reclaimed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_backend_enforces_cpu_limit():
+    """Test that a request over its CPU time limit fails and its worker is replaced."""
+    backend = ProcessPoolBackend(max_workers=1, modules=[__name__], cpu_limit=1)
+    try:
+        with pytest.raises(WorkerCrashedError, match="CPU time limit"):
+            await asyncio.wait_for(
+                backend.run(__name__, "SpinComponent", "spin_forever", {}), timeout=30
+            )
+        stats = backend.stats()
+    finally:
+        backend.stop()
+
+    assert stats["reclaimed"] == 1
+    assert stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_backend_recycles_workers_after_reload():
+    """Test that recycling replaces idle workers with ones of the new generation."""
+    backend = ProcessPoolBackend(max_workers=1, modules=[__name__])
+    try:
+        backend.start()
+        old_pid = backend._workers[0].process.pid
+        await backend.recycle()
+        result_type, result = await asyncio.wait_for(
+            backend.run(__name__, "SpinComponent", "quick", {}), timeout=30
+        )
+        new_pid = backend._workers[0].process.pid
+    finally:
+        backend.stop()
+
+    assert (result_type, result["data"]) == ("Data", {"ok": True})
+    assert new_pid != old_pid
+    assert backend.stats()["recycled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_backend_starts_off_the_event_loop_once():
+    """Test that concurrent first calls start one pool without blocking the event loop."""
+    backend = ProcessPoolBackend(max_workers=1, modules=[__name__])
+    ticks_while_starting = 0
+
+    async def tick():
+        nonlocal ticks_while_starting
+        while True:
+            if backend._workers and backend._idle is None:
+                ticks_while_starting += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(backend.run(__name__, "SpinComponent", "quick", {}) for _ in range(3))
+            ),
+            timeout=30,
+        )
+        workers = len(backend._workers)
+    finally:
+        ticker.cancel()
+        backend.stop()
+
+    assert [result["data"] for _, result in results] == [{"ok": True}] * 3
+    assert workers == 1
+    assert ticks_while_starting > 0
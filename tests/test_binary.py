@@ -0,0 +1,51 @@
+"""Tests for the msgpack payload format."""
+
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("msgpack")
+
+from math_executor import binary
+from math_executor.binary import packb, unpackb
+
+
+def test_typed_arrays_round_trip_as_buffers():
+    """Test that arrays of any layout come back as typed buffers with their values."""
+    np = pytest.importorskip("numpy")
+    matrix = np.arange(6, dtype=">i4").reshape(2, 3)
+
+    decoded = unpackb(
+        packb({"matrix": matrix, "values": array("d", [1.5, -2.0]), "nested": [{"n": 1}]})
+    )
+
+    assert decoded["matrix"].dtype == np.dtype("<i4")
+    assert decoded["matrix"].tolist() == [[0, 1, 2], [3, 4, 5]]
+    assert not decoded["matrix"].flags.writeable  # wraps the payload, no copy
+    assert decoded["values"].tolist() == [1.5, -2.0]
+    assert decoded["nested"] == [{"n": 1}]
+
+
+def test_typed_arrays_decode_to_memoryviews_without_numpy(monkeypatch):
+    """Test the stdlib fallback, including memoryview inputs and empty arrays."""
+    payload = packb({"view": memoryview(array("q", [1, 2, 3])), "empty": array("f")})
+    monkeypatch.setattr(binary, "np", None)
+
+    decoded = unpackb(payload)
+
+    assert isinstance(decoded["view"], memoryview)
+    assert decoded["view"].format == "q" and decoded["view"].tolist() == [1, 2, 3]
+    assert decoded["empty"].tolist() == []
+
+
+def test_corrupt_typed_array_is_rejected():
+    """Test that a truncated array payload raises ValueError."""
+    with pytest.raises(ValueError):
+        unpackb(packb(array("d", [1.0, 2.0]))[:-3])
@@ -0,0 +1,101 @@
+"""Tests for operands and outputs passed by buffer handle."""
+
+import os
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from math_executor import buffers
+from math_executor.api import app
+from math_executor.buffers import BufferHandleError, open_buffer, resolve_handles, write_buffer
+
+
+@pytest.fixture
+def buffer_dir(tmp_path, monkeypatch):
+    """Allow mapping files under a temporary directory."""
+    monkeypatch.setattr(buffers, "ALLOWED_DIRS", [os.path.realpath(tmp_path)])
+    return tmp_path
+
+
+def test_handles_map_files_read_only(buffer_dir):
+    """Test that a handle maps the referenced slice of a file without copying it."""
+    path = buffer_dir / "operand.f64"
+    path.write_bytes(array("d", range(8)).tobytes())
+    handle = {"path": str(path), "shape": [2, 3], "offset": 16}
+
+    params = resolve_handles({"a": {"$buffer": handle}, "b": 2.0})
+
+    assert params["b"] == 2.0
+    assert params["a"].tolist() == [[2.0, 3.0, 4.0], [5.0, 6.0, 7.0]]
+    with pytest.raises((TypeError, ValueError)):
+        params["a"][0][0] = 1.0  # read-only mapping
+
+
+def test_handles_are_confined_to_allowed_dirs(buffer_dir, tmp_path_factory):
+    """Test that files outside BUFFER_HANDLE_DIRS, bad shm names and short files are refused."""
+    outside = tmp_path_factory.mktemp("outside") / "secret"
+    outside.write_bytes(b"\0" * 8)
+    (buffer_dir / "link").symlink_to(outside)
+    short = buffer_dir / "short"
+    short.write_bytes(b"\0" * 8)
+
+    for handle in (
+        {"path": str(outside)},
+        {"path": str(buffer_dir / "link")},
+        {"shm": "../etc/passwd"},
+        {"path": str(short), "shape": [2]},
+        {"path": str(short), "dtype": "complex128"},
+    ):
+        with pytest.raises(BufferHandleError):
+            open_buffer(handle)
+
+
+def test_write_buffer_fills_caller_buffer(buffer_dir, monkeypatch):
+    """Test writing a result into an output buffer, with and without NumPy."""
+    path = buffer_dir / "out.f32"
+    path.write_bytes(b"\0" * 16)
+    handle = {"path": str(path), "dtype": "float32"}
+
+    assert write_buffer(handle, [1.0, 2.0, 3.0, 4.0]) == 4
+    assert array("f", path.read_bytes()).tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    monkeypatch.setattr(buffers, "np", None)
+    assert write_buffer({**handle, "shape": [2, 2]}, [[5.0, 6.0], [7.0, 8.0]]) == 4
+    assert array("f", path.read_bytes()).tolist() == [5.0, 6.0, 7.0, 8.0]
+    with pytest.raises(BufferHandleError):
+        write_buffer(handle, [1.0])
+
+
+def test_execute_with_buffer_operand_and_output(buffer_dir):
+    """Test a component reading a mapped operand and writing into a caller buffer."""
+    operand = buffer_dir / "x.f64"
+    operand.write_bytes(array("d", [1.0, 2.0, 3.0]).tobytes())
+    output = buffer_dir / "y.f64"
+    output.write_bytes(b"\0" * 24)
+    payload = {
+        "component_state": {
+            "component_class": "DFXMultiplyComponent",
+            "component_module": "dfx.math.component.multiply",
+            "parameters": {"number1": {"$buffer": {"path": str(operand)}}, "number2": 3.0},
+        },
+        "method_name": "multiply",
+        "output_buffer": {"path": str(output)},
+        "output_key": "result",
+    }
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/execute", json=payload)
+
+    body = response.json()
+    assert body["success"] is True, body["error"]
+    assert body["result"]["data"]["result"]["$buffer"]["written"] == 3
+    assert array("d", output.read_bytes()).tolist() == [3.0, 6.0, 9.0]
@@ -0,0 +1,63 @@
+"""Tests for the component class cache."""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from math_executor.cache import ComponentClassCache
+
+COMPONENT_CODE = """
+from dfx import Component
+
+class EchoComponent(Component):
+    def echo(self):
+        return self.value
+"""
+
+
+def _namespace():
+    return {"dfx": __import__("dfx")}
+
+
+def test_component_class_cache_hits_and_misses():
+    """Test that identical code is compiled once and then served from cache."""
+    cache = ComponentClassCache(max_size=4)
+
+    first = cache.load(COMPONENT_CODE, "EchoComponent", _namespace())
+    second = cache.load(COMPONENT_CODE, "EchoComponent", _namespace())
+
+    assert first is second
+    assert first(value=3).echo() == 3
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_component_class_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded."""
+    cache = ComponentClassCache(max_size=2)
+    for i in range(3):
+        code = COMPONENT_CODE.replace("EchoComponent", f"Echo{i}")
+        cache.load(code, f"Echo{i}", _namespace())
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_component_class_cache_bytecode_store(tmp_path):
+    """Test that a fresh cache reuses bytecode written by a previous one."""
+    ComponentClassCache(bytecode_dir=str(tmp_path)).load(
+        COMPONENT_CODE, "EchoComponent", _namespace()
+    )
+
+    warm = ComponentClassCache(bytecode_dir=str(tmp_path))
+    component_class = warm.load(COMPONENT_CODE, "EchoComponent", _namespace())
+
+    assert component_class(value="x").echo() == "x"
+    assert warm.stats()["bytecode_hits"] == 1
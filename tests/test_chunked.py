@@ -0,0 +1,60 @@
+"""Tests for out-of-core chunked execution."""
+
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx import ExecutionCancelledError, run_chunked
+from dfx.math.component.multiply import DFXMultiplyComponent
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_run_chunked_writes_file_output_in_order(tmp_path, max_workers):
+    """Test that chunks of a mapped operand are multiplied and appended in order."""
+    np = pytest.importorskip("numpy")
+    operand = np.memmap(tmp_path / "x.f64", dtype="float64", mode="w+", shape=(1000,))
+    operand[:] = np.arange(1000)
+    component = DFXMultiplyComponent(number1=operand, number2=0.5)
+
+    summary = run_chunked(
+        component, "multiply", tmp_path / "y.f64", chunk_size=64, max_workers=max_workers
+    )
+
+    assert (summary.elements, summary.chunks) == (1000, 16)
+    result = np.fromfile(tmp_path / "y.f64", dtype="float64")
+    assert result.tolist() == (np.arange(1000) * 0.5).tolist()
+
+
+def test_run_chunked_consumes_streams_into_a_buffer():
+    """Test a streamed operand combined with an array operand and a caller buffer."""
+    stream = (array("d", range(start, start + 3)) for start in range(0, 9, 3))
+    output = array("d", bytes(8 * 9))
+    component = DFXMultiplyComponent(number1=stream, number2=array("d", [2.0] * 9))
+
+    summary = run_chunked(component, "multiply", memoryview(output))
+
+    assert summary.chunks == 3
+    assert output.tolist() == [2.0 * i for i in range(9)]
+
+
+def test_run_chunked_rejects_mismatched_sizes_and_stops_when_cancelled():
+    """Test size validation and cooperative cancellation between chunks."""
+    component = DFXMultiplyComponent(number1=[1.0, 2.0], number2=[1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match="same size"):
+        run_chunked(component, "multiply", lambda start, chunk: None)
+
+    component = DFXMultiplyComponent(number1=[1.0] * 10, number2=2.0)
+    written = []
+
+    def write(start, chunk):
+        written.append(start)
+        component.cancel()
+
+    with pytest.raises(ExecutionCancelledError):
+        run_chunked(component, "multiply", write, chunk_size=2)
+    assert written == [0]
@@ -0,0 +1,69 @@
+"""Tests for micro-batching of concurrent executions."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math.component.multiply import DFXMultiplyComponent
+from math_executor.coalescer import RequestCoalescer
+
+
+async def multiply_batch(parameter_sets, timeout):
+    """Run DFXMultiplyComponent's batch method the way the coalescer calls it."""
+    return DFXMultiplyComponent.compute_batch(parameter_sets)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_concurrent_requests():
+    """Test that concurrent submissions run as one batch with per-request results."""
+    coalescer = RequestCoalescer(window_ms=20, max_batch_size=64)
+    key = (DFXMultiplyComponent, "multiply")
+
+    results = await asyncio.gather(
+        *(
+            coalescer.submit(key, multiply_batch, {"number1": i, "number2": 2})
+            for i in range(10)
+        )
+    )
+
+    assert [r.data["result"] for r in results] == [2.0 * i for i in range(10)]
+    stats = coalescer.stats()
+    assert stats["batches"] == 1
+    assert stats["items"] == 10
+    assert stats["batch_size_histogram"]["le_16"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_at_max_batch_size():
+    """Test that a full batch is flushed without waiting for the window."""
+    coalescer = RequestCoalescer(window_ms=10_000, max_batch_size=4)
+    key = (DFXMultiplyComponent, "multiply")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(
+                coalescer.submit(key, multiply_batch, {"number1": i, "number2": i})
+                for i in range(4)
+            )
+        ),
+        timeout=2,
+    )
+
+    assert [r.data["result"] for r in results] == [0.0, 1.0, 4.0, 9.0]
+
+
+def test_multiply_batch_matches_multiply():
+    """Test that the batch method returns the same data as single calls."""
+    parameter_sets = [{"number1": 1.5, "number2": 2}, {"number1": None, "number2": 3}]
+
+    batched = DFXMultiplyComponent.compute_batch(parameter_sets)
+    single = [DFXMultiplyComponent(**p).multiply() for p in parameter_sets]
+
+    assert [d.data for d in batched] == [d.data for d in single]
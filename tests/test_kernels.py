@@ -0,0 +1,105 @@
+"""Tests for the dfx.math element-wise kernels and the components built on them."""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math import kernels
+from dfx.math.component import (
+    DFXClipComponent,
+    DFXDivideComponent,
+    DFXMultiplyComponent,
+    DFXPowerComponent,
+    DFXSubtractComponent,
+)
+
+EDGE_CASES = [
+    (kernels.add, ([1.0, 2.0], [10.0])),
+    (kernels.subtract, (5.0, [1.0, 2.0, 3.0])),
+    (kernels.divide, ([1.0, -1.0, 0.0, 6.0], 0.0)),
+    (kernels.power, ([-8.0, 2.0, 0.0, 10.0], [1 / 3, 3.0, -1.0, 400.0])),
+    (kernels.mod, ([5.0, -5.0, 5.0], [3.0, 3.0, 0.0])),
+    (kernels.minimum, ([1.0, math.nan, 3.0], [2.0, 1.0, 0.0])),
+    (kernels.maximum, ([1.0, math.nan, 3.0], [2.0, 1.0, 0.0])),
+    (kernels.absolute, ([-1.5, 0.0, 2.0],)),
+    (kernels.clip, ([-5.0, 0.0, 5.0], -1.0, [1.0, 1.0, 2.0])),
+]
+
+
+@pytest.mark.parametrize("kernel, operands", EDGE_CASES)
+def test_fallback_matches_numpy(monkeypatch, kernel, operands):
+    """Test that the pure-Python fallback gives NumPy's results, inf and nan included."""
+    np = pytest.importorskip("numpy")
+    expected = kernel(*operands)
+
+    monkeypatch.setattr(kernels, "np", None)
+    fallback = kernel(*operands)
+
+    np.testing.assert_array_equal(np.asarray(fallback), expected)
+
+
+def test_scalar_fast_path_and_broadcast_errors():
+    """Test that scalars stay Python floats and mismatched arrays raise ValueError."""
+    assert kernels.divide(1, 0) == math.inf
+    assert math.isnan(kernels.mod(1.0, 0.0))
+    assert kernels.clip(7, 0, 5) == 5.0
+    with pytest.raises(ValueError):
+        kernels.add([1.0, 2.0], [1.0, 2.0, 3.0])
+
+
+def test_dtype_promotion():
+    """Test that buffers keep their element type and lists are promoted to float64."""
+    np = pytest.importorskip("numpy")
+    int32 = np.arange(4, dtype=np.int32)
+
+    assert kernels.add(int32, 1).dtype == np.int32
+    assert kernels.divide(int32, 2).dtype == np.float64
+    assert kernels.add(int32, [0, 0, 0, 0]).dtype == np.float64
+    assert kernels.minimum(np.ones(2, dtype=np.float32), 0.5).dtype == np.float32
+
+
+def test_elementwise_components():
+    """Test the scalar, array and batched paths of the element-wise components."""
+    scalar = DFXSubtractComponent(number1=5, number2=2).compute()
+    assert scalar.data == {
+        "result": 3.0,
+        "number1": 5.0,
+        "number2": 2.0,
+        "operation": "subtract",
+    }
+
+    clipped = DFXClipComponent(number=[-3.0, 0.5, 9.0], maximum=1.0).compute()
+    assert list(clipped.data["result"]) == [-3.0, 0.5, 1.0]
+    assert (clipped.data["length"], clipped.data["shape"]) == (3, [3])
+    # Unset bounds are unbounded and not echoed, on the scalar and batched paths alike
+    assert DFXClipComponent(number=5.0).compute().data == {
+        "result": 5.0,
+        "number": 5.0,
+        "operation": "clip",
+    }
+    assert [item.data for item in DFXClipComponent.compute_batch([{"number": 5.0}])] == [
+        DFXClipComponent(number=5.0).compute().data
+    ]
+
+    invalid = DFXDivideComponent(number1="abc", number2=1).compute()
+    assert "error" in invalid.data
+
+    # Missing inputs take the input defaults, exactly as on construction
+    batch = DFXPowerComponent.compute_batch([{"number1": 2, "number2": 10}, {"number1": 3}])
+    assert [item.data for item in batch] == [
+        DFXPowerComponent(number1=2, number2=10).compute().data,
+        DFXPowerComponent(number1=3).compute().data,
+    ]
+
+
+def test_elementwise_components_report_the_shape_of_nd_results():
+    """Test that N-D results report their element count and shape, not their row count."""
+    pytest.importorskip("numpy")
+    product = DFXMultiplyComponent(number1=[[1.0, 2.0], [3.0, 4.0]], number2=2.0).multiply()
+    assert kernels.to_list(product.data["result"]) == [[2.0, 4.0], [6.0, 8.0]]
+    assert (product.data["length"], product.data["shape"]) == (4, [2, 2])
@@ -0,0 +1,80 @@
+"""Tests for the dfx.math linear-algebra kernels and matrix components."""
+
+import random
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math import linalg
+from dfx.math.component import DFXMatMulComponent, DFXSolveComponent
+
+
+def random_matrix(rows, columns, stack=None):
+    """Return a random, diagonally dominant matrix (or stack of matrices) as lists."""
+    if stack is not None:
+        return [random_matrix(rows, columns) for _ in range(stack)]
+    return [
+        [random.random() + (rows if i == j else 0.0) for j in range(columns)] for i in range(rows)
+    ]
+
+
+def test_pure_python_kernels_match_numpy(monkeypatch):
+    """Test that the blocked pure-Python kernels give NumPy's results."""
+    np = pytest.importorskip("numpy")
+    random.seed(0)
+    a, b, x = random_matrix(9, 7), random_matrix(7, 5), [random.random() for _ in range(7)]
+    square, stack = random_matrix(6, 6), random_matrix(4, 4, stack=3)
+    cases = [
+        (linalg.matmul, (a, b)),
+        (partial(linalg.matmul, block_size=2), (a, b)),
+        (linalg.matmul, (a, x)),
+        (linalg.matmul, (x, x)),
+        (linalg.matvec, (a, x)),
+        (linalg.transpose, (a,)),
+        (linalg.matmul, (stack, stack)),
+        (linalg.solve, (square, x[:6])),
+        (linalg.solve, (stack, random_matrix(4, 2))),
+    ]
+    expected = [kernel(*operands) for kernel, operands in cases]
+
+    monkeypatch.setattr(linalg, "np", None)
+    for (kernel, operands), result in zip(cases, expected):
+        np.testing.assert_allclose(np.asarray(kernel(*operands)), result)
+
+
+def test_threaded_kernels_match_single_call(monkeypatch):
+    """Test that products and solves split across threads equal a single call."""
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=(50, 40)), rng.normal(size=(40, 30))
+    stack = rng.normal(size=(16, 5, 5)) + 5 * np.eye(5)
+    rhs = rng.normal(size=(16, 5, 1))
+
+    monkeypatch.setattr(linalg, "PARALLEL_MIN_FLOPS", 0)
+    monkeypatch.setattr(linalg, "_num_threads", 3)
+    np.testing.assert_allclose(linalg.matmul(a, b), a @ b)
+    np.testing.assert_allclose(linalg.matmul(stack, stack), stack @ stack)
+    np.testing.assert_allclose(linalg.solve(stack, rhs), np.linalg.solve(stack, rhs))
+    with pytest.raises(ValueError):
+        linalg.set_num_threads(0)
+
+
+def test_matrix_components():
+    """Test the matrix components, including errors for invalid operands."""
+    product = DFXMatMulComponent(matrix_a=[[1, 2], [3, 4]], matrix_b=[5, 6]).compute()
+    assert list(product.data["result"]) == [17.0, 39.0]
+    assert product.data["shape"] == [2]
+
+    solved = DFXSolveComponent(matrix=[[2, 0], [0, 4]], rhs=[2, 8]).compute()
+    assert list(solved.data["result"]) == [1.0, 2.0]
+
+    singular = DFXSolveComponent(matrix=[[1, 2], [2, 4]], rhs=[1, 1]).compute()
+    assert "Singular" in singular.data["error"]
+    misaligned = DFXMatMulComponent(matrix_a=[[1, 2]], matrix_b=[[1, 2]]).compute()
+    assert "error" in misaligned.data
+    assert "error" in DFXMatMulComponent(matrix_a=[[1]]).compute().data
@@ -0,0 +1,38 @@
+"""Tests for the result memoization cache."""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from math_executor.memo import ResultCache
+
+
+def test_make_key_canonicalizes_parameters():
+    """Test that parameter order doesn't change the key but values do."""
+    key = ResultCache.make_key("m", "C", None, "run", {"a": 1, "b": 2})
+
+    assert key == ResultCache.make_key("m", "C", None, "run", {"b": 2, "a": 1})
+    assert key != ResultCache.make_key("m", "C", None, "run", {"a": 1, "b": 3})
+    assert ResultCache.make_key("m", "C", None, "run", {"a": object()}) is None
+
+
+def test_result_cache_evicts_by_bytes_and_expires():
+    """Test LRU eviction at the byte limit and expiry after the TTL."""
+    cache = ResultCache(max_entries=10, max_bytes=10, ttl=0.05)
+    cache.put("a", "int", 1, b"12345")
+    cache.put("b", "int", 2, b"12345")
+    assert cache.get("a") == ("int", 1, b"12345")
+
+    cache.put("c", "int", 3, b"12345")
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 10
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
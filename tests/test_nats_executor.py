@@ -0,0 +1,68 @@
+"""Tests for NATS-native execution."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("nats")
+
+from math_executor import nats_executor
+from math_executor.nats_executor import NATSExecutor
+
+
+class FakeConnection:
+    """Stands in for a nats.aio Client, recording queue-group subscriptions."""
+
+    def __init__(self):
+        self.is_closed = False
+        self.subscriptions = []
+
+    async def subscribe(self, subject, queue, cb):
+        self.subscriptions.append((subject, queue))
+        return self
+
+    async def unsubscribe(self):
+        pass
+
+
+class FakeClient:
+    """Stands in for NATSClient."""
+
+    def __init__(self):
+        self.nc = FakeConnection()
+
+
+@pytest.mark.asyncio
+async def test_executor_resubscribes_on_a_replaced_client(monkeypatch):
+    """Test that the executor subscribes again once its client is closed and replaced."""
+    monkeypatch.setattr(nats_executor, "_CLIENT_CHECK_INTERVAL", 0.01)
+    clients = [FakeClient()]
+
+    async def get_client():
+        return None if clients[-1].nc.is_closed else clients[-1]
+
+    async def handle(data):
+        return data
+
+    executor = NATSExecutor(get_client=get_client, handle=handle, subject="droq.test.execute")
+    executor.start()
+    await asyncio.sleep(0.05)
+    assert clients[0].nc.subscriptions == [("droq.test.execute", "math-executor")]
+
+    clients[0].nc.is_closed = True
+    clients.append(FakeClient())
+    for _ in range(100):
+        if clients[1].nc.subscriptions:
+            break
+        await asyncio.sleep(0.01)
+    await executor.stop()
+
+    assert clients[1].nc.subscriptions == [("droq.test.execute", "math-executor")]
+    assert len(clients[0].nc.subscriptions) == 1
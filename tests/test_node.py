@@ -66,3 +66,36 @@ def test_dfx_multiply_component():
 
     except ImportError as e:
         pytest.skip(f"Could not test DFXMultiplyComponent: {e}")
+
+
+def test_dfx_multiply_broadcasts_arrays():
+    """Test element-wise multiplication with scalar and array operands."""
+    from dfx.math.component.multiply import DFXMultiplyComponent
+    from dfx.math.kernels import to_list
+
+    scaled = DFXMultiplyComponent(number1=[1.0, 2.0, 3.0], number2=2.0).multiply()
+    assert to_list(scaled.data["result"]) == [2.0, 4.0, 6.0]
+
+    paired = DFXMultiplyComponent(number1=[1.0, 2.0], number2=[3.0, 4.0]).multiply()
+    assert to_list(paired.data["result"]) == [3.0, 8.0]
+    assert paired.data["length"] == 2
+
+    mismatched = DFXMultiplyComponent(number1=[1.0, 2.0], number2=[1.0, 2.0, 3.0]).multiply()
+    assert "error" in mismatched.data
+
+
+def test_component_construction_plan_matches_validated_path():
+    """Test that plan-based construction yields the same state as validated construction."""
+    from dfx.math.component.multiply import DFXMultiplyComponent
+
+    fast = DFXMultiplyComponent(number1=2, number2=None, _precision=2)
+    validated = DFXMultiplyComponent(
+        number1=2, number2=None, _precision=2, display_name="DFX Multiply"
+    )
+
+    assert fast.model_dump() == validated.model_dump()
+    assert fast.number2 == 0.0
+    assert fast._config == validated._config == {"_precision": 2}
+
+    fast.log("first")
+    assert DFXMultiplyComponent()._logs == []
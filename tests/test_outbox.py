@@ -0,0 +1,132 @@
+"""Tests for the durable NATS outbox."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from math_executor.outbox import Outbox
+from math_executor.publisher import ResultPublisher
+
+
+@pytest.mark.asyncio
+async def test_outbox_survives_restart_and_drains(tmp_path):
+    """Test that spooled results are found by a new outbox and drained in bulk."""
+    outbox = Outbox(str(tmp_path), segment_max_bytes=120, fsync="always")
+    outbox.append("droq.test", {"message_id": "m0", "result": 0})
+    outbox.append("droq.test", {"message_id": "m0", "result": "latest"})
+    for i in range(1, 5):
+        outbox.append("droq.test", {"message_id": f"m{i}", "result": i})
+    outbox.close()
+    assert len(list(tmp_path.iterdir())) > 1
+
+    reopened = Outbox(str(tmp_path))
+    assert reopened.pending == 6
+
+    batches = []
+
+    async def publish_many(messages):
+        batches.append(messages)
+        return [None] * len(messages)
+
+    published = await reopened.drain(publish_many)
+
+    delivered = {data["message_id"]: data["result"] for batch in batches for _, data in batch}
+    assert delivered == {"m0": "latest", "m1": 1, "m2": 2, "m3": 3, "m4": 4}
+    assert published == 5
+    assert reopened.pending == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_outbox_keeps_records_that_fail_to_publish(tmp_path):
+    """Test that records whose publish failed stay in the outbox."""
+    outbox = Outbox(str(tmp_path))
+    outbox.append("droq.test", {"message_id": "ok"})
+    outbox.append("droq.test", {"message_id": "fails"})
+
+    async def publish_many(messages):
+        return [None if data["message_id"] == "ok" else ConnectionError() for _, data in messages]
+
+    assert await outbox.drain(publish_many) == 1
+    assert outbox.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_publisher_spools_while_disconnected(tmp_path):
+    """Test that results go to the outbox instead of being dropped when NATS is down."""
+
+    async def get_client():
+        return None
+
+    publisher = ResultPublisher(get_client=get_client, outbox=Outbox(str(tmp_path)))
+    await publisher.submit("droq.test", {"message_id": "offline"})
+    await publisher.stop()
+
+    stats = publisher.stats()
+    assert stats["spooled"] == 1
+    assert stats["failed"] == 0
+    assert stats["outbox"]["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_round_trips_binary_payloads(tmp_path):
+    """Test that already-encoded, non-UTF-8 payloads (msgpack) are drained unchanged."""
+    outbox = Outbox(str(tmp_path))
+    payload = b"\x82\xa6result\xcb\x7f\xf0\x00\x00\x00\x00\x00\x00\xff"
+    outbox.append("droq.test", payload, message_id="binary")
+    delivered = []
+
+    async def publish_many(messages):
+        delivered.extend(messages)
+        return [None] * len(messages)
+
+    assert await outbox.drain(publish_many) == 1
+    assert delivered == [("droq.test", payload)]
+
+
+@pytest.mark.asyncio
+async def test_outbox_keeps_message_ids_of_respooled_binary_payloads(tmp_path):
+    """Test that a binary payload re-spooled after a failed publish is still deduplicated."""
+    outbox = Outbox(str(tmp_path))
+    outbox.append("droq.test", b"\x81stale", message_id="binary")
+
+    async def fail_all(messages):
+        return [ConnectionError()] * len(messages)
+
+    assert await outbox.drain(fail_all) == 0
+    outbox.append("droq.test", b"\x81latest", message_id="binary")
+    delivered = []
+
+    async def publish_many(messages):
+        delivered.extend(messages)
+        return [None] * len(messages)
+
+    assert await outbox.drain(publish_many) == 1
+    assert delivered == [("droq.test", b"\x81latest")]
+    assert outbox.pending == 0
+
+@pytest.mark.asyncio
+async def test_publisher_counts_results_it_cannot_spool(tmp_path):
+    """Test that a failing outbox counts the result as failed instead of killing the task."""
+
+    async def get_client():
+        return None
+
+    class BrokenOutbox(Outbox):
+        def append(self, subject, data, message_id=None):
+            raise OSError("disk full")
+
+    publisher = ResultPublisher(
+        get_client=get_client, outbox=BrokenOutbox(str(tmp_path)), max_retries=0
+    )
+    await publisher.submit("droq.test", {"message_id": "lost"})
+    await publisher.stop()
+
+    stats = publisher.stats()
+    assert (stats["spooled"], stats["failed"]) == (0, 1)
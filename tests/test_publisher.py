@@ -0,0 +1,91 @@
+"""Tests for the background result publisher."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from math_executor.publisher import PublishQueueFullError, ResultPublisher
+
+
+class FakeClient:
+    """Stands in for NATSClient, recording publishes and optionally failing."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.published = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, subject, data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("ack timeout")
+            self.published.append((subject, data))
+        finally:
+            self.in_flight -= 1
+
+
+def publisher_for(client, **kwargs):
+    async def get_client():
+        return client
+
+    return ResultPublisher(get_client=get_client, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_publisher_pipelines_up_to_max_in_flight():
+    """Test that publishes overlap but never exceed the in-flight cap."""
+    client = FakeClient(delay=0.01)
+    publisher = publisher_for(client, max_in_flight=4)
+
+    for i in range(20):
+        await publisher.submit("droq.test", {"message_id": str(i)})
+    await publisher.stop()
+
+    assert len(client.published) == 20
+    assert client.max_in_flight == 4
+    assert publisher.stats()["published"] == 20
+
+
+@pytest.mark.asyncio
+async def test_publisher_retries_failed_acks():
+    """Test that a failed publish is retried until it is acked."""
+    client = FakeClient(failures=2)
+    publisher = publisher_for(client, max_retries=3, retry_backoff=0.001)
+
+    await publisher.submit("droq.test", {"message_id": "retry"})
+    await publisher.stop()
+
+    assert client.published == [("droq.test", {"message_id": "retry"})]
+    assert publisher.stats()["retried"] == 2
+
+
+@pytest.mark.asyncio
+async def test_publisher_backpressure_policies():
+    """Test the drop_oldest and fail policies on a full queue."""
+    client = FakeClient(delay=0.05)
+
+    failing = publisher_for(client, max_queue=1, max_in_flight=1, backpressure="fail")
+    with pytest.raises(PublishQueueFullError):
+        for i in range(5):
+            await failing.submit("droq.test", {"message_id": str(i)})
+    assert failing.stats()["rejected"] == 1
+    await failing.stop()
+
+    dropping = publisher_for(client, max_queue=1, max_in_flight=1, backpressure="drop_oldest")
+    for i in range(5):
+        await dropping.submit("droq.test", {"message_id": str(i)})
+    assert dropping.stats()["dropped"] > 0
+    await dropping.stop()
@@ -0,0 +1,133 @@
+"""Tests for the single-pass reductions and the statistics components."""
+
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math import reductions
+from dfx.math.component import (
+    DFXHistogramComponent,
+    DFXQuantilesComponent,
+    DFXStatisticsComponent,
+)
+from dfx.math.component.reduction import ReductionComponent
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(reductions, "np", None)
+    return request.param
+
+
+def test_moments_are_accurate_and_mergeable(backend):
+    """Test that chunked, parallel moments match an exact computation."""
+    rng = random.Random(0)
+    values = [1e9 + rng.gauss(0, 1) for _ in range(20_000)]
+    mean = math.fsum(values) / len(values)
+    variance = math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+    moments = reductions.reduce(reductions.Moments, values, chunk_size=999, max_workers=3)
+
+    assert moments.count == len(values)
+    assert moments.sum == math.fsum(values)
+    assert moments.mean == pytest.approx(mean, rel=1e-15)
+    assert moments.variance(ddof=1) == pytest.approx(variance, rel=1e-6)
+    assert (moments.min, moments.max) == (min(values), max(values))
+
+    # Merging partial aggregates of the two halves gives the same result
+    first = reductions.Moments().update(values[:7_000])
+    second = reductions.Moments().update(values[7_000:])
+    merged = reductions.Moments.from_dict(json.loads(json.dumps(first.to_dict())))
+    merged.merge(reductions.Moments.from_dict(second.to_dict()))
+    assert merged.sum == moments.sum
+    assert merged.variance(ddof=1) == pytest.approx(variance, rel=1e-6)
+
+
+def test_reduce_starts_threads_only_for_several_chunks(monkeypatch):
+    """Test that data fitting in one chunk, or the default of one worker, runs inline."""
+
+    def no_threads(*args, **kwargs):
+        raise AssertionError("No thread pool expected")
+
+    monkeypatch.setattr(reductions, "ThreadPoolExecutor", no_threads)
+    assert reductions.reduce(reductions.Moments, [1.0, 2.0, 3.0], max_workers=4).count == 3
+    assert reductions.reduce(reductions.Moments, list(range(10)), chunk_size=3).count == 10
+
+
+def test_quantile_sketch_relative_error(backend):
+    """Test that merged sketch quantiles stay within the relative accuracy."""
+    rng = random.Random(1)
+    values = [rng.lognormvariate(0, 2) * rng.choice((-1, 1)) for _ in range(10_001)]
+    exact = sorted(values)
+
+    sketch = reductions.QuantileSketch(0.01).update(values[:5_000])
+    sketch.merge(reductions.QuantileSketch(0.01).update(values[5_000:]))
+
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        expected = exact[int(q * (len(exact) - 1))]
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.0101)
+    assert (sketch.quantile(0), sketch.quantile(1)) == (exact[0], exact[-1])
+    # Infinite elements are rejected on both paths, leaving the sketch unchanged
+    with pytest.raises(ValueError, match="infinite"):
+        sketch.update([1.0, math.inf])
+    assert sketch.count == len(values)
+    with pytest.raises(ValueError):
+        sketch.merge(reductions.QuantileSketch(0.05))
+
+
+def test_histogram_counts_and_merge(backend):
+    """Test bin counts, out-of-range counts and merging of histograms."""
+    histogram = reductions.Histogram(0.0, 4.0, bins=4).update([-1.0, 0.0, 0.5, 1.0, 3.9, 4.0, 7.0])
+    histogram.merge(reductions.Histogram(0.0, 4.0, bins=4).update([2.5, math.nan]))
+
+    assert histogram.counts == [2, 1, 1, 2]
+    assert (histogram.underflow, histogram.overflow) == (1, 1)
+    with pytest.raises(ValueError):
+        histogram.merge(reductions.Histogram(0.0, 4.0, bins=8))
+
+
+def test_reduction_components_merge_partials():
+    """Test that component results over parts of a series merge into the full result."""
+    values = [float(v) for v in range(1, 101)]
+
+    first = DFXStatisticsComponent(values=values[:30], ddof=1).compute().data
+    total = DFXStatisticsComponent(
+        values=iter([values[30:60], values[60:]]), ddof=1, partials=[first["partial"]]
+    ).compute().data
+    assert total["count"] == 100
+    assert total["result"]["sum"] == 5050.0
+    assert total["result"]["variance"] == pytest.approx(841.6666666666666)
+
+    quantiles = DFXQuantilesComponent(values=values, quantiles=[0.5, 0.9]).compute().data
+    assert quantiles["result"] == pytest.approx([50.0, 90.0], rel=0.02)
+
+    part = DFXHistogramComponent(values=values[:50], bins=4, minimum=0, maximum=100).compute()
+    merged = DFXHistogramComponent(
+        values=values[50:], bins=4, minimum=0, maximum=100, partials=part.data["partial"]
+    ).compute()
+    assert merged.data["result"] == [24, 25, 25, 26]
+
+    mismatched = DFXHistogramComponent(values=values, partials=[first["partial"]]).compute()
+    assert "error" in mismatched.data
+
+
+def test_reduction_component_requires_both_hooks():
+    """Test that a reduction component missing a hook cannot be instantiated."""
+
+    class IncompleteComponent(ReductionComponent):
+        def summarize(self, accumulator):
+            return {"result": accumulator.mean}
+
+    with pytest.raises(TypeError, match="create_accumulator"):
+        IncompleteComponent(values=[1.0])
@@ -0,0 +1,147 @@
+"""Tests for the node.json component registry."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx.math.component.multiply import DFXMultiplyComponent
+from math_executor.registry import ComponentRegistry
+
+NODE_JSON = Path(__file__).parent.parent / "node.json"
+
+
+def test_registry_indexes_and_warms_up_registered_components():
+    """Test that node.json components are indexed with their load timings."""
+    registry = ComponentRegistry(str(NODE_JSON))
+    assert not registry.ready
+    assert registry.get("dfx.math.component.multiply", "DFXMultiplyComponent") is None
+
+    registry.load()
+
+    assert registry.ready
+    assert (
+        registry.get("dfx.math.component.multiply", "DFXMultiplyComponent")
+        is DFXMultiplyComponent
+    )
+    timings = registry.stats()["components"]["Multiply"]["classes"]["DFXMultiplyComponent"]
+    assert {"validate_ms", "warmup_ms"} <= timings.keys()
+
+
+def test_registry_reports_broken_components(tmp_path):
+    """Test that a module that fails to import is reported without blocking readiness."""
+    node_json = tmp_path / "node.json"
+    node_json.write_text(json.dumps({"components": {"Broken": {"path": "missing.module"}}}))
+
+    registry = ComponentRegistry(str(node_json), warmup=False)
+    registry.load()
+
+    assert registry.ready
+    assert "ModuleNotFoundError" in registry.stats()["components"]["Broken"]["error"]
+
+
+COMPONENT_SOURCE = """
+from dfx import Component, Data, Output
+
+
+class ScaleComponent(Component):
+    outputs: list = [Output(display_name="Result", name="result", method="scale")]
+
+    def scale(self) -> Data:
+        return Data(data={{"factor": {factor}}})
+"""
+
+
+def test_registry_reloads_changed_modules(tmp_path, monkeypatch):
+    """Test that an edited module is swapped in while the old class keeps working."""
+    module_file = tmp_path / "hot_scale.py"
+    module_file.write_text(COMPONENT_SOURCE.format(factor=1))
+    node_json = tmp_path / "node.json"
+    node_json.write_text(json.dumps({"components": {"Scale": {"path": "hot_scale"}}}))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "hot_scale", raising=False)
+
+    registry = ComponentRegistry(str(node_json), warmup=False)
+    registry.load()
+    old_class = registry.get("hot_scale", "ScaleComponent")
+    assert registry.reload() == []
+
+    module_file.write_text(COMPONENT_SOURCE.format(factor=2))
+    assert registry.reload(force=True) == ["hot_scale"]
+
+    new_class = registry.get("hot_scale", "ScaleComponent")
+    assert new_class is not old_class
+    assert new_class().scale().data == {"factor": 2}
+    # In-flight requests holding the old class still run the old version
+    assert old_class().scale().data == {"factor": 1}
+    assert registry.stats()["reloads"] == 1
+
+    # A broken edit keeps the previous version registered
+    module_file.write_text("raise RuntimeError('broken')")
+    assert registry.reload(force=True) == []
+    assert registry.get("hot_scale", "ScaleComponent") is new_class
+    assert registry.stats()["reload_errors"] == 1
+
+
+def test_registry_reloads_modules_whose_dependencies_changed(tmp_path, monkeypatch):
+    """Test that editing a shared helper module reloads it and the components using it."""
+    package = tmp_path / "hot_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("FACTOR = 1\n")
+    (package / "scale.py").write_text(
+        "from hot_pkg import helpers\n" + COMPONENT_SOURCE.format(factor="helpers.FACTOR")
+    )
+    node_json = tmp_path / "node.json"
+    node_json.write_text(json.dumps({"components": {"Scale": {"path": "hot_pkg.scale"}}}))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("hot_pkg", "hot_pkg.helpers", "hot_pkg.scale"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    registry = ComponentRegistry(str(node_json), warmup=False)
+    registry.load()
+    old_class = registry.get("hot_pkg.scale", "ScaleComponent")
+
+    (package / "helpers.py").write_text("FACTOR = 2\n")
+    assert registry.reload() == ["hot_pkg.scale"]
+
+    new_class = registry.get("hot_pkg.scale", "ScaleComponent")
+    assert new_class().scale().data == {"factor": 2}
+    assert not registry.is_current("hot_pkg.scale", "ScaleComponent", old_class)
+    assert registry.is_current("hot_pkg.scale", "ScaleComponent", new_class)
+    assert registry.reload() == []
+
+
+@pytest.mark.asyncio
+async def test_results_of_replaced_classes_are_not_memoized(monkeypatch):
+    """Test that a request still running on a class replaced by a reload caches nothing."""
+    from dfx.math.component.add import DFXAddComponent
+    from math_executor import api
+    from math_executor.memo import ResultCache
+
+    cache = ResultCache()
+    monkeypatch.setattr(api, "result_cache", cache)
+    request = api.ExecutionRequest(
+        component_state={
+            "component_class": "DFXAddComponent",
+            "component_module": "dfx.math.component.add",
+            "parameters": {"number1": 1, "number2": 2},
+        },
+        method_name="compute",
+    )
+    key = ("dfx.math.component.add", "DFXAddComponent")
+
+    monkeypatch.setitem(api.component_registry._index, key, type("Reloaded", (), {}))
+    response, _ = await api.run_execution(request, component_class=DFXAddComponent)
+    assert response.success
+    assert cache.stats()["entries"] == 0
+
+    monkeypatch.setitem(api.component_registry._index, key, DFXAddComponent)
+    await api.run_execution(request, component_class=DFXAddComponent)
+    assert cache.stats()["entries"] == 1
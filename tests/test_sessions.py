@@ -0,0 +1,94 @@
+"""Tests for incremental re-execution keyed by component_id."""
+
+import sys
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add root to path for dfx imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dfx import Component, Data
+from math_executor import api
+from math_executor.sessions import Session, SessionCache
+
+
+class RunningSumComponent(Component):
+    """Sums a list of values, updating the previous sum when only ``extra`` changed."""
+
+    name: str = "RunningSum"
+    incremental_methods: ClassVar[dict[str, str]] = {"total": "total_incremental"}
+    full_runs: ClassVar[int] = 0
+
+    def total(self) -> Data:
+        """Sum ``values`` and ``extra``."""
+        RunningSumComponent.full_runs += 1
+        return Data(data={"total": sum(self.values) + self.extra})
+
+    def total_incremental(self, previous: dict, result: Data, changed: set[str]) -> Data:
+        """Adjust the previous total by the change of ``extra``."""
+        if changed != {"extra"}:
+            return self.total()
+        return Data(data={"total": result.data["total"] - previous["extra"] + self.extra})
+
+
+def sum_request(values, extra, message_id):
+    """Build an incremental execution request for RunningSumComponent."""
+    return api.ExecutionRequest(
+        component_state={
+            "component_class": "RunningSumComponent",
+            "component_module": __name__,
+            "component_id": "sum-1",
+            "stream_topic": "droq.test.sum",
+            "parameters": {"values": values, "extra": extra},
+        },
+        method_name="total",
+        message_id=message_id,
+        incremental=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_and_updates_previous_result(monkeypatch):
+    """Test unchanged inputs short-circuit and a single changed input updates incrementally."""
+    sessions = SessionCache(max_sessions=4)
+    monkeypatch.setattr(api, "session_cache", sessions)
+    RunningSumComponent.full_runs = 0
+
+    first, first_payload = await api.run_execution(sum_request([1, 2, 3], 10, "m1"))
+    again, again_payload = await api.run_execution(sum_request([1, 2, 3], 10, "m2"))
+    updated, _ = await api.run_execution(sum_request([1, 2, 3], 4, "m3"))
+
+    assert first.result["data"]["total"] == 16
+    assert first_payload is not None
+    assert again.reused is True
+    assert again_payload is None
+    assert again.result == first.result
+    assert updated.result["data"]["total"] == 10
+    assert RunningSumComponent.full_runs == 1
+    assert sessions.stats()["unchanged"] == 1
+    assert sessions.stats()["incremental"] == 1
+
+
+@pytest.mark.asyncio
+async def test_array_parameters_are_not_session_tracked(monkeypatch):
+    """Test that parameters without a fingerprint (arrays) run fully instead of failing."""
+    np = pytest.importorskip("numpy")
+    sessions = SessionCache(max_sessions=4)
+    monkeypatch.setattr(api, "session_cache", sessions)
+
+    first, _ = await api.run_execution(sum_request(np.arange(4.0), 1, "a1"))
+    again, _ = await api.run_execution(sum_request(np.arange(4.0), 2, "a2"))
+
+    assert first.success and again.success
+    assert again.result["data"]["total"] == 8.0
+    assert again.reused is not True
+    assert sessions.stats()["sessions"] == 0
+
+    session = Session("key", (), {"values": np.arange(3.0)}, None, "Data", None, None)
+    assert session.changed_inputs({"values": np.arange(3.0)}) == set()
+    assert session.changed_inputs({"values": np.arange(4.0)}) == {"values"}
+    assert session.changed_inputs({"values": [np.arange(3.0), 1]}) == {"values"}